@@ -0,0 +1,66 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from koda_validate import (
+    DataclassValidator,
+    ListValidator,
+    PredicateAsync,
+    StringValidator,
+)
+
+
+class NotReserved(PredicateAsync[str]):
+    async def validate_async(self, val: str) -> bool:
+        # stands in for IO, without actually waiting
+        return not val.startswith("admin")
+
+
+@dataclass
+class Tag:
+    name: str
+    weight: int
+
+
+@dataclass
+class Post:
+    author: str
+    title: str
+    tags: List[Tag]
+
+
+post_validator = DataclassValidator(
+    Post, overrides={"author": StringValidator(predicates_async=[NotReserved()])}
+)
+
+post_list_validator = ListValidator(post_validator, max_concurrency=16)
+
+
+async def run_kv(objs: List[Any]) -> None:
+    for obj in objs:
+        await post_validator.validate_async(obj)
+
+
+async def run_kv_gather(objs: List[Any]) -> None:
+    await asyncio.gather(*[post_validator.validate_async(obj) for obj in objs])
+
+
+async def run_kv_list_concurrent(objs: List[Any]) -> None:
+    await post_list_validator.validate_async(objs)
+
+
+# the same validator without the async predicate, for comparison
+sync_post_validator = DataclassValidator(Post)
+
+
+def run_kv_sync(objs: List[Any]) -> None:
+    for obj in objs:
+        sync_post_validator(obj)
+
+
+def get_obj(i: int) -> Dict[str, Any]:
+    return {
+        "author": "admin" if i % 10 == 0 else f"user{i}",
+        "title": f"post {i}",
+        "tags": [{"name": f"tag{j}", "weight": j if i % 7 else str(j)} for j in range(3)],
+    }
@@ -0,0 +1,31 @@
+from typing import Any, List
+
+from pydantic import BaseModel, ValidationError, confloat
+
+from koda_validate import FloatValidator, ListValidator, Max, Min
+
+kv_float_list = ListValidator(FloatValidator(Min(0.0), Max(1.0)))
+
+
+def run_kv(objs: List[Any]) -> None:
+    for obj in objs:
+        _ = kv_float_list(obj)
+
+
+class Readings(BaseModel):
+    val_1: List[confloat(ge=0.0, le=1.0)]  # type: ignore[valid-type]
+
+
+def run_pyd(objs: List[Any]) -> None:
+    for obj in objs:
+        try:
+            _ = Readings(val_1=obj)
+        except ValidationError as e:
+            _ = e
+
+
+def get_obj(i: int) -> Any:
+    readings = [((i + j) % 100) / 100 for j in range(200)]
+    if i % 4 == 0:
+        readings[i % 200] = 1.5
+    return readings
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Union
+
+from koda_validate import DataclassValidator
+from koda_validate.serialization import to_json_schema
+
+
+@dataclass
+class Circle:
+    type: Literal["circle"]
+    radius: float
+
+
+@dataclass
+class Square:
+    type: Literal["square"]
+    side: float
+
+
+@dataclass
+class Layer:
+    name: str
+    opacity: float
+    shapes: List[Union[Circle, Square]]
+    metadata: Dict[str, str]
+    visible: bool = True
+
+
+@dataclass
+class Drawing:
+    title: str
+    tags: List[str]
+    layers: List[Layer]
+
+
+validator = DataclassValidator(Drawing)
+
+
+def run_kv(objs: List[Any]) -> None:
+    for _ in objs:
+        to_json_schema(validator)
@@ -0,0 +1,46 @@
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, ValidationError, conint
+
+from koda_validate import IntValidator, MapValidator, MaxLength, Min, StringValidator
+
+kv_map = MapValidator(key=StringValidator(MaxLength(16)), value=IntValidator(Min(0)))
+kv_map_no_predicates = MapValidator(key=StringValidator(), value=IntValidator())
+
+
+def run_kv(objs: List[Any]) -> None:
+    for obj in objs:
+        kv_map(obj)
+
+
+def run_kv_passthrough(objs: List[Any]) -> None:
+    for obj in objs:
+        kv_map_no_predicates(obj)
+
+
+class Counts(BaseModel):
+    counts: Dict[str, conint(strict=True, ge=0)]  # type: ignore[valid-type]
+
+
+def run_pyd(objs: List[Any]) -> None:
+    for obj in objs:
+        try:
+            Counts(counts=obj)
+        except ValidationError:
+            pass
+
+
+def get_obj(i: int) -> Dict[str, Any]:
+    counts: Dict[str, Any] = {f"key_{j}": j for j in range(500)}
+    if i % 4 == 0:
+        counts[f"key_{i % 500}"] = -1
+    return counts
+
+
+def get_valid_obj(i: int) -> Dict[str, Any]:
+    return {f"key_{j}": j for j in range(500)}
+
+
+def get_invalid_obj(i: int) -> Dict[str, Any]:
+    # every value is invalid
+    return {f"key_{j}": -j - 1 for j in range(500)}
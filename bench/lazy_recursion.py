@@ -0,0 +1,51 @@
+from typing import Any, Dict, List, Optional
+
+from koda_validate import (
+    DictValidatorAny,
+    IntValidator,
+    KeyNotRequired,
+    Lazy,
+    StringValidator,
+)
+
+
+def node_validator() -> DictValidatorAny:
+    return validator
+
+
+validator = DictValidatorAny(
+    {
+        "id": IntValidator(),
+        "label": StringValidator(),
+        "child": KeyNotRequired(Lazy(node_validator)),
+    }
+)
+
+
+def run_kv(objs: List[Any]) -> None:
+    for obj in objs:
+        validator(obj)
+
+
+def run_kv_is_valid(objs: List[Any]) -> None:
+    for obj in objs:
+        validator.is_valid(obj)
+
+
+def get_obj(i: int) -> Dict[str, Any]:
+    # chains of 40-60 nodes, every 10th invalid at the bottom
+    node: Optional[Dict[str, Any]] = None
+    depth = 40 + i % 20
+    for j in range(depth):
+        id_: Any = str(j) if i % 10 == 0 and j == 0 else j
+        node = {"id": id_, "label": f"node {j}", **({"child": node} if node else {})}
+    assert node is not None
+    return node
+
+
+def get_valid_obj(i: int) -> Dict[str, Any]:
+    return get_obj(i * 10 + 1)
+
+
+def get_invalid_obj(i: int) -> Dict[str, Any]:
+    return get_obj(i * 10)
@@ -0,0 +1,93 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, List
+from uuid import UUID
+
+from koda_validate import (
+    BoolValidator,
+    BytesValidator,
+    DateValidator,
+    DecimalValidator,
+    DictValidatorAny,
+    DiscriminatedUnionValidator,
+    EqualsValidator,
+    FloatValidator,
+    IntValidator,
+    NoneValidator,
+    StringValidator,
+    UnionValidator,
+    UUIDValidator,
+)
+
+scalar_union = UnionValidator.untyped(
+    EqualsValidator("a"),
+    EqualsValidator("b"),
+    EqualsValidator(0),
+    BoolValidator(),
+    BytesValidator(),
+    DateValidator(),
+    DecimalValidator(),
+    FloatValidator(),
+    UUIDValidator(),
+    NoneValidator(),
+    IntValidator(),
+    StringValidator(),
+)
+
+scalars: List[Any] = [
+    "x",
+    1,
+    None,
+    True,
+    1.5,
+    b"x",
+    date(2020, 1, 1),
+    Decimal("1.5"),
+    UUID(int=1),
+    [],
+]
+
+variant_names = [f"kind_{i}" for i in range(16)]
+
+
+def _record(name: str) -> DictValidatorAny:
+    return DictValidatorAny(
+        {
+            "kind": EqualsValidator(name),
+            "value": IntValidator(),
+            "label": StringValidator(),
+        }
+    )
+
+
+record_union = UnionValidator.untyped(*[_record(name) for name in variant_names])
+discriminated_union = DiscriminatedUnionValidator(
+    "kind", {name: _record(name) for name in variant_names}
+)
+
+
+def run_kv_scalars(objs: List[Any]) -> None:
+    for obj in objs:
+        scalar_union(obj)
+
+
+def run_kv_records(objs: List[Any]) -> None:
+    for obj in objs:
+        record_union(obj)
+
+
+def run_kv_discriminated(objs: List[Any]) -> None:
+    for obj in objs:
+        discriminated_union(obj)
+
+
+def get_scalar(i: int) -> Any:
+    return scalars[i % len(scalars)]
+
+
+def get_record(i: int) -> Dict[str, Any]:
+    return {
+        "kind": variant_names[i % len(variant_names)],
+        "value": i if i % 9 else str(i),
+        "label": f"label {i}",
+    }
@@ -10,6 +10,7 @@ from koda_validate import (
     ListValidator,
     RecordValidator,
     StringValidator,
+    compile_validator,
 )
 from koda_validate.dataclasses import DataclassValidator
 from koda_validate.namedtuple import NamedTupleValidator
@@ -83,6 +84,9 @@ k_dataclass_validator = DataclassValidator(Person)
 k_namedtuple_validator = NamedTupleValidator(PersonNT)
 k_typeddict_validator = TypedDictValidator(PersonTD)
 
+k_dataclass_validator_compiled = compile_validator(DataclassValidator(Person))
+k_typeddict_validator_compiled = compile_validator(TypedDictValidator(PersonTD))
+
 k_dict_any_validator = DictValidatorAny(
     {
         "name": StringValidator(),
@@ -154,6 +158,14 @@ def get_data(i: int) -> Dict[str, Any]:
         }
 
 
+def get_valid_data(i: int) -> Dict[str, Any]:
+    return get_data(i * 3)
+
+
+def get_invalid_data(i: int) -> Dict[str, Any]:
+    return get_data(i * 3 + 1 + i % 2)
+
+
 def run_kv(objs: List[Any]) -> None:
     for obj in objs:
         _ = k_validator(obj)
@@ -164,6 +176,16 @@ def run_kv_dc(objs: List[Any]) -> None:
         _ = k_dataclass_validator(obj)
 
 
+def run_kv_dc_is_valid(objs: List[Any]) -> None:
+    for obj in objs:
+        _ = k_dataclass_validator.is_valid(obj)
+
+
+def run_kv_dc_compiled(objs: List[Any]) -> None:
+    for obj in objs:
+        _ = k_dataclass_validator_compiled(obj)
+
+
 def run_kv_dict_any(objs: List[Any]) -> None:
     for obj in objs:
         _ = k_dict_any_validator(obj)
@@ -179,6 +201,11 @@ def run_kv_td(objs: List[Any]) -> None:
         _ = k_typeddict_validator(obj)
 
 
+def run_kv_td_compiled(objs: List[Any]) -> None:
+    for obj in objs:
+        _ = k_typeddict_validator_compiled(obj)
+
+
 def run_pyd(objs: List[Any]) -> None:
     for obj in objs:
         try:
@@ -1,24 +1,133 @@
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import sys
+import tracemalloc
 from argparse import ArgumentParser
 from dataclasses import dataclass
 from time import perf_counter
-from typing import Callable, Dict, Generic, List
+from typing import Any, Callable, ClassVar, Dict, Generic, List, Optional, Tuple, Union
 
 from bench import (
+    async_validation,
+    float_list,
+    json_schema,
+    large_map,
+    lazy_recursion,
     list_none,
+    many_variants,
     min_max,
     nested_object_list,
     one_key_invalid_types,
+    serializable_errs,
+    signature,
     string_valid,
     two_keys_invalid_types,
     two_keys_valid,
 )
+from koda_validate import Validator
 from koda_validate._generics import A
 
 
 @dataclass
 class BenchCompare(Generic[A]):
     gen: Callable[[int], A]
-    comparisons: Dict[str, Callable[[List[A]], None]]
+    # functions may be `async`
+    comparisons: Dict[str, Callable[[List[A]], Any]]
+    # the fraction of `--chunk-size` to use, for scenarios with expensive values
+    size: float = 1.0
+
+    def chunk_size(self, chunk_size: int) -> int:
+        return max(1, round(chunk_size * self.size))
+
+
+@dataclass
+class Timing:
+    """
+    Times (in seconds) taken to validate each chunk of ``chunk_size`` values
+    """
+
+    samples: List[float]
+    chunk_size: int
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        if len(self.samples) < 2:
+            return self.samples[0]
+        return statistics.quantiles(self.samples, n=20, method="inclusive")[18]
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.chunk_size / self.median
+
+    @property
+    def median_per_op(self) -> float:
+        return self.median / self.chunk_size
+
+    # the values compared to a baseline
+    COMPARED: ClassVar[Tuple[str, ...]] = ("median_secs_per_op",)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "chunk_size": self.chunk_size,
+            "samples": len(self.samples),
+            "median_secs": self.median,
+            "p95_secs": self.p95,
+            "ops_per_sec": self.ops_per_sec,
+            "median_secs_per_op": self.median_per_op,
+        }
+
+
+@dataclass
+class MemoryCompare:
+    validators: Dict[str, Validator[Any]]
+    gen_valid: Callable[[int], Any]
+    gen_invalid: Callable[[int], Any]
+    # the fraction of `--chunk-size` to use, for scenarios with large values
+    size: float = 1.0
+
+    def chunk_size(self, chunk_size: int) -> int:
+        return max(1, round(chunk_size * self.size))
+
+
+@dataclass
+class Memory:
+    """
+    Memory traced while validating each chunk of ``chunk_size`` values, with every
+    result kept until the chunk is done
+    """
+
+    chunk_size: int
+    # memory blocks allocated, and not freed, while validating
+    blocks: List[int]
+    # the most memory allocated at once while validating
+    peak_bytes: List[int]
+    # memory still allocated once the chunk is validated, i.e. held by the results
+    retained_bytes: List[int]
+
+    def per_value(self, samples: List[int]) -> float:
+        return statistics.median(samples) / self.chunk_size
+
+    COMPARED: ClassVar[Tuple[str, ...]] = (
+        "retained_bytes_per_value",
+        "peak_bytes_per_value",
+    )
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "chunk_size": self.chunk_size,
+            "samples": len(self.blocks),
+            "blocks_per_value": self.per_value(self.blocks),
+            "peak_bytes_per_value": self.per_value(self.peak_bytes),
+            "retained_bytes_per_value": self.per_value(self.retained_bytes),
+            "max_peak_bytes": max(self.peak_bytes),
+        }
 
 
 KODA_VALIDATE = "KODA VALIDATE"
@@ -27,6 +136,17 @@ KV_DATACLASS_VALIDATOR = f"{KODA_VALIDATE} - DataclassValidator"
 KV_NAMEDTUPLE_VALIDATOR = f"{KODA_VALIDATE} - NamedTupleValidator"
 KV_DICT_VALIDATOR_ANY = f"{KODA_VALIDATE} - DictValidatorAny"
 KV_TYPED_DICT_VALIDATOR = f"{KODA_VALIDATE} - TypedDictValidator"
+KV_COMPILED = "(compiled)"
+KV_VALIDATE_MANY = "(validate_many)"
+KV_IS_VALID = "(is_valid)"
+KV_ASYNC = "(validate_async)"
+KV_GATHER = "(asyncio.gather)"
+KV_CONCURRENT = "(max_concurrency)"
+KV_PASSTHROUGH = "(no predicates)"
+KV_LIST_VALIDATOR = f"{KODA_VALIDATE} - ListValidator"
+KV_MAP_VALIDATOR = f"{KODA_VALIDATE} - MapValidator"
+KV_UNION_VALIDATOR = f"{KODA_VALIDATE} - UnionValidator"
+KV_DISCRIMINATED_UNION_VALIDATOR = f"{KODA_VALIDATE} - DiscriminatedUnionValidator"
 
 
 PYDANTIC = "PYDANTIC"
@@ -44,6 +164,7 @@ benches = {
         lambda i: {"val_1": i, "val_2": str(i)},
         {
             KODA_VALIDATE: two_keys_invalid_types.run_kv,
+            f"{KODA_VALIDATE} {KV_IS_VALID}": two_keys_invalid_types.run_kv_is_valid,
             PYDANTIC: two_keys_invalid_types.run_pyd,
             VOLUPTUOUS: two_keys_invalid_types.run_v,
         },
@@ -52,6 +173,9 @@ benches = {
         lambda i: {"val_1": str(i), "val_2": i},
         {
             KODA_VALIDATE: two_keys_valid.run_kv,
+            f"{KODA_VALIDATE} {KV_VALIDATE_MANY}": two_keys_valid.run_kv_many,
+            f"{KODA_VALIDATE} {KV_IS_VALID}": two_keys_valid.run_kv_is_valid,
+            f"{KODA_VALIDATE} {KV_COMPILED}": two_keys_valid.run_kv_compiled,
             PYDANTIC: two_keys_valid.run_pyd,
             VOLUPTUOUS: two_keys_valid.run_v,
         },
@@ -63,6 +187,10 @@ benches = {
     "list_none": BenchCompare(
         list_none.get_obj, {KODA_VALIDATE: list_none.run_kv, PYDANTIC: list_none.run_pyd}
     ),
+    "float_list": BenchCompare(
+        float_list.get_obj,
+        {KODA_VALIDATE: float_list.run_kv, PYDANTIC: float_list.run_pyd},
+    ),
     "min_max_all_valid": BenchCompare(
         min_max.gen_valid,
         {
@@ -86,28 +214,236 @@ benches = {
         {
             KV_RECORD_VALIDATOR: nested_object_list.run_kv,
             KV_DATACLASS_VALIDATOR: nested_object_list.run_kv_dc,
+            f"{KV_DATACLASS_VALIDATOR} {KV_COMPILED}": (
+                nested_object_list.run_kv_dc_compiled
+            ),
+            f"{KV_DATACLASS_VALIDATOR} {KV_IS_VALID}": (
+                nested_object_list.run_kv_dc_is_valid
+            ),
             KV_DICT_VALIDATOR_ANY: nested_object_list.run_kv_dict_any,
             KV_NAMEDTUPLE_VALIDATOR: nested_object_list.run_kv_nt,
             KV_TYPED_DICT_VALIDATOR: nested_object_list.run_kv_td,
+            f"{KV_TYPED_DICT_VALIDATOR} {KV_COMPILED}": (
+                nested_object_list.run_kv_td_compiled
+            ),
             PYDANTIC: nested_object_list.run_pyd,
         },
     ),
+    "async_validation": BenchCompare(
+        async_validation.get_obj,
+        {
+            KV_DATACLASS_VALIDATOR: async_validation.run_kv_sync,
+            f"{KV_DATACLASS_VALIDATOR} {KV_ASYNC}": async_validation.run_kv,
+            f"{KV_DATACLASS_VALIDATOR} {KV_GATHER}": async_validation.run_kv_gather,
+            f"{KV_LIST_VALIDATOR} {KV_CONCURRENT}": (
+                async_validation.run_kv_list_concurrent
+            ),
+        },
+    ),
+    "validate_signature": BenchCompare(
+        signature.get_args,
+        {
+            KODA_VALIDATE: signature.run_kv,
+            f"{KODA_VALIDATE} (scalar args)": signature.run_kv_scalars,
+        },
+    ),
+    "to_serializable_errs": BenchCompare(
+        serializable_errs.get_invalid, {KODA_VALIDATE: serializable_errs.run_kv}
+    ),
+    "to_serializable_errs_map": BenchCompare(
+        serializable_errs.get_invalid_map, {KODA_VALIDATE: serializable_errs.run_kv}
+    ),
+    "to_json_schema": BenchCompare(
+        lambda i: i, {KODA_VALIDATE: json_schema.run_kv}, size=0.1
+    ),
+    "lazy_recursion": BenchCompare(
+        lazy_recursion.get_obj,
+        {
+            KV_DICT_VALIDATOR_ANY: lazy_recursion.run_kv,
+            f"{KV_DICT_VALIDATOR_ANY} {KV_IS_VALID}": lazy_recursion.run_kv_is_valid,
+        },
+        size=0.2,
+    ),
+    "large_map": BenchCompare(
+        large_map.get_obj,
+        {
+            KV_MAP_VALIDATOR: large_map.run_kv,
+            f"{KV_MAP_VALIDATOR} {KV_PASSTHROUGH}": large_map.run_kv_passthrough,
+            PYDANTIC: large_map.run_pyd,
+        },
+        size=0.1,
+    ),
+    "many_variants_scalars": BenchCompare(
+        many_variants.get_scalar,
+        {KV_UNION_VALIDATOR: many_variants.run_kv_scalars},
+    ),
+    "many_variants_records": BenchCompare(
+        many_variants.get_record,
+        {
+            KV_UNION_VALIDATOR: many_variants.run_kv_records,
+            KV_DISCRIMINATED_UNION_VALIDATOR: many_variants.run_kv_discriminated,
+        },
+    ),
+}
+
+# scenarios for `--memory`
+memory_benches = {
+    "min_max": MemoryCompare(
+        {
+            KV_RECORD_VALIDATOR: min_max.simple_str_validator,
+            KV_DICT_VALIDATOR_ANY: min_max.simple_str_validator_dict_any,
+        },
+        min_max.gen_valid,
+        min_max.gen_invalid,
+    ),
+    "nested_object_list": MemoryCompare(
+        {
+            KV_RECORD_VALIDATOR: nested_object_list.k_validator,
+            KV_DATACLASS_VALIDATOR: nested_object_list.k_dataclass_validator,
+            KV_DICT_VALIDATOR_ANY: nested_object_list.k_dict_any_validator,
+            KV_NAMEDTUPLE_VALIDATOR: nested_object_list.k_namedtuple_validator,
+            KV_TYPED_DICT_VALIDATOR: nested_object_list.k_typeddict_validator,
+        },
+        nested_object_list.get_valid_data,
+        nested_object_list.get_invalid_data,
+    ),
+    "lazy_recursion": MemoryCompare(
+        {KV_DICT_VALIDATOR_ANY: lazy_recursion.validator},
+        lazy_recursion.get_valid_obj,
+        lazy_recursion.get_invalid_obj,
+        size=0.2,
+    ),
+    "large_map": MemoryCompare(
+        {KV_MAP_VALIDATOR: large_map.kv_map},
+        large_map.get_valid_obj,
+        large_map.get_invalid_obj,
+        size=0.1,
+    ),
 }
 
 
+def _sync(fn: Callable[[List[A]], Any]) -> Callable[[List[A]], None]:
+    """
+    Run ``async`` functions in an event loop that is reused for every chunk, so
+    starting the loop isn't part of the measured time
+    """
+    if not inspect.iscoroutinefunction(fn):
+        return fn
+
+    loop = asyncio.new_event_loop()
+
+    def run(objs: List[A]) -> None:
+        loop.run_until_complete(fn(objs))
+
+    return run
+
+
 def run_bench(
-    chunks: int, chunk_size: int, gen: Callable[[int], A], fn: Callable[[List[A]], None]
-) -> None:
-    total_time: float = 0.0
-    for i in range(chunks):
-        # generate in chunks so generation isn't included in the
-        # measured time
-        objs = [gen((i * chunk_size) + j + 1) for j in range(chunk_size)]
-        start = perf_counter()
-        fn(objs)
-        total_time += perf_counter() - start
+    chunks: int,
+    chunk_size: int,
+    gen: Callable[[int], A],
+    fn: Callable[[List[A]], None],
+    repeat: int = 1,
+    warmup: int = 0,
+) -> Timing:
+    # warm up caches (and lazily built state, like `Lazy` validators) before timing
+    for _ in range(warmup):
+        fn([gen(j + 1) for j in range(chunk_size)])
+
+    samples: List[float] = []
+    for _ in range(repeat):
+        for i in range(chunks):
+            # generate in chunks so generation isn't included in the
+            # measured time
+            objs = [gen((i * chunk_size) + j + 1) for j in range(chunk_size)]
+            start = perf_counter()
+            fn(objs)
+            samples.append(perf_counter() - start)
 
-    print(f"Execution time: {total_time:.4f} secs\n")
+    timing = Timing(samples, chunk_size)
+    print(
+        f"Median: {timing.median * 1000:.3f} ms, p95: {timing.p95 * 1000:.3f} ms "
+        f"per {chunk_size} ({timing.ops_per_sec:,.0f} ops/sec)\n"
+    )
+    return timing
+
+
+def _format(key: str, val: float) -> str:
+    if key.endswith("_secs_per_op"):
+        return f"{val * 1e6:.3f} us"
+    else:
+        return f"{val:.1f} B"
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Union[Timing, Memory]]],
+    baseline: Dict[str, Any],
+    threshold: float,
+) -> List[str]:
+    """
+    Print how the median time (or memory use) per value compares to ``baseline`` (as
+    written by ``--json``), for each subject in both.
+
+    :return: the subjects which are worse than the baseline by more than ``threshold``
+    """
+    regressions: List[str] = []
+    print(f"----- BASELINE COMPARISON (threshold: {threshold:.0%}) -----\n")
+    for name, subjects in results.items():
+        for subject_name, result in subjects.items():
+            base = baseline.get("results", {}).get(name, {}).get(subject_name)
+            if base is None:
+                continue
+            print(f"{name}: {subject_name}")
+            current = result.to_json()
+            for key in result.COMPARED:
+                if key not in base:
+                    continue
+                # avoid dividing by zero for values which retain nothing
+                change = (current[key] + 1e-12) / (base[key] + 1e-12) - 1
+                flag = ""
+                if change > threshold:
+                    flag = "  REGRESSION"
+                    regressions.append(f"{name}: {subject_name} ({key})")
+                print(
+                    f"  {key}: {_format(key, base[key])} -> "
+                    f"{_format(key, current[key])} ({change:+.1%}){flag}"
+                )
+    print()
+    return regressions
+
+
+def _traced_blocks() -> int:
+    return sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+
+
+def run_bench_memory(
+    chunks: int, chunk_size: int, gen: Callable[[int], A], validator: Validator[Any]
+) -> Memory:
+    memory = Memory(chunk_size, [], [], [])
+    tracemalloc.start()
+    try:
+        for i in range(chunks):
+            objs = [gen((i * chunk_size) + j + 1) for j in range(chunk_size)]
+            # only count memory allocated during validation
+            start_blocks = _traced_blocks()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            results = [validator(obj) for obj in objs]
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            memory.blocks.append(_traced_blocks() - start_blocks)
+            memory.peak_bytes.append(peak_bytes - start_bytes)
+            memory.retained_bytes.append(current_bytes - start_bytes)
+            del results
+    finally:
+        tracemalloc.stop()
+
+    print(
+        f"Per value: {memory.per_value(memory.blocks):.1f} blocks, "
+        f"{memory.per_value(memory.peak_bytes):.0f} bytes peak, "
+        f"{memory.per_value(memory.retained_bytes):.0f} bytes retained "
+        f"(max peak: {max(memory.peak_bytes) / 1024:.1f} KiB per {chunk_size})\n"
+    )
+    return memory
 
 
 if __name__ == "__main__":
@@ -128,16 +464,129 @@ if __name__ == "__main__":
         type=int,
         default=1_000,
     )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="how many times to run each scenario's iterations",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=2,
+        help="chunks to validate (untimed) before timing each subject",
+    )
+    parser.add_argument(
+        "--koda-only",
+        action="store_true",
+        help="skip the other libraries' subjects",
+    )
+    parser.add_argument(
+        "--json",
+        type=str,
+        metavar="PATH",
+        help="write timings to a JSON file, which can be used as a --baseline",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        metavar="PATH",
+        help="compare timings to a JSON file written by --json, and exit with status "
+        "1 if any subject is slower by more than --threshold",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the fraction slower than the baseline that counts as a regression",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="run the memory scenarios, reporting memory allocated (and retained by "
+        "results) while validating valid and invalid values, instead of time",
+    )
 
     args = parser.parse_args()
 
+    baseline: Optional[Dict[str, Any]] = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
     print(f"{args.iterations} ITERATIONS of {args.chunk_size}")
 
-    for name, compare_bench in benches.items():
-        if args.tests == [] or name in args.tests:
-            print(f"----- BEGIN {name} -----\n")
-            for subject_name, test in compare_bench.comparisons.items():
-                print(subject_name)
-                run_bench(args.iterations, args.chunk_size, compare_bench.gen, test)
+    results: Dict[str, Dict[str, Union[Timing, Memory]]] = {}
+    if args.memory:
+        for name, memory_bench in memory_benches.items():
+            if args.tests == [] or name in args.tests:
+                print(f"----- BEGIN {name} (memory) -----\n")
+                chunk_size = memory_bench.chunk_size(args.chunk_size)
+                for subject_name, validator in memory_bench.validators.items():
+                    for kind, gen in [
+                        ("valid", memory_bench.gen_valid),
+                        ("invalid", memory_bench.gen_invalid),
+                    ]:
+                        print(f"{subject_name} [{kind}]")
+                        results.setdefault(name, {})[
+                            f"{subject_name} [{kind}]"
+                        ] = run_bench_memory(args.iterations, chunk_size, gen, validator)
+
+                print(f"----- END {name} (memory) -----\n")
+    else:
+        for name, compare_bench in benches.items():
+            if args.tests == [] or name in args.tests:
+                print(f"----- BEGIN {name} -----\n")
+                chunk_size = compare_bench.chunk_size(args.chunk_size)
+                for subject_name, test in compare_bench.comparisons.items():
+                    if args.koda_only and not subject_name.startswith(KODA_VALIDATE):
+                        continue
+                    print(subject_name)
+                    results.setdefault(name, {})[subject_name] = run_bench(
+                        args.iterations,
+                        chunk_size,
+                        compare_bench.gen,
+                        _sync(test),
+                        repeat=args.repeat,
+                        warmup=args.warmup,
+                    )
+
+                print(f"----- END {name} -----\n")
+
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "platform": platform.platform(),
+                    "iterations": args.iterations,
+                    "repeat": args.repeat,
+                    "memory": args.memory,
+                    "results": {
+                        name: {
+                            subject_name: result.to_json()
+                            for subject_name, result in subjects.items()
+                        }
+                        for name, subjects in results.items()
+                    },
+                },
+                f,
+                indent=2,
+            )
+
+    if args.memory and sys.platform != "win32":
+        # `resource` is only available on Unix
+        import resource
+
+        # `ru_maxrss` is in bytes on macOS, and kilobytes on Linux (and other Unixes)
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != "darwin":
+            max_rss *= 1024
+        print(f"Peak RSS (whole process): {max_rss / 1024 / 1024:.1f} MiB\n")
 
-            print(f"----- END {name} -----\n")
+    if baseline is not None:
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print("REGRESSIONS:\n" + "\n".join(regressions))
+            sys.exit(1)
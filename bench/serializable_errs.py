@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from typing import List
+
+from koda_validate import (
+    DataclassValidator,
+    IntValidator,
+    Invalid,
+    ListValidator,
+    MapValidator,
+    MaxLength,
+    Min,
+    StringValidator,
+)
+from koda_validate.serialization import to_serializable_errs
+
+
+@dataclass
+class Item:
+    sku: str
+    quantity: int
+
+
+@dataclass
+class Order:
+    id: int
+    customer: str
+    items: List[Item]
+
+
+validator = DataclassValidator(
+    Order,
+    overrides={
+        "customer": StringValidator(MaxLength(8)),
+        "items": ListValidator(
+            DataclassValidator(Item, overrides={"quantity": IntValidator(Min(1))})
+        ),
+    },
+)
+
+map_validator = MapValidator(key=StringValidator(MaxLength(4)), value=IntValidator())
+
+
+def run_kv(objs: List[Invalid]) -> None:
+    for invalid in objs:
+        to_serializable_errs(invalid)
+
+
+def get_invalid(i: int) -> Invalid:
+    # validation happens here, so only the conversion of errors is timed
+    result = validator(
+        {
+            "id": i if i % 2 else str(i),
+            "customer": f"customer number {i}",
+            "items": [
+                {"sku": f"sku{j}", "quantity": 0 if j % 2 else str(j)} for j in range(10)
+            ],
+        }
+    )
+    assert isinstance(result, Invalid)
+    return result
+
+
+def get_invalid_map(i: int) -> Invalid:
+    result = map_validator({f"key{j}": str(j) for j in range(10 + i % 5)})
+    assert isinstance(result, Invalid)
+    return result
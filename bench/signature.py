@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+from koda_validate.signature import InvalidArgsError, validate_signature
+
+
+@dataclass
+class Address:
+    street: str
+    zip_code: str
+
+
+@validate_signature
+def create_user(
+    name: str, age: int, tags: List[str], address: Address, nickname: Optional[str] = None
+) -> str:
+    return name
+
+
+@validate_signature(ignore_return=True)
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def run_kv(objs: List[Tuple[Any, ...]]) -> None:
+    for args in objs:
+        try:
+            create_user(*args)
+        except InvalidArgsError:
+            pass
+
+
+def run_kv_scalars(objs: List[Tuple[Any, ...]]) -> None:
+    for args in objs:
+        try:
+            add(args[1], len(args[2]))
+        except InvalidArgsError:
+            pass
+
+
+def get_args(i: int) -> Tuple[Any, ...]:
+    return (
+        f"user{i}",
+        i if i % 5 else str(i),
+        [f"tag{j}" for j in range(i % 4)],
+        Address(f"{i} Main St", "12345"),
+    )
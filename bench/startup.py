@@ -0,0 +1,207 @@
+"""
+How long it takes to import (and start using) koda_validate, as measured by
+``python -X importtime``. Each scenario runs in a fresh interpreter.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
+
+scenarios: Dict[str, str] = {
+    "import": "import koda_validate",
+    "int_validator": "from koda_validate import IntValidator",
+    "list_validator": (
+        "from koda_validate import IntValidator, ListValidator\n"
+        "ListValidator(IntValidator())"
+    ),
+    "dataclass_validator": (
+        "from dataclasses import dataclass\n"
+        "from koda_validate import DataclassValidator\n"
+        "@dataclass\n"
+        "class Person:\n"
+        "    name: str\n"
+        "DataclassValidator(Person)"
+    ),
+    "star_import": "from koda_validate import *",
+}
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """
+    :return: the time (in microseconds) spent importing each module -- excluding the
+        modules it imports -- while running ``code`` in a new interpreter
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        # e.g. "import time:       259 |        259 |         types"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line.split(":", 1)[1].split("|")
+        times[module.strip()] = int(self_us)
+    return times
+
+
+@dataclass
+class Startup:
+    """
+    Time (in microseconds) spent importing modules for a scenario, not counting the
+    modules every interpreter imports on startup
+    """
+
+    samples: List[int]
+    modules: List[str]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def koda_validate_modules(self) -> int:
+        return sum(module.startswith("koda_validate") for module in self.modules)
+
+    # the values compared to a baseline
+    COMPARED: ClassVar[Tuple[str, ...]] = ("median_us",)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "samples": len(self.samples),
+            "median_us": self.median,
+            "min_us": min(self.samples),
+            "modules": len(self.modules),
+            "koda_validate_modules": self.koda_validate_modules,
+        }
+
+
+def run_startup(code: str, repeat: int, skip: Set[str]) -> Startup:
+    # the first run may need to write `.pyc` files
+    _import_times(code)
+
+    startup = Startup([], [])
+    for _ in range(repeat):
+        times = {
+            module: us for module, us in _import_times(code).items() if module not in skip
+        }
+        startup.samples.append(sum(times.values()))
+        startup.modules = sorted(times)
+
+    print(
+        f"Median: {startup.median / 1000:.2f} ms, min: {min(startup.samples) / 1000:.2f}"
+        f" ms ({len(startup.modules)} modules, {startup.koda_validate_modules} from "
+        "koda_validate)\n"
+    )
+    return startup
+
+
+def compare_to_baseline(
+    results: Dict[str, Startup], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """
+    Print how the median import time compares to ``baseline`` (as written by
+    ``--json``), for each scenario in both.
+
+    :return: the scenarios which are slower than the baseline by more than
+        ``threshold``
+    """
+    regressions: List[str] = []
+    print(f"----- BASELINE COMPARISON (threshold: {threshold:.0%}) -----\n")
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        current = result.to_json()
+        for key in result.COMPARED:
+            change = current[key] / base[key] - 1
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{name} ({key})")
+            print(
+                f"{name}: {base[key] / 1000:.2f} ms -> {current[key] / 1000:.2f} ms "
+                f"({change:+.1%}){flag}"
+            )
+    print()
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "tests",
+        type=str,
+        nargs="*",
+        help="which scenarios to run",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=15,
+        help="how many interpreters to start for each scenario",
+    )
+    parser.add_argument(
+        "--json",
+        type=str,
+        metavar="PATH",
+        help="write timings to a JSON file, which can be used as a --baseline",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        metavar="PATH",
+        help="compare timings to a JSON file written by --json, and exit with status "
+        "1 if any scenario is slower by more than --threshold",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="the fraction slower than the baseline that counts as a regression",
+    )
+
+    args = parser.parse_args()
+
+    baseline: Optional[Dict[str, Any]] = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    # modules imported before any code runs aren't part of any scenario
+    skip = set(_import_times("pass"))
+
+    results: Dict[str, Startup] = {}
+    for name, code in scenarios.items():
+        if args.tests == [] or name in args.tests:
+            print(name)
+            results[name] = run_startup(code, args.repeat, skip)
+
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "platform": platform.platform(),
+                    "repeat": args.repeat,
+                    "results": {
+                        name: result.to_json() for name, result in results.items()
+                    },
+                },
+                f,
+                indent=2,
+            )
+
+    if baseline is not None:
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print("REGRESSIONS:\n" + "\n".join(regressions))
+            sys.exit(1)
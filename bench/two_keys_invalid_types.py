@@ -23,6 +23,11 @@ def run_kv(objs: List[Any]) -> None:
         string_validator(obj)
 
 
+def run_kv_is_valid(objs: List[Any]) -> None:
+    for obj in objs:
+        string_validator.is_valid(obj)
+
+
 class BasicString(BaseModel):
     val_1: str
     val_2: int
@@ -4,7 +4,12 @@ from typing import Any, List
 from pydantic import BaseModel
 from voluptuous import Schema
 
-from koda_validate import IntValidator, RecordValidator, StringValidator
+from koda_validate import (
+    IntValidator,
+    RecordValidator,
+    StringValidator,
+    compile_validator,
+)
 
 
 @dataclass
@@ -18,11 +23,32 @@ string_validator = RecordValidator(
 )
 
 
+compiled_string_validator = compile_validator(
+    RecordValidator(
+        into=SimpleStr, keys=(("val_1", StringValidator()), ("val_2", IntValidator()))
+    )
+)
+
+
 def run_kv(objs: List[Any]) -> None:
     for obj in objs:
         string_validator(obj)
 
 
+def run_kv_is_valid(objs: List[Any]) -> None:
+    for obj in objs:
+        string_validator.is_valid(obj)
+
+
+def run_kv_many(objs: List[Any]) -> None:
+    string_validator.validate_many(objs)
+
+
+def run_kv_compiled(objs: List[Any]) -> None:
+    for obj in objs:
+        compiled_string_validator(obj)
+
+
 class BasicString(BaseModel):
     val_1: str
     val_2: int
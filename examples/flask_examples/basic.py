@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Annotated, Optional, Tuple
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask.typing import ResponseValue
 
 from koda_validate import *
+from koda_validate.metrics import InstrumentedValidator, to_prometheus_text
 from koda_validate.serialization import to_serializable_errs
 
 app = Flask(__name__)
@@ -19,9 +20,13 @@ class ContactForm:
     subject: Optional[str] = None
 
 
+# records validation counts, latencies and failing keys under "ContactForm"
+contact_form_validator = InstrumentedValidator(DataclassValidator(ContactForm))
+
+
 @app.route("/contact", methods=["POST"])
 def contact_api() -> Tuple[ResponseValue, int]:
-    result = DataclassValidator(ContactForm)(request.json)
+    result = contact_form_validator(request.json)
     match result:
         case Valid(contact_form):
             print(contact_form)  # do something with the valid data
@@ -30,5 +35,10 @@ def contact_api() -> Tuple[ResponseValue, int]:
             return jsonify(to_serializable_errs(inv)), 400
 
 
+@app.route("/metrics")
+def metrics() -> Response:
+    return Response(to_prometheus_text(), content_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     app.run()
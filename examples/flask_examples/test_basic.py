@@ -46,3 +46,13 @@ def test_request_example_successful() -> None:
         )
         assert response.status_code == 200
         assert response.json == {"success": True}
+
+
+def test_metrics() -> None:
+    client = app.test_client()
+    client.post("/contact", data=json.dumps({}), content_type="application/json")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    text = response.get_data(as_text=True)
+    assert 'koda_validate_validations_total{schema="ContactForm"}' in text
+    assert 'koda_validate_failures_total{schema="ContactForm",path="$.email"}' in text
@@ -1,12 +1,12 @@
-import importlib.metadata
-
-__version__ = importlib.metadata.version("koda_validate")
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __all__ = (
     # base.py
     "Validator",
     "Predicate",
     "PredicateAsync",
+    "BatchPredicateAsync",
     "Processor",
     # boolean.py
     "BoolValidator",
@@ -15,6 +15,11 @@ __all__ = (
     "Coercer",
     "coercer",
     "BytesValidator",
+    # cache.py
+    "LRUCacheValidator",
+    "TTLCacheValidator",
+    # compiler.py
+    "compile_validator",
     # dataclasses.py
     "DataclassValidator",
     # decimal.py
@@ -48,6 +53,8 @@ __all__ = (
     "FloatValidator",
     # generic.py
     "Lazy",
+    "FailFastValidator",
+    "LazyErrorsValidator",
     "Choices",
     "Min",
     "Max",
@@ -86,6 +93,9 @@ __all__ = (
     "none_validator",
     # set.py
     "SetValidator",
+    # stream.py
+    "validate_json_stream",
+    "validate_json_stream_async",
     # string.py
     "StringValidator",
     "RegexPredicate",
@@ -102,89 +112,223 @@ __all__ = (
     "UUIDValidator",
     # union.py
     "UnionValidator",
+    "DiscriminatedUnionValidator",
     # valid.py
     "Valid",
     "Invalid",
     "ValidationResult",
+    "BatchResult",
 )
 
-from koda_validate.base import (
-    CacheValidatorBase,
-    Predicate,
-    PredicateAsync,
-    Processor,
-    Validator,
-)
-from koda_validate.boolean import BoolValidator
-from koda_validate.bytes import BytesValidator
-from koda_validate.coerce import Coercer, coercer
-from koda_validate.dataclasses import DataclassValidator
-from koda_validate.decimal import DecimalValidator
-from koda_validate.dictionary import (
-    DictValidatorAny,
-    IsDictValidator,
-    KeyNotRequired,
-    MapValidator,
-    MaxKeys,
-    MinKeys,
-    RecordValidator,
-    is_dict_validator,
-)
-from koda_validate.errors import (
-    CoercionErr,
-    ContainerErr,
-    ErrType,
-    ExtraKeysErr,
-    IndexErrs,
-    KeyErrs,
-    KeyValErrs,
-    MapErr,
-    MissingKeyErr,
-    PredicateErrs,
-    SetErrs,
-    TypeErr,
-    UnionErrs,
-    ValidationErrBase,
-    missing_key_err,
-)
-from koda_validate.float import FloatValidator
-from koda_validate.generic import (
-    AlwaysValid,
-    Choices,
-    EndsWith,
-    EqualsValidator,
-    EqualTo,
-    ExactItemCount,
-    ExactLength,
-    Lazy,
-    LowerCase,
-    Max,
-    MaxItems,
-    MaxLength,
-    Min,
-    MinItems,
-    MinLength,
-    MultipleOf,
-    NotBlank,
-    StartsWith,
-    UniqueItems,
-    UpperCase,
-    always_valid,
-    lower_case,
-    not_blank,
-    strip,
-    unique_items,
-    upper_case,
-)
-from koda_validate.integer import IntValidator
-from koda_validate.list import ListValidator
-from koda_validate.namedtuple import NamedTupleValidator
-from koda_validate.none import NoneValidator, OptionalValidator, none_validator
-from koda_validate.set import SetValidator
-from koda_validate.string import EmailPredicate, RegexPredicate, StringValidator
-from koda_validate.time import DatetimeValidator, DateValidator
-from koda_validate.tuple import NTupleValidator, UniformTupleValidator
-from koda_validate.typeddict import TypedDictValidator
-from koda_validate.union import UnionValidator
-from koda_validate.uuid import UUIDValidator
-from koda_validate.valid import Invalid, Valid, ValidationResult
+# the submodule each name is defined in. Submodules are only imported when one of their
+# names is first used, so that importing `koda_validate` is fast
+_LAZY_IMPORTS: dict[str, str] = {
+    "Validator": "base",
+    "Predicate": "base",
+    "PredicateAsync": "base",
+    "BatchPredicateAsync": "base",
+    "Processor": "base",
+    "BoolValidator": "boolean",
+    "Coercer": "coerce",
+    "coercer": "coerce",
+    "BytesValidator": "bytes",
+    "LRUCacheValidator": "cache",
+    "TTLCacheValidator": "cache",
+    "compile_validator": "compiler",
+    "DataclassValidator": "dataclasses",
+    "DecimalValidator": "decimal",
+    "KeyNotRequired": "dictionary",
+    "MapValidator": "dictionary",
+    "is_dict_validator": "dictionary",
+    "IsDictValidator": "dictionary",
+    "MinKeys": "dictionary",
+    "MaxKeys": "dictionary",
+    "RecordValidator": "dictionary",
+    "DictValidatorAny": "dictionary",
+    "CoercionErr": "errors",
+    "ContainerErr": "errors",
+    "ExtraKeysErr": "errors",
+    "ErrType": "errors",
+    "IndexErrs": "errors",
+    "KeyErrs": "errors",
+    "KeyValErrs": "errors",
+    "MapErr": "errors",
+    "MissingKeyErr": "errors",
+    "missing_key_err": "errors",
+    "PredicateErrs": "errors",
+    "SetErrs": "errors",
+    "TypeErr": "errors",
+    "UnionErrs": "errors",
+    "ValidationErrBase": "errors",
+    "FloatValidator": "float",
+    "Lazy": "generic",
+    "FailFastValidator": "generic",
+    "LazyErrorsValidator": "generic",
+    "Choices": "generic",
+    "Min": "generic",
+    "Max": "generic",
+    "MinItems": "generic",
+    "MaxItems": "generic",
+    "ExactItemCount": "generic",
+    "unique_items": "generic",
+    "UniqueItems": "generic",
+    "MultipleOf": "generic",
+    "EqualsValidator": "generic",
+    "EqualTo": "generic",
+    "always_valid": "generic",
+    "AlwaysValid": "generic",
+    "MinLength": "generic",
+    "MaxLength": "generic",
+    "ExactLength": "generic",
+    "StartsWith": "generic",
+    "EndsWith": "generic",
+    "strip": "generic",
+    "not_blank": "generic",
+    "NotBlank": "generic",
+    "upper_case": "generic",
+    "UpperCase": "generic",
+    "lower_case": "generic",
+    "LowerCase": "generic",
+    "CacheValidatorBase": "base",
+    "IntValidator": "integer",
+    "ListValidator": "list",
+    "NamedTupleValidator": "namedtuple",
+    "OptionalValidator": "none",
+    "NoneValidator": "none",
+    "none_validator": "none",
+    "SetValidator": "set",
+    "validate_json_stream": "stream",
+    "validate_json_stream_async": "stream",
+    "StringValidator": "string",
+    "RegexPredicate": "string",
+    "EmailPredicate": "string",
+    "DateValidator": "time",
+    "DatetimeValidator": "time",
+    "NTupleValidator": "tuple",
+    "UniformTupleValidator": "tuple",
+    "TypedDictValidator": "typeddict",
+    "UUIDValidator": "uuid",
+    "UnionValidator": "union",
+    "DiscriminatedUnionValidator": "union",
+    "Valid": "valid",
+    "Invalid": "valid",
+    "ValidationResult": "valid",
+    "BatchResult": "valid",
+}
+
+if TYPE_CHECKING:
+    from koda_validate.base import (
+        BatchPredicateAsync,
+        CacheValidatorBase,
+        Predicate,
+        PredicateAsync,
+        Processor,
+        Validator,
+    )
+    from koda_validate.boolean import BoolValidator
+    from koda_validate.bytes import BytesValidator
+    from koda_validate.cache import LRUCacheValidator, TTLCacheValidator
+    from koda_validate.coerce import Coercer, coercer
+    from koda_validate.compiler import compile_validator
+    from koda_validate.dataclasses import DataclassValidator
+    from koda_validate.decimal import DecimalValidator
+    from koda_validate.dictionary import (
+        DictValidatorAny,
+        IsDictValidator,
+        KeyNotRequired,
+        MapValidator,
+        MaxKeys,
+        MinKeys,
+        RecordValidator,
+        is_dict_validator,
+    )
+    from koda_validate.errors import (
+        CoercionErr,
+        ContainerErr,
+        ErrType,
+        ExtraKeysErr,
+        IndexErrs,
+        KeyErrs,
+        KeyValErrs,
+        MapErr,
+        MissingKeyErr,
+        PredicateErrs,
+        SetErrs,
+        TypeErr,
+        UnionErrs,
+        ValidationErrBase,
+        missing_key_err,
+    )
+    from koda_validate.float import FloatValidator
+    from koda_validate.generic import (
+        AlwaysValid,
+        Choices,
+        EndsWith,
+        EqualsValidator,
+        EqualTo,
+        ExactItemCount,
+        ExactLength,
+        FailFastValidator,
+        Lazy,
+        LazyErrorsValidator,
+        LowerCase,
+        Max,
+        MaxItems,
+        MaxLength,
+        Min,
+        MinItems,
+        MinLength,
+        MultipleOf,
+        NotBlank,
+        StartsWith,
+        UniqueItems,
+        UpperCase,
+        always_valid,
+        lower_case,
+        not_blank,
+        strip,
+        unique_items,
+        upper_case,
+    )
+    from koda_validate.integer import IntValidator
+    from koda_validate.list import ListValidator
+    from koda_validate.namedtuple import NamedTupleValidator
+    from koda_validate.none import NoneValidator, OptionalValidator, none_validator
+    from koda_validate.set import SetValidator
+    from koda_validate.stream import validate_json_stream, validate_json_stream_async
+    from koda_validate.string import EmailPredicate, RegexPredicate, StringValidator
+    from koda_validate.time import DatetimeValidator, DateValidator
+    from koda_validate.tuple import NTupleValidator, UniformTupleValidator
+    from koda_validate.typeddict import TypedDictValidator
+    from koda_validate.union import DiscriminatedUnionValidator, UnionValidator
+    from koda_validate.uuid import UUIDValidator
+    from koda_validate.valid import BatchResult, Invalid, Valid, ValidationResult
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        val = getattr(import_module(f"koda_validate.{_LAZY_IMPORTS[name]}"), name)
+    elif name == "__version__":
+        # `importlib.metadata` is slow to import
+        from importlib.metadata import version
+
+        val = version("koda_validate")
+    else:
+        # submodules, e.g. `koda_validate.typehints`
+        try:
+            val = import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    # only look it up once
+    globals()[name] = val
+    return val
+
+
+def __dir__() -> list[str]:
+    # `set` is shadowed by the `koda_validate.set` module, once it's imported
+    return sorted({*globals(), *__all__, "__version__"})
@@ -1,10 +1,40 @@
-from typing import Any, Awaitable, Callable, Literal, NoReturn, Optional, Type, Union
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Literal,
+    NoReturn,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
 
 from koda_validate._generics import A, SuccessT
-from koda_validate.base import Predicate, PredicateAsync, Processor, Validator
+from koda_validate.base import (
+    Predicate,
+    PredicateAsync,
+    Processor,
+    Validator,
+    _fail_fast,
+)
 from koda_validate.coerce import Coercer
-from koda_validate.errors import CoercionErr, PredicateErrs, TypeErr, UnionErrs
-from koda_validate.valid import Invalid, Valid, ValidationResult
+from koda_validate.errors import (
+    CoercionErr,
+    ErrType,
+    PredicateErrs,
+    TypeErr,
+    UnionErrs,
+)
+from koda_validate.valid import BatchResult, Invalid, Valid, ValidationResult
+
+if TYPE_CHECKING:
+    import asyncio
 
 _ResultTuple = Union[tuple[Literal[True], A], tuple[Literal[False], Invalid]]
 
@@ -41,17 +71,24 @@ class _ToTupleValidator(Validator[SuccessT]):
         else:
             return result[1]
 
-
-def _simple_type_validator(
-    instance: "_ToTupleStandardValidator[A]", type_: Type[A], type_err: TypeErr
-) -> Callable[[Any], _ResultTuple[A]]:
-    def inner(val: Any) -> _ResultTuple[A]:
-        if type(val) is type_:
-            return True, val
-        else:
-            return False, Invalid(type_err, val, instance)
-
-    return inner
+    def is_valid(self, val: Any) -> bool:
+        return self._validate_to_tuple(val)[0]
+
+    def validate_many(self, vals: Iterable[Any]) -> BatchResult[SuccessT]:
+        validate = self._validate_to_tuple
+        valid: list[bool] = []
+        values: list[Any] = []
+        errors: dict[int, Invalid] = {}
+        for i, val in enumerate(vals):
+            result = validate(val)
+            if result[0]:
+                valid.append(True)
+                values.append(result[1])
+            else:
+                valid.append(False)
+                values.append(None)
+                errors[i] = result[1]
+        return BatchResult(valid, values, errors)
 
 
 def _async_predicates_warning(cls: Type[Any]) -> NoReturn:
@@ -69,6 +106,11 @@ def _raise_validate_object_async_in_sync_mode(cls: Type[Any]) -> NoReturn:
     )
 
 
+def _check_max_errors(max_errors: Optional[int]) -> None:
+    if max_errors is not None and max_errors < 1:
+        raise ValueError("`max_errors` must be at least 1")
+
+
 def _repr_helper(cls: Type[Any], arg_strs: list[str]) -> str:
     return f"{cls.__name__}({', '.join(arg_strs)})"
 
@@ -90,6 +132,7 @@ class _ToTupleStandardValidator(_ToTupleValidator[SuccessT]):
     # SHOULD BE THE SAME AS SuccessT but mypy can't handle that...? v0.991
     _TYPE: Type[Any]
     _type_err: TypeErr
+    _coercion_err: CoercionErr
 
     def __init__(
         self,
@@ -105,12 +148,55 @@ class _ToTupleStandardValidator(_ToTupleValidator[SuccessT]):
         self._type_err = _type_err
         self._disallow_synchronous = bool(predicates_async)
         self.coerce = coerce
-
+        if coerce:
+            self._coercion_err = CoercionErr(coerce.compatible_types, self._TYPE)
+
+        if (
+            type(self)._validate_to_tuple
+            is not _ToTupleStandardValidator._validate_to_tuple
+        ):
+            # the subclass validates values differently, so `is_valid` must too
+            if type(self).is_valid is _ToTupleStandardValidator.is_valid:
+                self.is_valid = self._is_valid_to_tuple  # type: ignore
         # optimization for simple  validators. can speed up by ~15%
-        if not predicates and not predicates_async and not preprocessors and not coerce:
-            self._validate_to_tuple = _simple_type_validator(  # type: ignore
-                self, self._TYPE, _type_err
-            )
+        elif not predicates and not predicates_async and not preprocessors and not coerce:
+            self._validate_to_tuple = self._validate_type_to_tuple  # type: ignore
+            self.is_valid = self._is_type  # type: ignore
+
+    def _validate_type_to_tuple(self, val: Any) -> _ResultTuple[SuccessT]:
+        # a method rather than a closure, so validators can be pickled
+        if type(val) is self._TYPE:
+            return True, val
+        else:
+            return False, Invalid(self._type_err, val, self)
+
+    def _is_type(self, val: Any) -> bool:
+        return type(val) is self._TYPE
+
+    def _is_valid_to_tuple(self, val: Any) -> bool:
+        return self._validate_to_tuple(val)[0]
+
+    def is_valid(self, val: Any) -> bool:
+        if self._disallow_synchronous:
+            _async_predicates_warning(self.__class__)
+
+        if self.coerce:
+            result = self.coerce(val)
+            if not result.is_just:
+                return False
+            val = result.val
+        elif type(val) is not self._TYPE:
+            return False
+
+        if self.preprocessors:
+            for proc in self.preprocessors:
+                val = proc(val)
+
+        if self.predicates:
+            for pred in self.predicates:
+                if not pred(val):
+                    return False
+        return True
 
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[SuccessT]:
         if self._disallow_synchronous:
@@ -119,11 +205,7 @@ class _ToTupleStandardValidator(_ToTupleValidator[SuccessT]):
         if self.coerce:
             result = self.coerce(val)
             if not result.is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, self._TYPE),
-                    val,
-                    self,
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 # val is now SuccessT
                 val = result.val
@@ -147,11 +229,7 @@ class _ToTupleStandardValidator(_ToTupleValidator[SuccessT]):
         if self.coerce:
             result = self.coerce(val)
             if not result.is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, self._TYPE),
-                    val,
-                    self,
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 # val is now SuccessT
                 val = result.val
@@ -203,6 +281,69 @@ class _ToTupleStandardValidator(_ToTupleValidator[SuccessT]):
         )
 
 
+class _LazyInvalid(Invalid):
+    """
+    An :class:`Invalid` whose details are only worked out -- by validating ``value``
+    again -- when they're first accessed. Returning this instead of an
+    :class:`Invalid` lets us skip building errors that are never inspected (e.g. those
+    of union variants, when a later variant is valid).
+
+    ``validator`` is expected to have been found to be invalid for ``value`` already
+    (likely in fail-fast mode, which is cheaper). ``value`` and ``validator`` are
+    those of that first result; only ``err_type`` is deferred.
+    """
+
+    __slots__ = ("_source_validator", "_source_value", "_first_invalid", "_invalid")
+
+    def __init__(
+        self, validator: Validator[Any], value: Any, first_invalid: Invalid
+    ) -> None:
+        """
+        :param validator: the validator that found ``value`` to be invalid
+        :param value: the invalid value
+        :param first_invalid: the result of the first validation, used if ``value``
+            is valid when it's validated again
+        """
+        self.value = first_invalid.value
+        self.validator = first_invalid.validator
+        self._source_validator = validator
+        self._source_value = value
+        self._first_invalid = first_invalid
+        self._invalid: Optional[Invalid] = None
+
+    def _materialize(self) -> Invalid:
+        if self._invalid is None:
+            token = _fail_fast.set(False)
+            try:
+                result = self._source_validator(self._source_value)
+            finally:
+                _fail_fast.reset(token)
+            if result.is_valid:
+                # ``value`` was changed since, or ``validator`` isn't deterministic; the
+                # errors found the first time are all we have
+                self._invalid = self._first_invalid
+            else:
+                self._invalid = result
+        return self._invalid
+
+    @property
+    def err_type(self) -> ErrType:  # type: ignore[override]
+        return self._materialize().err_type
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Invalid):
+            return self._materialize() == (
+                other._materialize() if isinstance(other, _LazyInvalid) else other
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return Invalid, (self.err_type, self.value, self.validator)
+
+
 def _union_validator(
     source_validator: Validator[A], validators: tuple[Validator[Any], ...], val: Any
 ) -> _ResultTuple[A]:
@@ -243,19 +384,119 @@ async def _union_validator_async(
     return False, Invalid(UnionErrs(errs), val, source_validator)
 
 
+class _TypeDispatch:
+    """
+    Which variants of a union can accept values of each type. Variants which only
+    accept values of a single type (without coercion) are only tried for values of
+    that type; the others are tried for values of any type.
+    """
+
+    __slots__ = ("table", "default", "type_errs")
+
+    def __init__(
+        self,
+        table: dict[type, tuple[int, ...]],
+        default: tuple[int, ...],
+        type_errs: dict[int, TypeErr],
+    ) -> None:
+        """
+        :param table: the indexes of the variants to try, in order, for each type
+        :param default: the indexes of the variants to try for other types
+        :param type_errs: for each variant which only accepts values of a single type
+            (by index), the error it returns for values of other types
+        """
+        self.table = table
+        self.default = default
+        self.type_errs = type_errs
+
+    def indexes(self, val: Any) -> tuple[int, ...]:
+        return self.table.get(type(val), self.default)
+
+    def union_errs(
+        self, validators: tuple[Validator[Any], ...], val: Any, errs: dict[int, Invalid]
+    ) -> UnionErrs:
+        """
+        :param validators: the variants of the union
+        :param val: the invalid value
+        :param errs: the errors of the variants which were tried
+        :return: the errors of all variants, as if each had been tried
+        """
+        return UnionErrs(
+            [
+                errs[i] if i in errs else Invalid(self.type_errs[i], val, validator)
+                for i, validator in enumerate(validators)
+            ]
+        )
+
+
+def _dispatch_union_validator(
+    source_validator: Validator[A],
+    validators: tuple[Validator[Any], ...],
+    val: Any,
+    type_dispatch: _TypeDispatch,
+) -> _ResultTuple[A]:
+    errs: dict[int, Invalid] = {}
+    for i in type_dispatch.indexes(val):
+        validator = validators[i]
+        if isinstance(validator, _ToTupleValidator):
+            result_tup = validator._validate_to_tuple(val)
+        else:
+            result_tup = _result_to_tuple(validator, val)
+        if result_tup[0]:
+            return True, result_tup[1]
+        else:
+            errs[i] = result_tup[1]
+    return False, Invalid(
+        type_dispatch.union_errs(validators, val, errs), val, source_validator
+    )
+
+
+async def _dispatch_union_validator_async(
+    source_validator: Validator[A],
+    validators: tuple[Validator[Any], ...],
+    val: Any,
+    type_dispatch: _TypeDispatch,
+) -> _ResultTuple[A]:
+    errs: dict[int, Invalid] = {}
+    for i in type_dispatch.indexes(val):
+        validator = validators[i]
+        if isinstance(validator, _ToTupleValidator):
+            result_tup = await validator._validate_to_tuple_async(val)
+        else:
+            result_tup = await _result_to_tuple_async(validator.validate_async, val)
+        if result_tup[0]:
+            return True, result_tup[1]
+        else:
+            errs[i] = result_tup[1]
+    return False, Invalid(
+        type_dispatch.union_errs(validators, val, errs), val, source_validator
+    )
+
+
+def _result_to_tuple(validator: Validator[A], v: Any) -> _ResultTuple[A]:
+    result = validator(v)
+    if result.is_valid:
+        return True, result.val
+    else:
+        return False, result
+
+
+async def _result_to_tuple_async(
+    async_validator: Callable[[Any], Awaitable[ValidationResult[A]]], v: Any
+) -> _ResultTuple[A]:
+    result = await async_validator(v)
+    if result.is_valid:
+        return True, result.val
+    else:
+        return False, result
+
+
+# these return `partial`s rather than closures, so validators can be pickled
 def _wrap_sync_validator(obj: Validator[A]) -> Callable[[Any], _ResultTuple[A]]:
     if isinstance(obj, _ToTupleValidator):
         return obj._validate_to_tuple
     else:
-
-        def inner(v: Any) -> _ResultTuple[A]:
-            result = obj(v)
-            if result.is_valid:
-                return True, result.val
-            else:
-                return False, result
-
-        return inner
+        return partial(_result_to_tuple, obj)
 
 
 def _wrap_async_validator(
@@ -264,16 +505,143 @@ def _wrap_async_validator(
     if isinstance(obj, _ToTupleValidator):
         return obj._validate_to_tuple_async
     else:
-        async_validator = obj.validate_async
+        return partial(_result_to_tuple_async, obj.validate_async)
 
-        async def inner(v: Any) -> _ResultTuple[A]:
-            result = await async_validator(v)
-            if result.is_valid:
-                return True, result.val
+
+async def _gather_or_cancel(tasks: "list[asyncio.Future[Any]]") -> list[Any]:
+    # imported here so that `asyncio` is only loaded if it's used
+    import asyncio
+
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def _gather_bounded(
+    calls: list[tuple[Callable[[Any], Awaitable[A]], Any]],
+    max_concurrency: Optional[int],
+) -> list[A]:
+    """
+    Await ``func(arg)`` for each ``(func, arg)`` in ``calls``, with no more than
+    ``max_concurrency`` (if not ``None``) running at once. Results are in the same
+    order as ``calls``. If any call raises, the others are cancelled.
+    """
+    # imported here so that `asyncio` is only loaded if it's used
+    import asyncio
+
+    if max_concurrency == 1 or len(calls) <= 1:
+        return [await func(arg) for func, arg in calls]
+    elif max_concurrency is None or len(calls) <= max_concurrency:
+        return await _gather_or_cancel(
+            [asyncio.ensure_future(func(arg)) for func, arg in calls]
+        )
+    else:
+        results: list[Any] = [None] * len(calls)
+        remaining = iter(enumerate(calls))
+
+        async def worker() -> None:
+            for i, (func, arg) in remaining:
+                results[i] = await func(arg)
+
+        await _gather_or_cancel(
+            [asyncio.ensure_future(worker()) for _ in range(max_concurrency)]
+        )
+        return results
+
+
+class _Concurrency:
+    """
+    Decides whether a container validator should validate its items concurrently
+    in ``validate_async``, and does so. Validation is concurrent if
+
+    - ``max_concurrency`` is set, and the nested validators do some async work; or
+    - the nested validators use a :class:`BatchPredicateAsync` (without a limit, so
+      that its calls can be batched)
+    """
+
+    def __init__(
+        self, max_concurrency: Optional[int], validators: list[Validator[Any]]
+    ) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.validators = validators
+        self._enabled: Optional[bool] = None
+
+    @property
+    def enabled(self) -> bool:
+        if self._enabled is None:
+            # deferred so `Lazy` validators can be resolved (and to avoid circular
+            # imports)
+            from koda_validate._tree import _has_async_work, _has_batch_predicates
+
+            if self.max_concurrency is None:
+                self._enabled = any(_has_batch_predicates(v) for v in self.validators)
             else:
-                return False, result
+                self._enabled = any(_has_async_work(v) for v in self.validators)
+        return self._enabled
 
-        return inner
+    async def results(
+        self, calls: list[tuple[Callable[[Any], Awaitable[A]], Any]]
+    ) -> Iterator[A]:
+        """
+        :param calls: ``(func, arg)`` pairs to await ``func(arg)`` for
+        :return: the results, in the same order as ``calls``
+        """
+        return iter(await _gather_bounded(calls, self.max_concurrency))
+
+
+class _ConcurrentKeys(_Concurrency):
+    """
+    Validates the values of a ``dict``'s keys concurrently, for record-like
+    validators.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int],
+        fast_keys_async: Sequence[
+            tuple[Hashable, Callable[[Any], Awaitable[_ResultTuple[Any]]], bool]
+        ],
+        validators: list[Validator[Any]],
+    ) -> None:
+        super().__init__(max_concurrency, validators)
+        self.fast_keys_async = fast_keys_async
+
+    async def key_results(self, data: dict[Any, Any]) -> Iterator[_ResultTuple[Any]]:
+        """
+        :param data: the ``dict`` being validated
+        :return: the results for the keys present in ``data``, in key order
+        """
+        return await self.results(
+            [
+                (validate, data[key])
+                for key, validate, _ in self.fast_keys_async
+                if key in data
+            ]
+        )
+
+
+def _keys_are_valid(
+    fast_keys_is_valid: Sequence[tuple[Hashable, Callable[[Any], bool], bool]],
+    data: dict[Any, Any],
+) -> bool:
+    """
+    The ``is_valid`` check for the keys of record-like validators.
+
+    :param fast_keys_is_valid: ``(key, is_valid, required)`` for each key
+    :param data: the ``dict`` being validated
+    """
+    for key_, is_valid, key_required in fast_keys_is_valid:
+        if key_ not in data:
+            if key_required:
+                return False
+        elif not is_valid(data[key_]):
+            return False
+    return True
 
 
 def _is_typed_dict_cls(t: Type[Any]) -> bool:
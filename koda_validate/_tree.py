@@ -0,0 +1,424 @@
+"""
+Helpers for walking the trees formed by nested validators.
+"""
+
+import inspect
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
+
+from koda_validate._internal import _ToTupleStandardValidator, _TypeDispatch
+from koda_validate.base import BatchPredicateAsync, CacheValidatorBase, Validator
+from koda_validate.errors import TypeErr
+
+
+class _ClassIfImported:
+    """
+    Stands in for a validator class in ``isinstance`` checks, without importing its
+    module -- so that building a validator doesn't import every other kind. There
+    can't be any instances of the class until its module has been imported.
+    """
+
+    __slots__ = ("module", "name")
+
+    def __init__(self, module: str, name: str) -> None:
+        self.module = module
+        self.name = name
+
+    def __instancecheck__(self, instance: Any) -> bool:
+        module = sys.modules.get(self.module)
+        return module is not None and isinstance(instance, getattr(module, self.name))
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(getattr(import_module(self.module), self.name), attr)
+
+
+if TYPE_CHECKING:
+    from koda_validate.cache import LRUCacheValidator, TTLCacheValidator
+    from koda_validate.dataclasses import DataclassValidator
+    from koda_validate.dictionary import (
+        DictValidatorAny,
+        IsDictValidator,
+        KeyNotRequired,
+        MapValidator,
+        RecordValidator,
+    )
+    from koda_validate.generic import (
+        AlwaysValid,
+        EqualsValidator,
+        FailFastValidator,
+        Lazy,
+        LazyErrorsValidator,
+    )
+    from koda_validate.list import ListValidator
+    from koda_validate.maybe import MaybeValidator
+    from koda_validate.metrics import InstrumentedValidator
+    from koda_validate.namedtuple import NamedTupleValidator
+    from koda_validate.none import NoneValidator, OptionalValidator
+    from koda_validate.set import SetValidator
+    from koda_validate.tuple import NTupleValidator, UniformTupleValidator
+    from koda_validate.typeddict import TypedDictValidator
+    from koda_validate.union import DiscriminatedUnionValidator, UnionValidator
+
+    _DerivedValidator = Union[
+        DataclassValidator[Any], NamedTupleValidator[Any], TypedDictValidator[Any]
+    ]
+else:
+    LRUCacheValidator = _ClassIfImported("koda_validate.cache", "LRUCacheValidator")
+    TTLCacheValidator = _ClassIfImported("koda_validate.cache", "TTLCacheValidator")
+    DictValidatorAny = _ClassIfImported("koda_validate.dictionary", "DictValidatorAny")
+    IsDictValidator = _ClassIfImported("koda_validate.dictionary", "IsDictValidator")
+    KeyNotRequired = _ClassIfImported("koda_validate.dictionary", "KeyNotRequired")
+    MapValidator = _ClassIfImported("koda_validate.dictionary", "MapValidator")
+    RecordValidator = _ClassIfImported("koda_validate.dictionary", "RecordValidator")
+    AlwaysValid = _ClassIfImported("koda_validate.generic", "AlwaysValid")
+    EqualsValidator = _ClassIfImported("koda_validate.generic", "EqualsValidator")
+    FailFastValidator = _ClassIfImported("koda_validate.generic", "FailFastValidator")
+    Lazy = _ClassIfImported("koda_validate.generic", "Lazy")
+    LazyErrorsValidator = _ClassIfImported("koda_validate.generic", "LazyErrorsValidator")
+    ListValidator = _ClassIfImported("koda_validate.list", "ListValidator")
+    MaybeValidator = _ClassIfImported("koda_validate.maybe", "MaybeValidator")
+    InstrumentedValidator = _ClassIfImported(
+        "koda_validate.metrics", "InstrumentedValidator"
+    )
+    NoneValidator = _ClassIfImported("koda_validate.none", "NoneValidator")
+    OptionalValidator = _ClassIfImported("koda_validate.none", "OptionalValidator")
+    SetValidator = _ClassIfImported("koda_validate.set", "SetValidator")
+    NTupleValidator = _ClassIfImported("koda_validate.tuple", "NTupleValidator")
+    UniformTupleValidator = _ClassIfImported(
+        "koda_validate.tuple", "UniformTupleValidator"
+    )
+    DiscriminatedUnionValidator = _ClassIfImported(
+        "koda_validate.union", "DiscriminatedUnionValidator"
+    )
+    UnionValidator = _ClassIfImported("koda_validate.union", "UnionValidator")
+
+# validators derived from a class's typehints, and the attributes they keep the class
+# in. Their modules import `koda_validate.typehints` -- and so nearly every validator
+_DERIVED: tuple[tuple[Any, str], ...] = (
+    (_ClassIfImported("koda_validate.dataclasses", "DataclassValidator"), "data_cls"),
+    (
+        _ClassIfImported("koda_validate.namedtuple", "NamedTupleValidator"),
+        "named_tuple_cls",
+    ),
+    (_ClassIfImported("koda_validate.typeddict", "TypedDictValidator"), "td_cls"),
+)
+
+
+def _derived_cls(validator: Validator[Any]) -> Optional[type]:
+    """
+    :param validator: any validator
+    :return: the class ``validator`` is derived from, if it's a
+        :class:`DataclassValidator`, :class:`NamedTupleValidator` or
+        :class:`TypedDictValidator`
+    """
+    for validator_cls, attr in _DERIVED:
+        if isinstance(validator, validator_cls):
+            return cast(type, getattr(validator, attr))
+    return None
+
+
+def _labelled_children(validator: Validator[Any]) -> list[tuple[str, Validator[Any]]]:
+    """
+    :param validator: any validator
+    :return: the validators directly nested within ``validator``, each with the
+        segment it adds to a path through the tree -- e.g. ``".name"`` for a key,
+        ``"[]"`` for the items of a list, or ``""`` for the validator a wrapper (like a
+        cache) delegates to
+    """
+    if isinstance(validator, RecordValidator):
+        return [(f".{key}", v) for key, v in validator.keys]
+    elif isinstance(validator, DictValidatorAny):
+        return [(f".{key}", v) for key, v in validator.schema.items()]
+    elif _derived_cls(validator) is not None:
+        schema = cast("_DerivedValidator", validator).schema
+        return [(f".{key}", v) for key, v in schema.items()]
+    elif isinstance(validator, (ListValidator, SetValidator, UniformTupleValidator)):
+        return [("[]", validator.item_validator)]
+    elif isinstance(validator, NTupleValidator):
+        return [(f"[{i}]", v) for i, v in enumerate(validator.fields)]
+    elif isinstance(validator, MapValidator):
+        return [
+            ("{key}", validator.key_validator),
+            ("{value}", validator.value_validator),
+        ]
+    elif isinstance(validator, (UnionValidator, OptionalValidator)):
+        return [(f"|{i}", v) for i, v in enumerate(validator.validators)]
+    elif isinstance(validator, DiscriminatedUnionValidator):
+        return [(f"|{tag}", v) for tag, v in validator.variants.items()]
+    elif isinstance(
+        validator,
+        (
+            KeyNotRequired,
+            MaybeValidator,
+            CacheValidatorBase,
+            FailFastValidator,
+            LazyErrorsValidator,
+            InstrumentedValidator,
+        ),
+    ):
+        return [("", validator.validator)]
+    elif isinstance(validator, Lazy):
+        return [("", validator._resolve())]
+    else:
+        return []
+
+
+def _root_name(validator: Validator[Any]) -> str:
+    """
+    :param validator: any validator
+    :return: a name for the root of a validator tree -- the name of the class the
+        validator builds (if any), or of the validator's class
+    """
+    if (cls := _derived_cls(validator)) is not None:
+        return cls.__name__
+    elif isinstance(validator, RecordValidator) and inspect.isclass(validator.into):
+        return validator.into.__name__
+    else:
+        return type(validator).__name__
+
+
+def _children(validator: Validator[Any]) -> list[Validator[Any]]:
+    """
+    :param validator: any validator
+    :return: the validators directly nested within ``validator``
+    """
+    # the same validator may be nested more than once (e.g. for more than one tag of a
+    # `DiscriminatedUnionValidator`)
+    return list({id(v): v for _, v in _labelled_children(validator)}.values())
+
+
+def _has_async_work(validator: Validator[Any], seen: Optional[set[int]] = None) -> bool:
+    """
+    Whether ``validator.validate_async`` might actually need to wait on something --
+    i.e. whether there are any :class:`PredicateAsync`, ``validate_object_async``,
+    cache lookups or custom validators within it. :class:`Lazy` validators are assumed
+    to, since recursive thunks may build new validators each time they're called, so
+    resolving them all might never end.
+
+    :param validator: the root of the validator tree
+    :param seen: ids of validators already checked
+    """
+    if seen is None:
+        seen = set()
+    elif id(validator) in seen:
+        return False
+    seen.add(id(validator))
+
+    if isinstance(
+        validator, (EqualsValidator, AlwaysValid, NoneValidator, IsDictValidator)
+    ):
+        return False
+    elif isinstance(validator, _ToTupleStandardValidator):
+        return bool(validator.predicates_async)
+    elif isinstance(validator, Lazy):
+        return True
+    elif isinstance(validator, (RecordValidator, DictValidatorAny)):
+        if validator.validate_object_async:
+            return True
+    elif _derived_cls(validator) is not None:
+        if cast("_DerivedValidator", validator).validate_object_async:
+            return True
+    elif isinstance(
+        validator, (ListValidator, SetValidator, UniformTupleValidator, MapValidator)
+    ):
+        if validator.predicates_async:
+            return True
+    elif not isinstance(
+        validator,
+        (
+            NTupleValidator,
+            UnionValidator,
+            DiscriminatedUnionValidator,
+            OptionalValidator,
+            KeyNotRequired,
+            MaybeValidator,
+            LRUCacheValidator,
+            TTLCacheValidator,
+            FailFastValidator,
+            LazyErrorsValidator,
+            InstrumentedValidator,
+        ),
+    ):
+        # other validators (including other caches) may do anything
+        return True
+
+    return any(_has_async_work(child, seen) for child in _children(validator))
+
+
+def _has_batch_predicates(
+    validator: Validator[Any], seen: Optional[set[int]] = None
+) -> bool:
+    """
+    Whether a :class:`BatchPredicateAsync` is used anywhere within ``validator``,
+    other than within :class:`Lazy` validators (which aren't resolved, for the same
+    reason as in :func:`_has_async_work`).
+
+    :param validator: the root of the validator tree
+    :param seen: ids of validators already checked
+    """
+    if seen is None:
+        seen = set()
+    elif id(validator) in seen:
+        return False
+    seen.add(id(validator))
+
+    if isinstance(validator, Lazy):
+        return False
+    elif (
+        isinstance(
+            validator,
+            (
+                _ToTupleStandardValidator,
+                ListValidator,
+                SetValidator,
+                UniformTupleValidator,
+                MapValidator,
+            ),
+        )
+        and validator.predicates_async
+        and any(
+            isinstance(pred, BatchPredicateAsync) for pred in validator.predicates_async
+        )
+    ):
+        return True
+
+    return any(_has_batch_predicates(child, seen) for child in _children(validator))
+
+
+# the methods through which validators validate values
+_VALIDATION_METHODS = (
+    "__call__",
+    "validate_async",
+    "_validate_to_tuple",
+    "_validate_to_tuple_async",
+)
+
+
+def _overrides_validation(
+    validator: Validator[Any], classes: Union[type, tuple[type, ...]]
+) -> bool:
+    """
+    Whether ``validator``'s class overrides how values are validated by the class in
+    ``classes`` it's an instance of. Subclasses which do may transform or check values
+    differently.
+
+    :param validator: an instance of one of ``classes``
+    :param classes: a class, or a tuple of classes, as for ``isinstance``
+    """
+    for cls in classes if isinstance(classes, tuple) else (classes,):
+        if isinstance(validator, cls):
+            return any(
+                getattr(type(validator), name, None) is not getattr(cls, name, None)
+                for name in _VALIDATION_METHODS
+            )
+    return False
+
+
+def _is_non_transforming(validator: Validator[Any]) -> bool:
+    """
+    Whether ``validator`` always returns valid values unchanged -- i.e. equal to, and
+    of the same type as, the values passed in -- so that containers can return the
+    original object instead of a copy.
+
+    Validators with a ``coerce`` or ``preprocessors``, validators which build new
+    objects, ``Lazy`` validators (which may not be resolvable yet), custom validators
+    and subclasses which override how values are validated are all assumed to
+    transform values.
+
+    :param validator: the root of the validator tree
+    """
+    if _overrides_validation(
+        validator,
+        (
+            AlwaysValid,
+            EqualsValidator,
+            _ToTupleStandardValidator,
+            NoneValidator,
+            ListValidator,
+            UniformTupleValidator,
+            MapValidator,
+            DictValidatorAny,
+        ),
+    ):
+        return False
+    elif isinstance(validator, AlwaysValid):
+        return True
+    elif isinstance(validator, EqualsValidator):
+        return not validator.preprocessors
+    elif isinstance(validator, _ToTupleStandardValidator):
+        return not validator.coerce and not validator.preprocessors
+    elif isinstance(validator, NoneValidator):
+        return not validator.coerce
+    elif isinstance(validator, (ListValidator, UniformTupleValidator, MapValidator)):
+        return validator._passthrough and not validator.coerce
+    elif isinstance(validator, DictValidatorAny):
+        # otherwise unknown keys are dropped
+        return validator._passthrough and validator.fail_on_unknown_keys
+    elif isinstance(
+        validator,
+        (
+            UnionValidator,
+            DiscriminatedUnionValidator,
+            OptionalValidator,
+            FailFastValidator,
+            LazyErrorsValidator,
+            InstrumentedValidator,
+        ),
+    ):
+        # these only pass values to, and return the results of, their children
+        return all(_is_non_transforming(child) for child in _children(validator))
+    else:
+        return False
+
+
+def _type_gate(validator: Validator[Any]) -> Optional[tuple[type, TypeErr]]:
+    """
+    :param validator: any validator
+    :return: the only type ``validator`` can accept values of, and the error it
+        returns for values of other types -- or ``None`` if it may accept values of
+        any type
+    """
+    if isinstance(validator, NoneValidator) and not _overrides_validation(
+        validator, NoneValidator
+    ):
+        from koda_validate.none import _none_type_err
+
+        return None if validator.coerce else (type(None), _none_type_err)
+    elif isinstance(validator, EqualsValidator) and not _overrides_validation(
+        validator, EqualsValidator
+    ):
+        return type(validator.match), validator._type_err
+    elif (
+        isinstance(validator, _ToTupleStandardValidator)
+        # subclasses may check types differently
+        and not _overrides_validation(validator, _ToTupleStandardValidator)
+        and not validator.coerce
+    ):
+        return validator._TYPE, validator._type_err
+    else:
+        return None
+
+
+def _type_dispatch(validators: tuple[Validator[Any], ...]) -> Optional[_TypeDispatch]:
+    """
+    Lets a union only try the variants which can accept values of a given type,
+    instead of trying each in turn.
+
+    :param validators: the variants of the union
+    :return: ``None`` if no variant only accepts values of a single type
+    """
+    gates = [_type_gate(v) for v in validators]
+    if all(gate is None for gate in gates):
+        return None
+
+    table: dict[type, tuple[int, ...]] = {}
+    for type_ in dict.fromkeys(gate[0] for gate in gates if gate is not None):
+        table[type_] = tuple(
+            i for i, gate in enumerate(gates) if gate is None or gate[0] is type_
+        )
+    return _TypeDispatch(
+        table,
+        tuple(i for i, gate in enumerate(gates) if gate is None),
+        {i: gate[1] for i, gate in enumerate(gates) if gate is not None},
+    )
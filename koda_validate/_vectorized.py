@@ -0,0 +1,222 @@
+"""
+Optional NumPy-backed validation of large, homogeneous lists of ``int``s or ``float``s.
+
+NumPy is not a dependency of koda_validate. If it cannot be imported, or the values
+can't be represented exactly as a NumPy array, validation falls back to the regular
+item-by-item code path. Results are the same either way.
+"""
+
+import importlib
+import math
+from functools import partial
+from typing import Any, Callable, Optional, Sequence
+
+from koda_validate._internal import _ToTupleStandardValidator
+from koda_validate.base import Predicate, Validator, _fail_fast
+from koda_validate.errors import IndexErrs
+from koda_validate.float import FloatValidator
+from koda_validate.generic import Choices, EqualTo, Max, Min, MultipleOf
+from koda_validate.integer import IntValidator
+
+# below this length, the cost of building a numpy array can outweigh the gains
+VECTORIZE_MIN_LEN = 64
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+# all ints with an absolute value up to this can be represented exactly as floats
+_MAX_EXACT_FLOAT_INT = 2**53
+
+_ArrayPredicate = Callable[[Any, Any], Any]
+
+_numpy: Any = None
+_numpy_imported = False
+
+
+def _get_numpy() -> Any:
+    global _numpy, _numpy_imported
+    if not _numpy_imported:
+        try:
+            _numpy = importlib.import_module("numpy")
+        except ImportError:
+            _numpy = None
+        _numpy_imported = True
+    return _numpy
+
+
+def _is_exact_param(type_: type, param: Any) -> bool:
+    """
+    Whether comparisons against ``param`` behave identically on numpy arrays (with
+    dtype ``int64`` or ``float64``) and on python ``int``s or ``float``s.
+    """
+    if type(param) is int:
+        if type_ is int:
+            return _INT64_MIN <= param <= _INT64_MAX
+        else:
+            return abs(param) <= _MAX_EXACT_FLOAT_INT
+    else:
+        return type_ is float and type(param) is float and not math.isnan(param)
+
+
+# array predicates are module-level functions (with their parameters bound by
+# `partial`), so that validators using them can be pickled
+def _greater_than(minimum: Any, np: Any, arr: Any) -> Any:
+    return arr > minimum
+
+
+def _at_least(minimum: Any, np: Any, arr: Any) -> Any:
+    return arr >= minimum
+
+
+def _less_than(maximum: Any, np: Any, arr: Any) -> Any:
+    return arr < maximum
+
+
+def _at_most(maximum: Any, np: Any, arr: Any) -> Any:
+    return arr <= maximum
+
+
+def _is_multiple(factor: Any, np: Any, arr: Any) -> Any:
+    # `np.remainder` has the same semantics as python's `%`, but warns about `inf`
+    # and `nan`
+    with np.errstate(invalid="ignore"):
+        return np.remainder(arr, factor) == 0
+
+
+def _equal_to(match: Any, np: Any, arr: Any) -> Any:
+    return arr == match
+
+
+def _is_in(choices: list[Any], np: Any, arr: Any) -> Any:
+    return np.isin(arr, choices)
+
+
+def _array_predicate(type_: type, pred: Predicate[Any]) -> Optional[_ArrayPredicate]:
+    if type(pred) is Min and _is_exact_param(type_, pred.minimum):
+        if pred.exclusive_minimum:
+            return partial(_greater_than, pred.minimum)
+        else:
+            return partial(_at_least, pred.minimum)
+    elif type(pred) is Max and _is_exact_param(type_, pred.maximum):
+        if pred.exclusive_maximum:
+            return partial(_less_than, pred.maximum)
+        else:
+            return partial(_at_most, pred.maximum)
+    elif (
+        type(pred) is MultipleOf
+        # python raises `ZeroDivisionError`, so we'll let it do so
+        and pred.factor != 0
+        and _is_exact_param(type_, pred.factor)
+    ):
+        return partial(_is_multiple, pred.factor)
+    elif type(pred) is EqualTo and _is_exact_param(type_, pred.match):
+        return partial(_equal_to, pred.match)
+    elif type(pred) is Choices and all(
+        _is_exact_param(type_, choice) for choice in pred.choices
+    ):
+        return partial(_is_in, list(pred.choices))
+    else:
+        return None
+
+
+class _VectorizedItems:
+    """
+    A plan for validating many items with a simple ``IntValidator`` or
+    ``FloatValidator`` at once.
+    """
+
+    def __init__(
+        self,
+        item_validator: _ToTupleStandardValidator[Any],
+        type_: type,
+        array_predicates: list[_ArrayPredicate],
+    ) -> None:
+        self.item_validator = item_validator
+        self.type_ = type_
+        self.array_predicates = array_predicates
+
+    def _array(self, np: Any, vals: Sequence[Any]) -> Any:
+        """
+        :return: ``vals`` as a numpy array, or ``None`` if they can't be converted
+        """
+        if np is None or set(map(type, vals)) != {self.type_}:
+            return None
+
+        try:
+            return np.array(vals, dtype=np.int64 if self.type_ is int else np.float64)
+        except OverflowError:
+            return None
+
+    def is_valid(self, vals: Sequence[Any]) -> Optional[bool]:
+        """
+        :param vals: the items to validate
+        :return: ``None`` if the items could not be validated with numpy, otherwise
+            whether all of them are valid
+        """
+        np = _get_numpy()
+        if (arr := self._array(np, vals)) is None:
+            return None
+        return all(
+            array_predicate(np, arr).all() for array_predicate in self.array_predicates
+        )
+
+    def validate(
+        self, vals: Sequence[Any], max_errors: Optional[int] = None
+    ) -> Optional[IndexErrs]:
+        """
+        :param vals: the items to validate
+        :param max_errors: the maximum number of errors to return
+        :return: ``None`` if the items could not be validated with numpy, otherwise
+            the errors for invalid indexes (which may be empty)
+        """
+        np = _get_numpy()
+        if (arr := self._array(np, vals)) is None:
+            return None
+
+        valid_mask: Any = None
+        for array_predicate in self.array_predicates:
+            pred_mask = array_predicate(np, arr)
+            valid_mask = pred_mask if valid_mask is None else valid_mask & pred_mask
+
+        if valid_mask is None or valid_mask.all():
+            return IndexErrs({})
+        else:
+            # invalid items are run through the validator, so that errors are
+            # identical to the non-vectorized code path
+            validate = self.item_validator._validate_to_tuple
+            invalid_indexes = np.flatnonzero(~valid_mask).tolist()
+            truncated = False
+            if _fail_fast.get():
+                invalid_indexes = invalid_indexes[:1]
+            elif max_errors is not None and len(invalid_indexes) >= max_errors:
+                invalid_indexes = invalid_indexes[:max_errors]
+                # the same as validating item by item would report
+                truncated = invalid_indexes[-1] + 1 < len(vals)
+            return IndexErrs(
+                {i: validate(vals[i])[1] for i in invalid_indexes}, truncated=truncated
+            )
+
+
+def _vectorized_items(item_validator: Validator[Any]) -> Optional[_VectorizedItems]:
+    """
+    :param item_validator: the item validator of a collection validator
+    :return: a plan for vectorized validation, or ``None`` if ``item_validator`` isn't
+        a simple ``IntValidator`` or ``FloatValidator`` with known predicates
+    """
+    if (
+        # subclasses may have overridden validation
+        type(item_validator) not in (IntValidator, FloatValidator)
+        or not isinstance(item_validator, _ToTupleStandardValidator)
+        or item_validator.predicates_async
+        or item_validator.preprocessors
+        or item_validator.coerce
+    ):
+        return None
+
+    type_: type = item_validator._TYPE
+    array_predicates: list[_ArrayPredicate] = []
+    for pred in item_validator.predicates:
+        if (array_predicate := _array_predicate(type_, pred)) is None:
+            return None
+        array_predicates.append(array_predicate)
+
+    return _VectorizedItems(item_validator, type_, array_predicates)
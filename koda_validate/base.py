@@ -1,13 +1,25 @@
 from abc import abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Generic
+from typing import TYPE_CHECKING, Any, Generic, Iterable
+from weakref import WeakKeyDictionary
 
 from koda import Maybe
 
 from koda_validate._generics import A, SuccessT
 
 if TYPE_CHECKING:
-    from koda_validate.valid import ValidationResult
+    import asyncio
+
+    from koda_validate.valid import BatchResult, ValidationResult
+
+# set by `FailFastValidator`. When `True`, validators stop at the first invalid
+# key or item, instead of collecting errors for all of them
+_fail_fast: ContextVar[bool] = ContextVar("_fail_fast", default=False)
+
+# set by cache validators. When `True`, containers return copies instead of the values
+# passed in, so that the caller's (mutable) objects aren't stored in the cache
+_no_passthrough: ContextVar[bool] = ContextVar("_no_passthrough", default=False)
 
 
 class Validator(Generic[SuccessT]):
@@ -55,6 +67,39 @@ class Validator(Generic[SuccessT]):
 
         raise NotImplementedError()  # pragma: no cover
 
+    def is_valid(self, val: Any) -> bool:
+        r"""
+        Whether ``val`` is valid. This is equivalent to ``self(val).is_valid``, but
+        many built-in :class:`Validator`\s skip building the valid value, and any
+        errors.
+
+        :param val: the value being validated
+        """
+        return self(val).is_valid
+
+    def validate_many(self, vals: Iterable[Any]) -> "BatchResult[SuccessT]":
+        """
+        Validate each value in ``vals``, collecting the results in a
+        :class:`BatchResult`.
+
+        :param vals: the values being validated
+        """
+        from koda_validate.valid import BatchResult
+
+        valid: list[bool] = []
+        values: list[Any] = []
+        errors: dict[int, Any] = {}
+        for i, val in enumerate(vals):
+            result = self(val)
+            if result.is_valid:
+                valid.append(True)
+                values.append(result.val)
+            else:
+                valid.append(False)
+                values.append(None)
+                errors[i] = result
+        return BatchResult(valid, values, errors)
+
 
 class Predicate(Generic[A]):
     r"""
@@ -133,6 +178,111 @@ class PredicateAsync(Generic[A]):
         raise NotImplementedError()  # pragma: no cover
 
 
+_Batch = tuple[list[Any], "list[asyncio.Future[bool]]"]
+
+# values waiting to be checked, per event loop and ``BatchPredicateAsync``
+_pending_batches: "WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, _Batch]]" = (
+    WeakKeyDictionary()
+)
+# the event loop only keeps weak references to tasks
+_running_batches: "set[asyncio.Task[None]]" = set()
+
+
+class BatchPredicateAsync(PredicateAsync[A]):
+    r"""
+    A :class:`PredicateAsync` which can check many values at once -- with a single
+    ``WHERE x IN (...)`` query, for instance.
+
+    Calls to ``validate_async`` made during the same iteration of the event loop are
+    collected and checked with one call to ``validate_batch``. To make batching
+    possible, collection and record-like :class:`Validator`\s validate their items
+    concurrently in ``validate_async`` if a :class:`BatchPredicateAsync` is used
+    anywhere within them (other than within a :class:`Lazy`, which isn't resolved to
+    check). To batch across a :class:`Lazy`, set ``max_concurrency``.
+
+    Example :class:`BatchPredicateAsync`
+
+    .. testcode:: batchpredasync
+
+        import asyncio
+        from koda_validate import BatchPredicateAsync, ListValidator, StringValidator
+
+        class UsernameInDB(BatchPredicateAsync[str]):
+            async def validate_batch(self, vals: list[str]) -> list[bool]:
+                # pretend to call db once for all values
+                await asyncio.sleep(.001)
+                print(f"checking {vals}")
+                return [len(val) == 3 for val in vals]
+
+    Usage
+
+    .. doctest:: batchpredasync
+
+        >>> validator = ListValidator(StringValidator(predicates_async=[UsernameInDB()]))
+        >>> asyncio.run(validator.validate_async(["abc", "def"]))
+        checking ['abc', 'def']
+        Valid(val=['abc', 'def'])
+    """
+
+    @abstractmethod
+    async def validate_batch(self, vals: list[A]) -> list[bool]:  # pragma: no cover
+        """
+        :param vals: the values being validated
+        :return: a bool for each value in ``vals``, in the same order, indicating
+            whether the condition is ``True`` for that value
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+    async def validate_async(self, val: A) -> bool:
+        # imported here so that `asyncio` is only loaded if it's used
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        batches = _pending_batches.setdefault(loop, {})
+        if (batch := batches.get(id(self))) is None:
+            batch = batches[id(self)] = ([], [])
+            loop.call_soon(self._dispatch_batch, loop, batches)
+
+        future: "asyncio.Future[bool]" = loop.create_future()
+        batch[0].append(val)
+        batch[1].append(future)
+        return await future
+
+    def _dispatch_batch(
+        self, loop: "asyncio.AbstractEventLoop", batches: dict[int, _Batch]
+    ) -> None:
+        task = loop.create_task(self._run_batch(*batches.pop(id(self))))
+        _running_batches.add(task)
+        task.add_done_callback(_running_batches.discard)
+
+    async def _run_batch(
+        self, vals: list[A], futures: "list[asyncio.Future[bool]]"
+    ) -> None:
+        # imported here so that `asyncio` is only loaded if it's used
+        import asyncio
+
+        try:
+            results = await self.validate_batch(vals)
+            if len(results) != len(vals):
+                raise ValueError(
+                    f"`validate_batch` returned {len(results)} results for "
+                    f"{len(vals)} values"
+                )
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in futures:
+                # callers which were cancelled are already done
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future, result in zip(futures, results):
+                if not future.done():
+                    future.set_result(result)
+
+
 class Processor(Generic[A]):
     r"""
     Base class for ``Processor``\s. These are litle more than
@@ -209,13 +359,31 @@ class CacheValidatorBase(Validator[A]):
     async def cache_set_async(self, val: Any, cache_val: "ValidationResult[A]") -> None:
         raise NotImplementedError()
 
+    def _validate_uncached(self, val: Any) -> "ValidationResult[A]":
+        # the result may be returned to other callers, so it mustn't be (or contain)
+        # objects passed in by this caller, which it could go on to mutate
+        token = _no_passthrough.set(True)
+        try:
+            return self.validator(val)
+        finally:
+            _no_passthrough.reset(token)
+
+    async def _validate_uncached_async(self, val: Any) -> "ValidationResult[A]":
+        token = _no_passthrough.set(True)
+        try:
+            return await self.validator.validate_async(val)
+        finally:
+            _no_passthrough.reset(token)
+
     def __call__(self, val: Any) -> "ValidationResult[A]":
         cache_result = self.cache_get_sync(val)
         if cache_result.is_just:
             return cache_result.val
         else:
-            result = self.validator(val)
-            self.cache_set_sync(val, result)
+            result = self._validate_uncached(val)
+            # errors found in fail-fast mode may be incomplete
+            if result.is_valid or not _fail_fast.get():
+                self.cache_set_sync(val, result)
             return result
 
     async def validate_async(self, val: Any) -> "ValidationResult[A]":
@@ -223,6 +391,7 @@ class CacheValidatorBase(Validator[A]):
         if cache_result.is_just:
             return cache_result.val
         else:
-            result = await self.validator.validate_async(val)
-            await self.cache_set_async(val, result)
+            result = await self._validate_uncached_async(val)
+            if result.is_valid or not _fail_fast.get():
+                await self.cache_set_async(val, result)
             return result
@@ -0,0 +1,236 @@
+"""
+Validation of large NDJSON (JSON Lines) files, in parallel worker processes.
+"""
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from multiprocessing.context import BaseContext
+from typing import IO, Any, Callable, Generic, Iterable, Optional, Union
+
+from koda_validate._generics import A
+from koda_validate.base import Validator
+from koda_validate.serialization import Serializable, to_serializable_errs
+
+_ChunkResult = tuple[list[tuple[int, Any]], list[tuple[int, Serializable]]]
+
+
+@dataclass
+class BulkStats:
+    """
+    Counts and timing for a call to :func:`validate_ndjson_bulk`. Blank lines are not
+    counted.
+    """
+
+    records: int = 0
+    valid: int = 0
+    invalid: int = 0
+    seconds: float = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """
+        The fraction of records which were invalid
+        """
+        return self.invalid / self.records if self.records else 0.0
+
+
+class _ChunkValidator(Generic[A]):
+    def __init__(self, validator: Validator[A]) -> None:
+        self.validator = validator
+
+    def __call__(self, start: int, lines: list[Union[str, bytes]]) -> _ChunkResult:
+        """
+        :param start: the index of the first line in ``lines``
+        :param lines: the lines to validate
+        :return: ``(index, value)`` pairs for valid records, and ``(index, errors)``
+            pairs for invalid records
+        """
+        valid: list[tuple[int, Any]] = []
+        invalid: list[tuple[int, Serializable]] = []
+        for i, line in enumerate(lines, start):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                invalid.append((i, [f"invalid JSON: {e.msg}"]))
+                continue
+
+            result = self.validator(data)
+            if result.is_valid:
+                valid.append((i, result.val))
+            else:
+                invalid.append((i, to_serializable_errs(result)))
+
+        return valid, invalid
+
+
+# each worker process holds its own copy of the validator
+_worker_chunk_validator: Optional[_ChunkValidator[Any]] = None
+
+
+def _init_worker(validator: Validator[Any]) -> None:
+    global _worker_chunk_validator
+    _worker_chunk_validator = _ChunkValidator(validator)
+
+
+def _validate_chunk_in_worker(start: int, lines: list[Union[str, bytes]]) -> _ChunkResult:
+    assert _worker_chunk_validator is not None
+    return _worker_chunk_validator(start, lines)
+
+
+def _chunks(
+    stream: Iterable[Union[str, bytes]], chunk_size: int
+) -> Iterable[tuple[int, list[Union[str, bytes]]]]:
+    lines = iter(stream)
+    start = 0
+    while chunk := list(islice(lines, chunk_size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def validate_ndjson_bulk(
+    validator: Validator[A],
+    source: Union[str, "os.PathLike[str]", IO[Any]],
+    *,
+    on_valid: Callable[[int, A], None],
+    on_invalid: Callable[[int, Serializable], None],
+    workers: Optional[int] = None,
+    chunk_size: int = 10_000,
+    max_pending_chunks: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> BulkStats:
+    """
+    Validate each line of an NDJSON (JSON Lines) file with ``validator``. The file is
+    read in chunks of ``chunk_size`` lines, which are validated in a pool of worker
+    processes, each holding a copy of ``validator``.
+
+    Results are passed to the sinks in the order the lines appear in the file:
+
+    - ``on_valid`` receives the index of the line and the validated value
+    - ``on_invalid`` receives the index of the line and its errors, as produced by
+      :func:`to_serializable_errs<koda_validate.serialization.to_serializable_errs>`.
+      Lines which aren't valid JSON are reported here too
+
+    Blank lines are skipped.
+
+    .. note::
+
+        Depending on the multiprocessing start method, ``validator`` may need to be
+        pickled to send it to the worker processes. :class:`Validator`\\s made by
+        :func:`compile_validator<koda_validate.compile_validator>`, caches, and any
+        ``Validator`` referring to lambdas or locally defined classes or functions
+        cannot be pickled. Valid values are always pickled to send them back from
+        the workers.
+
+    .. testsetup:: bulk
+
+        from io import BytesIO
+        from koda_validate import *
+        from koda_validate.bulk import validate_ndjson_bulk
+
+    .. doctest:: bulk
+
+        >>> valid, invalid = [], []
+        >>> stats = validate_ndjson_bulk(
+        ...     IntValidator(),
+        ...     BytesIO(b'1\\n"2"\\n3\\n'),
+        ...     on_valid=lambda i, val: valid.append(val),
+        ...     on_invalid=lambda i, errs: invalid.append((i, errs)),
+        ...     workers=0,
+        ... )
+        >>> valid
+        [1, 3]
+        >>> invalid
+        [(1, ['expected an integer'])]
+        >>> stats.records, stats.valid, stats.invalid
+        (3, 2, 1)
+
+    :param validator: the validator for each line
+    :param source: a path, or a binary or text stream
+    :param on_valid: receives valid values
+    :param on_invalid: receives errors
+    :param workers: the number of worker processes (defaults to the number of CPUs).
+        If ``0``, lines are validated in the current process.
+    :param chunk_size: the number of lines sent to a worker at a time
+    :param max_pending_chunks: the maximum number of chunks being validated, or
+        waiting to be passed to the sinks, at any time (defaults to twice the
+        number of workers). This bounds memory use.
+    :param mp_context: the multiprocessing context for the worker processes
+    :return: counts and timing for the whole file
+    :raises ValueError: if ``workers`` is negative, or ``chunk_size`` or
+        ``max_pending_chunks`` is less than 1
+    """
+    if workers is not None and workers < 0:
+        raise ValueError("`workers` cannot be negative")
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be at least 1")
+    if max_pending_chunks is not None and max_pending_chunks < 1:
+        raise ValueError("`max_pending_chunks` must be at least 1")
+
+    stats = BulkStats()
+    start_time = time.perf_counter()
+
+    def handle(chunk_result: _ChunkResult) -> None:
+        valid, invalid = chunk_result
+        # results are passed to the sinks in line order
+        v = e = 0
+        while v < len(valid) or e < len(invalid):
+            if e == len(invalid) or (v < len(valid) and valid[v][0] < invalid[e][0]):
+                on_valid(*valid[v])
+                v += 1
+            else:
+                on_invalid(*invalid[e])
+                e += 1
+        stats.valid += len(valid)
+        stats.invalid += len(invalid)
+
+    if isinstance(source, (str, os.PathLike)):
+        stream: IO[Any] = open(source, "rb")
+    else:
+        stream = source
+
+    try:
+        if workers == 0:
+            chunk_validator = _ChunkValidator(validator)
+            for start, lines in _chunks(stream, chunk_size):
+                handle(chunk_validator(start, lines))
+        else:
+            workers = workers or os.cpu_count() or 1
+            max_pending_chunks = max_pending_chunks or workers * 2
+            with ProcessPoolExecutor(
+                workers,
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(validator,),
+            ) as executor:
+                pending: deque[Future[_ChunkResult]] = deque()
+                try:
+                    for start, lines in _chunks(stream, chunk_size):
+                        if len(pending) >= max_pending_chunks:
+                            handle(pending.popleft().result())
+                        pending.append(
+                            executor.submit(_validate_chunk_in_worker, start, lines)
+                        )
+                    while pending:
+                        handle(pending.popleft().result())
+                except BaseException:
+                    for future in pending:
+                        future.cancel()
+                    raise
+    finally:
+        if stream is not source:
+            stream.close()
+
+    stats.records = stats.valid + stats.invalid
+    stats.seconds = time.perf_counter() - start_time
+    return stats
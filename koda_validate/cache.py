@@ -0,0 +1,337 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional
+from uuid import UUID
+
+from koda import Just, Maybe, nothing
+
+from koda_validate._generics import A
+from koda_validate.base import CacheValidatorBase, _fail_fast
+from koda_validate.valid import ValidationResult
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class _Unfingerprintable(Exception):
+    pass
+
+
+_NoneType = type(None)
+
+
+def _fingerprint(val: Any) -> Hashable:
+    """
+    Build a hashable, structural key for ``val``. Types are part of the key, so
+    ``1``, ``1.0`` and ``True`` (which are equal in python) get different keys. Values
+    that are equal but not interchangeable for validation purposes (``0.0`` and
+    ``-0.0``, ``Decimal("1.0")`` and ``Decimal("1.00")``) also get different keys.
+
+    :param val: the value to fingerprint
+    :return: a hashable key
+    :raises _Unfingerprintable: if ``val`` (or anything inside it) is not of a
+        supported type
+    """
+    type_ = type(val)
+    if type_ is str or type_ is int or type_ is bool or type_ is _NoneType:
+        return type_, val
+    elif type_ is float:
+        return float, val.hex()
+    elif type_ is dict:
+        return dict, tuple(
+            [(_fingerprint(key), _fingerprint(value)) for key, value in val.items()]
+        )
+    elif type_ is list or type_ is tuple:
+        return type_, tuple([_fingerprint(item) for item in val])
+    elif type_ is set or type_ is frozenset:
+        return type_, frozenset([_fingerprint(item) for item in val])
+    elif type_ is bytes:
+        return bytes, val
+    elif type_ is Decimal:
+        return Decimal, str(val)
+    elif type_ is UUID:
+        return UUID, val.int
+    elif type_ is date:
+        return date, val.toordinal()
+    elif isinstance(val, Enum):
+        return type_, val
+    else:
+        raise _Unfingerprintable()
+
+
+def _fingerprint_or_none(val: Any) -> Optional[Hashable]:
+    try:
+        return _fingerprint(val)
+    except (_Unfingerprintable, RecursionError):
+        return None
+
+
+@dataclass
+class LRUCacheValidator(CacheValidatorBase[A]):
+    r"""
+    An in-memory, thread-safe cache which holds up to ``max_size`` results, evicting
+    the least recently used result when it is full.
+
+    Values don't need to be hashable. ``dict``\s, ``list``\s, ``tuple``\s and
+    ``set``\s of common scalar types are cached by their (type-aware) structure.
+    Values that can't be fingerprinted -- for instance, instances of arbitrary classes
+    -- are validated without using the cache, and are counted as misses.
+
+    .. note::
+
+        The same :class:`ValidationResult` is returned for every cache hit. Mutating
+        a cached result affects later hits.
+
+    :param validator: the validator to cache results for
+    :param max_size: the maximum number of results to keep
+    :raises ValueError: if ``max_size`` is less than 1
+    """
+
+    max_size: int = 1024
+
+    hits: int = field(default=0, init=False, repr=False, compare=False)
+    misses: int = field(default=0, init=False, repr=False, compare=False)
+    evictions: int = field(default=0, init=False, repr=False, compare=False)
+
+    _cache: "OrderedDict[Hashable, ValidationResult[A]]" = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError("`max_size` must be at least 1")
+
+    def _get(self, key: Optional[Hashable]) -> Maybe[ValidationResult[A]]:
+        with self._lock:
+            if key is not None and key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return Just(self._cache[key])
+            else:
+                self.misses += 1
+                return nothing
+
+    def _set(self, key: Optional[Hashable], result: ValidationResult[A]) -> None:
+        # errors found in fail-fast mode may be incomplete
+        if key is not None and (result.is_valid or not _fail_fast.get()):
+            with self._lock:
+                self._cache[key] = result
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
+                    self.evictions += 1
+
+    def cache_get_sync(self, val: Any) -> Maybe[ValidationResult[A]]:
+        return self._get(_fingerprint_or_none(val))
+
+    def cache_set_sync(self, val: Any, cache_val: ValidationResult[A]) -> None:
+        self._set(_fingerprint_or_none(val), cache_val)
+
+    async def cache_get_async(self, val: Any) -> Maybe[ValidationResult[A]]:
+        return self.cache_get_sync(val)
+
+    async def cache_set_async(self, val: Any, cache_val: ValidationResult[A]) -> None:
+        self.cache_set_sync(val, cache_val)
+
+    def __call__(self, val: Any) -> ValidationResult[A]:
+        key = _fingerprint_or_none(val)
+        if (cache_result := self._get(key)).is_just:
+            return cache_result.val
+        else:
+            result = self._validate_uncached(val)
+            self._set(key, result)
+            return result
+
+    async def validate_async(self, val: Any) -> ValidationResult[A]:
+        key = _fingerprint_or_none(val)
+        if (cache_result := self._get(key)).is_just:
+            return cache_result.val
+        else:
+            result = await self._validate_uncached_async(val)
+            self._set(key, result)
+            return result
+
+    def clear(self) -> None:
+        """
+        Remove all cached results and reset ``hits``, ``misses`` and ``evictions``.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+@dataclass
+class TTLCacheValidator(CacheValidatorBase[A]):
+    r"""
+    An in-memory cache whose results expire ``ttl`` seconds after they are stored. It
+    is intended for :class:`Validator`\s which do expensive work in ``validate_async``,
+    like :class:`PredicateAsync`\s that make network or database calls.
+
+    - :class:`Invalid` results are cached for ``invalid_ttl`` seconds (``ttl`` if it is
+      ``None``). Set ``invalid_ttl`` to ``0`` to only cache :class:`Valid` results.
+    - Concurrent calls to ``validate_async`` for the same value (in the same event
+      loop) share a single call to the wrapped validator. If that call raises an
+      exception, every caller receives it, and nothing is cached.
+    - No more than ``max_size`` results are kept; the least recently used results are
+      evicted first.
+
+    Values are cached by the same structural fingerprint as
+    :class:`LRUCacheValidator`. Values that can't be fingerprinted are validated
+    without using the cache.
+
+    :param validator: the validator to cache results for
+    :param ttl: seconds to cache :class:`Valid` results for
+    :param invalid_ttl: seconds to cache :class:`Invalid` results for
+    :param max_size: the maximum number of results to keep
+    :param clock: returns the current time in seconds
+    :raises ValueError: if ``max_size`` is less than 1, or a ttl is negative
+    """
+
+    ttl: float = 60.0
+    invalid_ttl: Optional[float] = None
+    max_size: int = 1024
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False, compare=False)
+
+    hits: int = field(default=0, init=False, repr=False, compare=False)
+    misses: int = field(default=0, init=False, repr=False, compare=False)
+
+    # values are (expiration time, result)
+    _cache: "OrderedDict[Hashable, tuple[float, ValidationResult[A]]]" = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _in_flight: "dict[Hashable, asyncio.Future[ValidationResult[A]]]" = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError("`max_size` must be at least 1")
+        if self.ttl < 0 or (self.invalid_ttl is not None and self.invalid_ttl < 0):
+            raise ValueError("`ttl` and `invalid_ttl` cannot be negative")
+
+    def _get(
+        self, key: Optional[Hashable], count_miss: bool = True
+    ) -> Maybe[ValidationResult[A]]:
+        with self._lock:
+            if key is not None and (entry := self._cache.get(key)) is not None:
+                if entry[0] > self.clock():
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return Just(entry[1])
+                else:
+                    del self._cache[key]
+            if count_miss:
+                self.misses += 1
+            return nothing
+
+    def _set(self, key: Optional[Hashable], result: ValidationResult[A]) -> None:
+        # errors found in fail-fast mode may be incomplete
+        if key is None or (not result.is_valid and _fail_fast.get()):
+            return
+        if result.is_valid or self.invalid_ttl is None:
+            ttl = self.ttl
+        else:
+            ttl = self.invalid_ttl
+        if ttl > 0:
+            with self._lock:
+                self._cache[key] = (self.clock() + ttl, result)
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
+
+    def cache_get_sync(self, val: Any) -> Maybe[ValidationResult[A]]:
+        return self._get(_fingerprint_or_none(val))
+
+    def cache_set_sync(self, val: Any, cache_val: ValidationResult[A]) -> None:
+        self._set(_fingerprint_or_none(val), cache_val)
+
+    async def cache_get_async(self, val: Any) -> Maybe[ValidationResult[A]]:
+        return self.cache_get_sync(val)
+
+    async def cache_set_async(self, val: Any, cache_val: ValidationResult[A]) -> None:
+        self.cache_set_sync(val, cache_val)
+
+    def __call__(self, val: Any) -> ValidationResult[A]:
+        key = _fingerprint_or_none(val)
+        if (cache_result := self._get(key)).is_just:
+            return cache_result.val
+        else:
+            result = self._validate_uncached(val)
+            self._set(key, result)
+            return result
+
+    async def validate_async(self, val: Any) -> ValidationResult[A]:
+        key = _fingerprint_or_none(val)
+        if key is None:
+            self._get(key)  # counts the miss
+            return await self.validator.validate_async(val)
+
+        # imported here so that `asyncio` is only loaded if it's used
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        while True:
+            if (cache_result := self._get(key, count_miss=False)).is_just:
+                return cache_result.val
+
+            with self._lock:
+                in_flight = self._in_flight.get(key)
+                if in_flight is None or in_flight.get_loop() is not loop:
+                    in_flight = None
+                    future: "asyncio.Future[ValidationResult[A]]" = loop.create_future()
+                    self._in_flight[key] = future
+                    self.misses += 1
+
+            if in_flight is None:
+                break
+
+            try:
+                # `shield` so that cancelling this caller doesn't affect other callers
+                result = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                # if the call we were waiting on was cancelled, try again
+                if not in_flight.cancelled():
+                    raise
+            else:
+                # sharing another caller's result counts as a hit
+                with self._lock:
+                    self.hits += 1
+                return result
+
+        try:
+            result = await self._validate_uncached_async(val)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # other callers may not be waiting; avoid "exception never retrieved"
+            future.exception()
+            raise
+        else:
+            self._set(key, result)
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+
+    def clear(self) -> None:
+        """
+        Remove all cached results and reset ``hits`` and ``misses``.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
@@ -1,5 +1,7 @@
+import importlib
+import sys
 from dataclasses import dataclass
-from typing import Any, Callable, Generic, Type
+from typing import Any, Callable, Generic, Type, Union
 
 from koda import Maybe
 
@@ -20,6 +22,25 @@ class Coercer(Generic[A]):
     def __call__(self, val: Any) -> Maybe[A]:
         return self.coerce(val)
 
+    def __reduce__(self) -> Union[str, tuple[Any, ...]]:
+        # `@coercer` replaces module-level functions with `Coercer`s, so those
+        # functions can't be pickled by reference; the `Coercer`s can be instead
+        module_name = getattr(self.coerce, "__module__", None)
+        name = getattr(self.coerce, "__qualname__", None)
+        if (
+            module_name is not None
+            and name is not None
+            and getattr(sys.modules.get(module_name), name, None) is self
+        ):
+            return _import_coercer, (module_name, name)
+        else:
+            return Coercer, (self.coerce, self.compatible_types)
+
+
+def _import_coercer(module_name: str, name: str) -> Coercer[Any]:
+    coercer_: Coercer[Any] = getattr(importlib.import_module(module_name), name)
+    return coercer_
+
 
 def coercer(
     *compatible_types: Type[Any],
@@ -0,0 +1,393 @@
+"""
+Code generation for record-like :class:`Validator<koda_validate.Validator>`\\s.
+
+Record-like validators normally loop over a list of ``(key, validator, required)``
+tuples for every value they validate. :func:`compile_validator` walks a validator tree
+once and replaces that loop with a generated function, where keys, required flags and
+simple scalar type checks are written out inline.
+"""
+
+import keyword
+from typing import Any, Callable, Hashable, Optional, TypeVar, Union
+
+from koda import Just, nothing
+
+from koda_validate._internal import (
+    _ResultTuple,
+    _ToTupleStandardValidator,
+    _wrap_sync_validator,
+)
+from koda_validate._tree import _children
+from koda_validate.base import Validator, _fail_fast, _no_passthrough
+from koda_validate.dataclasses import DataclassValidator
+from koda_validate.dictionary import DictValidatorAny, KeyNotRequired, RecordValidator
+from koda_validate.errors import KeyErrs, missing_key_err
+from koda_validate.generic import AlwaysValid, Lazy
+from koda_validate.list import ListValidator
+from koda_validate.maybe import MaybeValidator
+from koda_validate.namedtuple import NamedTupleValidator
+from koda_validate.none import NoneValidator, OptionalValidator
+from koda_validate.tuple import NTupleValidator
+from koda_validate.typeddict import TypedDictValidator
+from koda_validate.valid import Invalid
+
+_RecordLike = (
+    RecordValidator,
+    DictValidatorAny,
+    DataclassValidator,
+    TypedDictValidator,
+    NamedTupleValidator,
+)
+
+_RecordLikeT = Union[
+    RecordValidator[Any],
+    DictValidatorAny,
+    DataclassValidator[Any],
+    TypedDictValidator[Any],
+    NamedTupleValidator[Any],
+]
+
+
+def _is_simple_type_validator(validator: Validator[Any]) -> bool:
+    return (
+        isinstance(validator, _ToTupleStandardValidator)
+        and not validator.predicates
+        and not validator.predicates_async
+        and not validator.preprocessors
+        and not validator.coerce
+    )
+
+
+def _inline_check(
+    validator: Validator[Any], local: str, idx: int, namespace: dict[str, Any]
+) -> Optional[str]:
+    """
+    Returns a boolean expression that is ``True`` when the value bound to ``local`` is
+    *invalid* for ``validator``, or ``None`` if the check can't be inlined. Valid values
+    pass through these validators unchanged, so only the failure path needs to call the
+    validator (to build the exact same ``Invalid`` as usual).
+    """
+    if _is_simple_type_validator(validator):
+        namespace[f"type_{idx}"] = validator._TYPE  # type: ignore[attr-defined]
+        return f"type({local}) is not type_{idx}"
+    elif isinstance(validator, NoneValidator) and not validator.coerce:
+        return f"{local} is not None"
+    elif isinstance(validator, AlwaysValid):
+        return "False"
+    elif isinstance(validator, OptionalValidator) and isinstance(
+        validator.none_validator, NoneValidator
+    ):
+        inner = _inline_check(validator.non_none_validator, local, idx, namespace)
+        if inner is not None and inner != "False":
+            return f"{local} is not None and {inner}"
+    return None
+
+
+def _key_literal(key: Hashable, idx: int, namespace: dict[str, Any]) -> str:
+    if type(key) is str or type(key) is int:
+        return repr(key)
+    else:
+        name = f"key_{idx}"
+        namespace[name] = key
+        return name
+
+
+class _CodeGen:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {
+            "Invalid": Invalid,
+            "KeyErrs": KeyErrs,
+            "Just": Just,
+            "nothing": nothing,
+            "missing_key_err": missing_key_err,
+            "fail_fast": _fail_fast,
+        }
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def build(self, fn_name: str) -> Callable[[Any], _ResultTuple[Any]]:
+        exec("\n".join(self.lines), self.namespace)
+        fn: Callable[[Any], _ResultTuple[Any]] = self.namespace[fn_name]
+        return fn
+
+
+def _emit_prelude(gen: _CodeGen, validator: _RecordLikeT) -> None:
+    """
+    Type checks / coercion. Afterward, the dictionary being validated is always bound
+    to ``data``.
+    """
+    gen.namespace["self"] = validator
+    if isinstance(validator, DataclassValidator):
+        gen.namespace["cls"] = validator.data_cls
+    elif isinstance(validator, NamedTupleValidator):
+        gen.namespace["cls"] = validator.named_tuple_cls
+
+    if isinstance(validator, RecordValidator):
+        gen.namespace["dict_type_err"] = validator._type_err
+        gen.emit(1, "if not isinstance(data, dict):")
+        gen.emit(2, "return False, Invalid(dict_type_err, data, self)")
+    elif isinstance(validator, DictValidatorAny):
+        gen.namespace["dict_type_err"] = validator._type_err
+        gen.emit(1, "if type(data) is not dict:")
+        gen.emit(2, "return False, Invalid(dict_type_err, data, self)")
+    else:
+        gen.emit(1, "val = data")
+        if validator.coerce:
+            gen.namespace["coerce"] = validator.coerce
+            gen.namespace["coercion_err"] = validator._coercion_err
+            gen.emit(1, "if not (coerced := coerce(val)).is_just:")
+            gen.emit(2, "return False, Invalid(coercion_err, val, self)")
+            gen.emit(1, "data = coerced.val")
+        elif isinstance(validator, TypedDictValidator):
+            gen.namespace["dict_type_err"] = validator._type_err
+            gen.emit(1, "if type(val) is not dict:")
+            gen.emit(2, "return False, Invalid(dict_type_err, val, self)")
+        else:
+            to_dict = (
+                "val.__dict__"
+                if isinstance(validator, DataclassValidator)
+                else "val._asdict()"
+            )
+            gen.namespace["cls_coercion_err"] = validator._cls_coercion_err
+            gen.emit(1, "if type(val) is not dict:")
+            gen.emit(2, "if type(val) is cls:")
+            gen.emit(3, f"data = {to_dict}")
+            gen.emit(2, "else:")
+            gen.emit(3, "return False, Invalid(cls_coercion_err, val, self)")
+
+    if validator.fail_on_unknown_keys:
+        gen.namespace["key_set"] = (
+            validator._key_set
+            if isinstance(validator, RecordValidator)
+            else validator._keys_set
+        )
+        gen.namespace["unknown_keys_err"] = validator._unknown_keys_err
+        gen.emit(1, "if not key_set.issuperset(data):")
+        gen.emit(2, "return False, Invalid(unknown_keys_err, data, self)")
+
+
+def _record_fields(
+    validator: _RecordLikeT,
+) -> list[tuple[Hashable, Validator[Any], bool]]:
+    if isinstance(validator, RecordValidator):
+        return [(k, v, not isinstance(v, KeyNotRequired)) for k, v in validator.keys]
+    elif isinstance(validator, DictValidatorAny):
+        return [
+            (k, v.validator, False) if isinstance(v, KeyNotRequired) else (k, v, True)
+            for k, v in validator.schema.items()
+        ]
+    else:
+        # the derived validators already know which keys are required
+        return [
+            (key, validator.schema[key], required)
+            for key, _, required in validator._fast_keys_sync
+        ]
+
+
+_MISSING = object()
+
+
+def _compile_record_like(
+    validator: _RecordLikeT,
+) -> Callable[[Any], _ResultTuple[Any]]:
+    gen = _CodeGen()
+    fn_name = f"_validate_{type(validator).__name__}"
+    gen.emit(0, f"def {fn_name}(data):")
+    _emit_prelude(gen, validator)
+    gen.emit(1, "errs = {}")
+
+    def emit_err(indent: int, line: str) -> None:
+        gen.emit(indent, line)
+        gen.emit(indent, "if fail_fast.get():")
+        gen.emit(indent + 1, "return False, Invalid(KeyErrs(errs), data, self)")
+
+    wraps_maybe = isinstance(validator, RecordValidator)
+    # (key literal, local name, required)
+    fields: list[tuple[str, str, bool]] = []
+    for i, (key, field_validator, required) in enumerate(_record_fields(validator)):
+        key_lit = _key_literal(key, i, gen.namespace)
+        local = f"v_{i}"
+        fields.append((key_lit, local, required))
+        gen.namespace[f"validate_{i}"] = _wrap_sync_validator(field_validator)
+
+        # RecordValidator keeps `KeyNotRequired`, which wraps valid values in `Just`
+        inner_validator = (
+            field_validator.validator
+            if isinstance(field_validator, KeyNotRequired)
+            else field_validator
+        )
+        check = _inline_check(inner_validator, local, i, gen.namespace)
+
+        gen.emit(1, f"if {key_lit} in data:")
+        if check is None:
+            gen.emit(2, f"valid_{i}, {local} = validate_{i}(data[{key_lit}])")
+            gen.emit(2, f"if not valid_{i}:")
+            emit_err(3, f"errs[{key_lit}] = {local}")
+        else:
+            gen.emit(2, f"{local} = data[{key_lit}]")
+            if check != "False":
+                gen.emit(2, f"if {check}:")
+                emit_err(3, f"errs[{key_lit}] = validate_{i}({local})[1]")
+            if wraps_maybe and not required:
+                gen.emit(2, f"{local} = Just({local})")
+        gen.emit(1, "else:")
+        if required:
+            emit_err(2, f"errs[{key_lit}] = Invalid(missing_key_err, data, self)")
+        elif wraps_maybe:
+            gen.emit(2, f"{local} = nothing")
+        else:
+            gen.namespace["missing"] = _MISSING
+            gen.emit(2, f"{local} = missing")
+
+    gen.emit(1, "if errs:")
+    gen.emit(2, "return False, Invalid(KeyErrs(errs), data, self)")
+
+    # build the result object
+    if isinstance(validator, RecordValidator):
+        gen.namespace["into"] = validator.into
+        gen.emit(1, f"obj = into({', '.join(local for _, local, _ in fields)})")
+    elif isinstance(validator, (DictValidatorAny, TypedDictValidator)):
+        indent = 1
+        if isinstance(validator, DictValidatorAny) and validator._passthrough:
+            # the values are unchanged, so the dict is too if it has no unknown keys
+            gen.namespace["no_passthrough"] = _no_passthrough
+            if validator.fail_on_unknown_keys:
+                gen.emit(1, "if not no_passthrough.get():")
+            else:
+                gen.namespace["key_set"] = validator._keys_set
+                gen.emit(1, "if not no_passthrough.get() and key_set.issuperset(data):")
+            gen.emit(2, "obj = data")
+            gen.emit(1, "else:")
+            indent = 2
+
+        if all(required for _, _, required in fields):
+            items = ", ".join(f"{key_lit}: {local}" for key_lit, local, _ in fields)
+            gen.emit(indent, f"obj = {{{items}}}")
+        else:
+            gen.emit(indent, "obj = {}")
+            for key_lit, local, required in fields:
+                if required:
+                    gen.emit(indent, f"obj[{key_lit}] = {local}")
+                else:
+                    gen.emit(indent, f"if {local} is not missing:")
+                    gen.emit(indent + 1, f"obj[{key_lit}] = {local}")
+    else:
+        kwargs: list[str] = []
+        has_kw_dict = False
+        for (key, _, _), (key_lit, local, required) in zip(
+            _record_fields(validator), fields
+        ):
+            if (
+                required
+                and isinstance(key, str)
+                and key.isidentifier()
+                and not keyword.iskeyword(key)
+            ):
+                kwargs.append(f"{key}={local}")
+            else:
+                if not has_kw_dict:
+                    gen.emit(1, "kw = {}")
+                    has_kw_dict = True
+                if required:
+                    gen.emit(1, f"kw[{key_lit}] = {local}")
+                else:
+                    gen.emit(1, f"if {local} is not missing:")
+                    gen.emit(2, f"kw[{key_lit}] = {local}")
+        if has_kw_dict:
+            kwargs.append("**kw")
+        gen.emit(1, f"obj = cls({', '.join(kwargs)})")
+
+    if validator.validate_object is not None:
+        gen.namespace["validate_object"] = validator.validate_object
+        gen.emit(1, "if result := validate_object(obj):")
+        gen.emit(2, "return False, Invalid(result, obj, self)")
+    gen.emit(1, "return True, obj")
+
+    return gen.build(fn_name)
+
+
+def _compile_on_resolve(validator: Lazy[Any], seen: dict[int, Validator[Any]]) -> None:
+    """
+    Compile the validator ``validator`` resolves to, once it's resolved. Recursive
+    thunks may build a new validator each time they're called, so resolving them all
+    up front might never end.
+    """
+    resolve_uncompiled = validator._resolve
+
+    def resolve() -> Validator[Any]:
+        if validator._resolved is None:
+            resolved = resolve_uncompiled()
+            _compile(resolved, seen)
+            # pick up the compiled functions
+            validator._validator_sync = _wrap_sync_validator(resolved)
+        return resolve_uncompiled()
+
+    if validator._resolved is None:
+        validator._resolve = resolve  # type: ignore[method-assign]
+    else:
+        _compile(validator._resolved, seen)
+        validator._validator_sync = _wrap_sync_validator(validator._resolved)
+
+
+def _compile(validator: Validator[Any], seen: dict[int, Validator[Any]]) -> None:
+    if id(validator) in seen:
+        return
+    # keep a reference, so ids aren't reused by validators built later (by thunks)
+    seen[id(validator)] = validator
+
+    if isinstance(validator, Lazy):
+        _compile_on_resolve(validator, seen)
+        return
+
+    # children first, so parents pick up the compiled functions
+    for child in _children(validator):
+        _compile(child, seen)
+
+    if isinstance(validator, _RecordLike) and not validator._disallow_synchronous:
+        validator._validate_to_tuple = _compile_record_like(validator)  # type: ignore
+    elif isinstance(validator, ListValidator):
+        validator._wrapped_item_validator_sync = _wrap_sync_validator(
+            validator.item_validator
+        )
+    elif isinstance(validator, MaybeValidator):
+        validator._validator_sync = _wrap_sync_validator(validator.validator)
+    elif isinstance(validator, NTupleValidator):
+        validator._wrapped_fields_sync = [
+            _wrap_sync_validator(v) for v in validator.fields
+        ]
+
+
+_ValidatorT = TypeVar("_ValidatorT", bound=Validator[Any])
+
+
+def compile_validator(validator: _ValidatorT) -> _ValidatorT:
+    """
+    Walks ``validator`` (and every :class:`Validator<koda_validate.Validator>` nested
+    within it) and replaces the synchronous validation of :class:`RecordValidator`,
+    :class:`DictValidatorAny`, :class:`DataclassValidator`, :class:`TypedDictValidator`
+    and :class:`NamedTupleValidator` instances with generated code. Results are the
+    same as without compilation.
+
+    Validators are modified in place, so this should be called once, after the
+    validator is fully built (e.g. at module level). ``validate_async`` is not affected.
+    Validators nested in a :class:`Lazy` are compiled when it's first used.
+
+    Example:
+
+    >>> from dataclasses import dataclass
+    >>> from koda_validate import DataclassValidator, compile_validator
+    >>> @dataclass
+    ... class Person:
+    ...     name: str
+    ...     age: int
+    >>> validator = compile_validator(DataclassValidator(Person))
+    >>> validator({"name": "Bob", "age": 30})
+    Valid(val=Person(name='Bob', age=30))
+
+    :param validator: the root of the validator tree to compile
+    :return: the same ``validator``, for convenience
+    """
+    _compile(validator, {})
+    return validator
@@ -6,6 +6,7 @@ from typing import (
     Awaitable,
     Callable,
     ClassVar,
+    Hashable,
     Optional,
     Protocol,
     Type,
@@ -17,6 +18,8 @@ from typing import (
 from koda import Just, Maybe, nothing
 
 from koda_validate._internal import (
+    _ConcurrentKeys,
+    _keys_are_valid,
     _raise_cannot_define_validate_object_and_validate_object_async,
     _raise_validate_object_async_in_sync_mode,
     _repr_helper,
@@ -25,7 +28,7 @@ from koda_validate._internal import (
     _wrap_async_validator,
     _wrap_sync_validator,
 )
-from koda_validate.base import Validator
+from koda_validate.base import Validator, _fail_fast
 from koda_validate.coerce import Coercer
 from koda_validate.errors import (
     CoercionErr,
@@ -93,6 +96,9 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
         types
     :param fail_on_unknown_keys: if True, this will fail if any keys not defined by
         ``self.data_cls`` are found. This will fail before any values are validated.
+    :param max_concurrency: if set, ``validate_async`` validates the values of keys
+        concurrently, with up to this many running at once. Keys are still validated
+        one at a time if none of their validators do any asynchronous work.
     :param coerce: a function that can control coercion
     :raises TypeError: should raise if non-``dataclass`` type is passed for ``data_cls``
     """
@@ -109,6 +115,7 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
             Callable[[_DCT], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
         typehint_resolver: Callable[[Any], Validator[Any]] = get_typehint_validator,
         coerce: Optional[Coercer[dict[Any, Any]]] = None,
     ) -> None:
@@ -116,6 +123,7 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
             raise TypeError("Must be a dataclass")
         self.data_cls = cast(Type[_DCT], data_cls)
         self.fail_on_unknown_keys = fail_on_unknown_keys
+        self.max_concurrency = max_concurrency
         self.overrides = overrides
         self.coerce = coerce
         if validate_object and validate_object_async:
@@ -150,6 +158,7 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
         self._keys_set = set()
         self._fast_keys_sync = []
         self._fast_keys_async = []
+        self._fast_keys_is_valid: list[tuple[Hashable, Callable[[Any], bool], bool]] = []
         for key, val in self.schema.items():
             self._keys_set.add(key)
             is_required = key not in keys_with_defaults
@@ -157,8 +166,37 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
                 self.required_fields.append(key)
             self._fast_keys_sync.append((key, _wrap_sync_validator(val), is_required))
             self._fast_keys_async.append((key, _wrap_async_validator(val), is_required))
+            self._fast_keys_is_valid.append((key, val.is_valid, is_required))
 
+        self._concurrent_keys = _ConcurrentKeys(
+            max_concurrency, self._fast_keys_async, list(self.schema.values())
+        )
         self._unknown_keys_err: ExtraKeysErr = ExtraKeysErr(set(self.schema.keys()))
+        self._cls_coercion_err = CoercionErr({dict, self.data_cls}, self.data_cls)
+        if coerce:
+            self._coercion_err = CoercionErr(coerce.compatible_types, dict)
+
+    def is_valid(self, val: Any) -> bool:
+        if self._disallow_synchronous:
+            _raise_validate_object_async_in_sync_mode(self.__class__)
+        elif self.validate_object is not None:
+            # `validate_object` needs the valid object
+            return self._validate_to_tuple(val)[0]
+
+        if self.coerce:
+            if not (coerced := self.coerce(val)).is_just:
+                return False
+            data: dict[Any, Any] = coerced.val
+        elif type(val) is dict:
+            data = val
+        elif type(val) is self.data_cls:
+            data = val.__dict__
+        else:
+            return False
+
+        return not (
+            self.fail_on_unknown_keys and not self._keys_set.issuperset(data)
+        ) and _keys_are_valid(self._fast_keys_is_valid, data)
 
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[_DCT]:
         if self._disallow_synchronous:
@@ -166,9 +204,7 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
 
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, dict), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: dict[Any, Any] = coerced.val
 
@@ -177,14 +213,7 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
         elif type(val) is self.data_cls:
             coerced_val = val.__dict__
         else:
-            return False, Invalid(
-                CoercionErr(
-                    {dict, self.data_cls},
-                    self.data_cls,
-                ),
-                val,
-                self,
-            )
+            return False, Invalid(self._cls_coercion_err, val, self)
 
         if self.fail_on_unknown_keys:
             for key_ in coerced_val:
@@ -197,11 +226,15 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
             if key_ not in coerced_val:
                 if key_required:
                     errs[key_] = Invalid(missing_key_err, coerced_val, self)
+                    if _fail_fast.get():
+                        break
             else:
                 success, new_val = validator(coerced_val[key_])
 
                 if not success:
                     errs[key_] = new_val
+                    if _fail_fast.get():
+                        break
                 elif not errs:
                     success_dict[key_] = new_val
 
@@ -217,9 +250,7 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[_DCT]:
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, dict), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: dict[Any, Any] = coerced.val
 
@@ -228,14 +259,7 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
         elif type(val) is self.data_cls:
             coerced_val = val.__dict__
         else:
-            return False, Invalid(
-                CoercionErr(
-                    {dict, self.data_cls},
-                    self.data_cls,
-                ),
-                val,
-                self,
-            )
+            return False, Invalid(self._cls_coercion_err, val, self)
 
         if self.fail_on_unknown_keys:
             # this seems to be faster than `for key_ in coerced_val.keys()`
@@ -245,15 +269,28 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
 
         success_dict: dict[Any, Any] = {}
         errs: dict[Any, Invalid] = {}
+        concurrent_results = (
+            await self._concurrent_keys.key_results(coerced_val)
+            if self._concurrent_keys.enabled
+            else None
+        )
         for key_, validator, key_required in self._fast_keys_async:
             if key_ not in coerced_val:
                 if key_required:
                     errs[key_] = Invalid(missing_key_err, coerced_val, self)
+                    if _fail_fast.get():
+                        break
             else:
-                success, new_val = await validator(coerced_val[key_])
+                success, new_val = (
+                    await validator(coerced_val[key_])
+                    if concurrent_results is None
+                    else next(concurrent_results)
+                )
 
                 if not success:
                     errs[key_] = new_val
+                    if _fail_fast.get():
+                        break
                 elif not errs:
                     success_dict[key_] = new_val
 
@@ -277,6 +314,7 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
             and other.validate_object_async is self.validate_object_async
             and other.schema == self.schema
             and other.fail_on_unknown_keys == self.fail_on_unknown_keys
+            and other.max_concurrency == self.max_concurrency
             and other.coerce == self.coerce
         )
 
@@ -295,6 +333,7 @@ class DataclassValidator(_ToTupleValidator[_DCT]):
                     # by default we don't fail on extra keys, so we don't
                     # show this in the repr if the default is defined
                     ("fail_on_unknown_keys", self.fail_on_unknown_keys),
+                    ("max_concurrency", self.max_concurrency),
                 ]
                 if v
             ],
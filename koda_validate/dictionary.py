@@ -1,5 +1,15 @@
 import dataclasses
-from typing import Any, Awaitable, Callable, ClassVar, Hashable, Optional, Union, overload
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Hashable,
+    Iterator,
+    Optional,
+    Union,
+    overload,
+)
 
 from koda import Just, Maybe, nothing
 
@@ -25,6 +35,10 @@ from koda_validate._generics import (
 )
 from koda_validate._internal import (
     _async_predicates_warning,
+    _check_max_errors,
+    _Concurrency,
+    _ConcurrentKeys,
+    _keys_are_valid,
     _raise_cannot_define_validate_object_and_validate_object_async,
     _raise_validate_object_async_in_sync_mode,
     _repr_helper,
@@ -33,7 +47,13 @@ from koda_validate._internal import (
     _wrap_async_validator,
     _wrap_sync_validator,
 )
-from koda_validate.base import Predicate, PredicateAsync, Validator
+from koda_validate.base import (
+    Predicate,
+    PredicateAsync,
+    Validator,
+    _fail_fast,
+    _no_passthrough,
+)
 from koda_validate.coerce import Coercer
 from koda_validate.errors import (
     CoercionErr,
@@ -61,6 +81,9 @@ class KeyNotRequired(Validator[Maybe[A]]):
         else:
             return result
 
+    def is_valid(self, val: Any) -> bool:
+        return self.validator.is_valid(val)
+
     def __call__(self, val: Any) -> ValidationResult[Maybe[A]]:
         result = self.validator(val)
         if result.is_valid:
@@ -98,24 +121,45 @@ class MapValidator(Validator[dict[T1, T2]]):
         predicates: Optional[list[Predicate[dict[T1, T2]]]] = None,
         predicates_async: Optional[list[PredicateAsync[dict[T1, T2]]]] = None,
         coerce: Optional[Coercer[dict[Any, Any]]] = None,
+        max_concurrency: Optional[int] = None,
+        max_errors: Optional[int] = None,
     ) -> None:
         self.key_validator = key
         self.value_validator = value
         self.predicates = predicates
         self.predicates_async = predicates_async
         self.coerce = coerce
+        self.max_concurrency = max_concurrency
+        _check_max_errors(max_errors)
+        self.max_errors = max_errors
+
+        self._concurrency = _Concurrency(max_concurrency, [key, value])
+        self._key_is_valid = key.is_valid
+        self._value_is_valid = value.is_valid
+        # these don't depend on the value being validated, so they can be shared
+        self._type_err = TypeErr(dict)
+        if coerce:
+            self._coercion_err = CoercionErr(coerce.compatible_types, dict)
+
+        # imported here to avoid circular imports
+        from koda_validate._tree import _is_non_transforming
+
+        # if the keys and values are returned unchanged, so can the dict be
+        self._passthrough = (
+            not coerce and _is_non_transforming(key) and _is_non_transforming(value)
+        )
 
     async def validate_async(self, val: Any) -> ValidationResult[dict[T1, T2]]:
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return Invalid(CoercionErr(self.coerce.compatible_types, dict), val, self)
+                return Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: dict[Any, Any] = coerced.val
 
         elif type(val) is dict:
             coerced_val = val
         else:
-            return Invalid(TypeErr(dict), val, self)
+            return Invalid(self._type_err, val, self)
 
         predicate_errors: list[
             Union[Predicate[dict[Any, Any]], PredicateAsync[dict[Any, Any]]]
@@ -138,25 +182,74 @@ class MapValidator(Validator[dict[T1, T2]]):
         if predicate_errors:
             return Invalid(PredicateErrs(predicate_errors), coerced_val, self)
 
+        concurrent_results: Optional[Iterator[ValidationResult[Any]]] = None
+        if self._concurrency.enabled:
+            # keys and values are interleaved
+            concurrent_results = await self._concurrency.results(
+                [
+                    call
+                    for key, val_ in coerced_val.items()
+                    for call in (
+                        (self.key_validator.validate_async, key),
+                        (self.value_validator.validate_async, val_),
+                    )
+                ]
+            )
+
+        passthrough = self._passthrough and not _no_passthrough.get()
         return_dict: dict[T1, T2] = {}
         errors: dict[Any, KeyValErrs] = {}
+        truncated = False
 
-        for key, val_ in coerced_val.items():
-            key_result = await self.key_validator.validate_async(key)
-            val_result = await self.value_validator.validate_async(val_)
+        for i, (key, val_) in enumerate(coerced_val.items()):
+            if concurrent_results is None:
+                key_result = await self.key_validator.validate_async(key)
+                val_result = await self.value_validator.validate_async(val_)
+            else:
+                key_result = next(concurrent_results)
+                val_result = next(concurrent_results)
 
             if key_result.is_valid and val_result.is_valid:
-                return_dict[key_result.val] = val_result.val
+                if not passthrough:
+                    return_dict[key_result.val] = val_result.val
             else:
                 errors[key] = KeyValErrs(
                     key=None if key_result.is_valid else key_result,
                     val=None if val_result.is_valid else val_result,
                 )
+                if _fail_fast.get():
+                    break
+                elif len(errors) == self.max_errors:
+                    truncated = i + 1 < len(coerced_val)
+                    break
 
         if errors:
-            return Invalid(MapErr(errors), coerced_val, self)
+            return Invalid(MapErr(errors, truncated=truncated), coerced_val, self)
         else:
-            return Valid(return_dict)
+            return Valid(coerced_val if passthrough else return_dict)
+
+    def is_valid(self, val: Any) -> bool:
+        if self.predicates_async:
+            _async_predicates_warning(self.__class__)
+
+        if self.coerce:
+            if not (coerced := self.coerce(val)).is_just:
+                return False
+            val = coerced.val
+        elif type(val) is not dict:
+            return False
+
+        if self.predicates is not None:
+            for predicate in self.predicates:
+                if not predicate(val):
+                    return False
+
+        key_is_valid = self._key_is_valid
+        value_is_valid = self._value_is_valid
+        for key, val_ in val.items():
+            if not (key_is_valid(key) and value_is_valid(val_)):
+                return False
+        return True
 
     def __call__(self, val: Any) -> ValidationResult[dict[T1, T2]]:
         if self.predicates_async:
@@ -164,14 +257,14 @@ class MapValidator(Validator[dict[T1, T2]]):
 
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return Invalid(CoercionErr(self.coerce.compatible_types, dict), val, self)
+                return Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: dict[Any, Any] = coerced.val
 
         elif type(val) is dict:
             coerced_val = val
         else:
-            return Invalid(TypeErr(dict), val, self)
+            return Invalid(self._type_err, val, self)
 
         predicate_errors: list[
             Union[Predicate[dict[Any, Any]], PredicateAsync[dict[Any, Any]]]
@@ -189,24 +282,32 @@ class MapValidator(Validator[dict[T1, T2]]):
         if predicate_errors:
             return Invalid(PredicateErrs(predicate_errors), coerced_val, self)
 
+        passthrough = self._passthrough and not _no_passthrough.get()
         return_dict: dict[T1, T2] = {}
         errors: dict[Any, KeyValErrs] = {}
-        for key, val_ in coerced_val.items():
+        truncated = False
+        for i, (key, val_) in enumerate(coerced_val.items()):
             key_result = self.key_validator(key)
             val_result = self.value_validator(val_)
 
             if key_result.is_valid and val_result.is_valid:
-                return_dict[key_result.val] = val_result.val
+                if not passthrough:
+                    return_dict[key_result.val] = val_result.val
             else:
                 errors[key] = KeyValErrs(
                     key=None if key_result.is_valid else key_result,
                     val=None if val_result.is_valid else val_result,
                 )
+                if _fail_fast.get():
+                    break
+                elif len(errors) == self.max_errors:
+                    truncated = i + 1 < len(coerced_val)
+                    break
 
         if errors:
-            return Invalid(MapErr(errors), coerced_val, self)
+            return Invalid(MapErr(errors, truncated=truncated), coerced_val, self)
         else:
-            return Valid(return_dict)
+            return Valid(coerced_val if passthrough else return_dict)
 
     def __eq__(self, other: Any) -> bool:
         return (
@@ -216,6 +317,8 @@ class MapValidator(Validator[dict[T1, T2]]):
             and self.predicates == other.predicates
             and self.predicates_async == other.predicates_async
             and self.coerce == other.coerce
+            and self.max_concurrency == other.max_concurrency
+            and self.max_errors == other.max_errors
         )
 
     def __repr__(self) -> str:
@@ -231,6 +334,8 @@ class MapValidator(Validator[dict[T1, T2]]):
                     ("predicates", self.predicates),
                     ("predicates_async", self.predicates_async),
                     ("coerce", self.coerce),
+                    ("max_concurrency", self.max_concurrency),
+                    ("max_errors", self.max_errors),
                 ]
                 if v
             ],
@@ -239,6 +344,7 @@ class MapValidator(Validator[dict[T1, T2]]):
 
 class IsDictValidator(_ToTupleValidator[dict[Any, Any]]):
     _instance: ClassVar[Optional["IsDictValidator"]] = None
+    _type_err: ClassVar[TypeErr] = TypeErr(dict)
 
     def __new__(cls) -> "IsDictValidator":
         # make a singleton
@@ -246,11 +352,14 @@ class IsDictValidator(_ToTupleValidator[dict[Any, Any]]):
             cls._instance = super(IsDictValidator, cls).__new__(cls)
         return cls._instance
 
+    def is_valid(self, val: Any) -> bool:
+        return isinstance(val, dict)
+
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[dict[Any, Any]]:
         if isinstance(val, dict):
             return True, val
         else:
-            return False, Invalid(TypeErr(dict), val, self)
+            return False, Invalid(self._type_err, val, self)
 
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[dict[Any, Any]]:
         return self._validate_to_tuple(val)
@@ -297,6 +406,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -314,6 +424,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -332,6 +443,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -351,6 +463,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -371,6 +484,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -392,6 +506,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -414,6 +529,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -437,6 +553,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -461,6 +578,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -486,6 +604,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -512,6 +631,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -539,6 +659,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -567,6 +688,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -598,6 +720,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -630,6 +753,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -663,6 +787,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -852,6 +977,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             Callable[[Ret], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         self.into = into
         # needs to be `Any` until we have variadic generics presumably
@@ -861,6 +987,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
         self.validate_object = validate_object
         self.validate_object_async = validate_object_async
         self.fail_on_unknown_keys = fail_on_unknown_keys
+        self.max_concurrency = max_concurrency
 
         self._disallow_synchronous = bool(validate_object_async)
 
@@ -874,19 +1001,41 @@ class RecordValidator(_ToTupleValidator[Ret]):
             tuple[Hashable, Callable[[Any], Awaitable[_ResultTuple[Any]]], bool]
         ] = []
 
+        self._fast_keys_is_valid: list[tuple[Hashable, Callable[[Any], bool], bool]] = []
+
         for key, val in keys:
             is_required = not isinstance(val, KeyNotRequired)
             self._fast_keys_sync.append((key, _wrap_sync_validator(val), is_required))
             self._fast_keys_async.append((key, _wrap_async_validator(val), is_required))
+            self._fast_keys_is_valid.append((key, val.is_valid, is_required))
             self._key_set.add(key)
 
+        self._concurrent_keys = _ConcurrentKeys(
+            max_concurrency,
+            self._fast_keys_async,
+            [validator for _, validator in keys],
+        )
         self._unknown_keys_err: ExtraKeysErr = ExtraKeysErr(self._key_set)
+        self._type_err = TypeErr(dict)
+
+    def is_valid(self, data: Any) -> bool:
+        if self._disallow_synchronous:
+            _raise_validate_object_async_in_sync_mode(self.__class__)
+        elif self.validate_object is not None:
+            # `validate_object` needs the valid object
+            return self._validate_to_tuple(data)[0]
+
+        return (
+            isinstance(data, dict)
+            and not (self.fail_on_unknown_keys and not self._key_set.issuperset(data))
+            and _keys_are_valid(self._fast_keys_is_valid, data)
+        )
 
     def _validate_to_tuple(self, data: Any) -> _ResultTuple[Ret]:
         if self._disallow_synchronous:
             _raise_validate_object_async_in_sync_mode(self.__class__)
         if not isinstance(data, dict):
-            return False, Invalid(TypeErr(dict), data, self)
+            return False, Invalid(self._type_err, data, self)
 
         if self.fail_on_unknown_keys:
             for key_ in data:
@@ -899,6 +1048,8 @@ class RecordValidator(_ToTupleValidator[Ret]):
             if key_ not in data:
                 if key_required:
                     errs[key_] = Invalid(MissingKeyErr(), data, self)
+                    if _fail_fast.get():
+                        break
                 elif not errs:
                     args.append(nothing)
             else:
@@ -906,6 +1057,8 @@ class RecordValidator(_ToTupleValidator[Ret]):
 
                 if not success:
                     errs[key_] = new_val
+                    if _fail_fast.get():
+                        break
                 elif not errs:
                     args.append(new_val)
 
@@ -919,7 +1072,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
 
     async def _validate_to_tuple_async(self, data: Any) -> _ResultTuple[Ret]:
         if not isinstance(data, dict):
-            return False, Invalid(TypeErr(dict), data, self)
+            return False, Invalid(self._type_err, data, self)
 
         if self.fail_on_unknown_keys:
             for key_ in data:
@@ -928,17 +1081,30 @@ class RecordValidator(_ToTupleValidator[Ret]):
 
         args: list[Any] = []
         errs: dict[Any, Invalid] = {}
+        concurrent_results = (
+            await self._concurrent_keys.key_results(data)
+            if self._concurrent_keys.enabled
+            else None
+        )
         for key_, async_validator, key_required in self._fast_keys_async:
             if key_ not in data:
                 if key_required:
                     errs[key_] = Invalid(MissingKeyErr(), data, self)
+                    if _fail_fast.get():
+                        break
                 else:
                     args.append(nothing)
             else:
-                success, new_val = await async_validator(data[key_])
+                success, new_val = (
+                    await async_validator(data[key_])
+                    if concurrent_results is None
+                    else next(concurrent_results)
+                )
 
                 if not success:
                     errs[key_] = new_val
+                    if _fail_fast.get():
+                        break
                 elif not errs:
                     args.append(new_val)
 
@@ -963,6 +1129,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
             and self.validate_object == other.validate_object
             and self.validate_object_async == other.validate_object_async
             and self.fail_on_unknown_keys == other.fail_on_unknown_keys
+            and self.max_concurrency == other.max_concurrency
         )
 
     def __repr__(self) -> str:
@@ -978,6 +1145,7 @@ class RecordValidator(_ToTupleValidator[Ret]):
                     # by default we don't fail on extra keys, so we don't
                     # show this in the repr if the default is defined
                     ("fail_on_unknown_keys", self.fail_on_unknown_keys),
+                    ("max_concurrency", self.max_concurrency),
                 ]
                 if v
             ],
@@ -1017,6 +1185,7 @@ class DictValidatorAny(_ToTupleValidator[dict[Any, Any]]):
             ]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         self.schema: dict[Any, Validator[Any]] = schema
         self.validate_object = validate_object
@@ -1025,12 +1194,14 @@ class DictValidatorAny(_ToTupleValidator[dict[Any, Any]]):
         if validate_object is not None and validate_object_async is not None:
             _raise_cannot_define_validate_object_and_validate_object_async()
         self.fail_on_unknown_keys = fail_on_unknown_keys
+        self.max_concurrency = max_concurrency
 
         self._disallow_synchronous = bool(validate_object_async)
 
         # so we don't need to calculate each time we validate
         self._fast_keys_sync = []
         self._fast_keys_async = []
+        self._fast_keys_is_valid: list[tuple[Hashable, Callable[[Any], bool], bool]] = []
         self._keys_set = set()
         for key, val in schema.items():
             self._keys_set.add(key)
@@ -1045,45 +1216,88 @@ class DictValidatorAny(_ToTupleValidator[dict[Any, Any]]):
             self._fast_keys_async.append(
                 (key, _wrap_async_validator(vldtr), not is_not_required)
             )
+            self._fast_keys_is_valid.append((key, vldtr.is_valid, not is_not_required))
 
+        self._concurrent_keys = _ConcurrentKeys(
+            max_concurrency, self._fast_keys_async, list(schema.values())
+        )
         self._unknown_keys_err = ExtraKeysErr(set(schema.keys()))
+        self._type_err = TypeErr(dict)
+
+        # imported here to avoid circular imports
+        from koda_validate._tree import _is_non_transforming
+
+        # if the values are returned unchanged, so can the dict be (as long as it
+        # doesn't have any unknown keys)
+        self._passthrough = all(
+            _is_non_transforming(
+                val.validator if isinstance(val, KeyNotRequired) else val
+            )
+            for val in schema.values()
+        )
+
+    def is_valid(self, data: Any) -> bool:
+        if self._disallow_synchronous:
+            _raise_validate_object_async_in_sync_mode(self.__class__)
+        elif self.validate_object is not None:
+            # `validate_object` needs the valid dict
+            return self._validate_to_tuple(data)[0]
+
+        return (
+            type(data) is dict
+            and not (self.fail_on_unknown_keys and not self._keys_set.issuperset(data))
+            and _keys_are_valid(self._fast_keys_is_valid, data)
+        )
 
     def _validate_to_tuple(self, data: Any) -> _ResultTuple[dict[Any, Any]]:
         if self._disallow_synchronous:
             _raise_validate_object_async_in_sync_mode(self.__class__)
 
         if not type(data) is dict:
-            return False, Invalid(TypeErr(dict), data, self)
+            return False, Invalid(self._type_err, data, self)
 
         if self.fail_on_unknown_keys:
             for key_ in data:
                 if key_ not in self._keys_set:
                     return False, Invalid(self._unknown_keys_err, data, self)
 
+        passthrough = (
+            self._passthrough
+            and not _no_passthrough.get()
+            and (self.fail_on_unknown_keys or self._keys_set.issuperset(data))
+        )
         success_dict: dict[Any, Any] = {}
         errs: dict[Any, Invalid] = {}
         for key_, validator, key_required in self._fast_keys_sync:
             if key_ not in data:
                 if key_required:
                     errs[key_] = Invalid(missing_key_err, data, self)
+                    if _fail_fast.get():
+                        break
             else:
                 success, new_val = validator(data[key_])
 
                 if not success:
                     errs[key_] = new_val
-                elif not errs:
+                    if _fail_fast.get():
+                        break
+                elif not (errs or passthrough):
                     success_dict[key_] = new_val
 
         if errs:
             return False, Invalid(KeyErrs(errs), data, self)
-        elif self.validate_object and (result := self.validate_object(success_dict)):
+
+        if passthrough:
+            success_dict = data
+
+        if self.validate_object and (result := self.validate_object(success_dict)):
             return False, Invalid(result, success_dict, self)
 
         return True, success_dict
 
     async def _validate_to_tuple_async(self, data: Any) -> _ResultTuple[dict[Any, Any]]:
         if not type(data) is dict:
-            return False, Invalid(TypeErr(dict), data, self)
+            return False, Invalid(self._type_err, data, self)
 
         if self.fail_on_unknown_keys:
             # this seems to be faster than `for key_ in data.keys()`
@@ -1091,23 +1305,45 @@ class DictValidatorAny(_ToTupleValidator[dict[Any, Any]]):
                 if key_ not in self._keys_set:
                     return False, Invalid(self._unknown_keys_err, data, self)
 
+        passthrough = (
+            self._passthrough
+            and not _no_passthrough.get()
+            and (self.fail_on_unknown_keys or self._keys_set.issuperset(data))
+        )
         success_dict: dict[Any, Any] = {}
         errs: dict[Any, Invalid] = {}
+        concurrent_results = (
+            await self._concurrent_keys.key_results(data)
+            if self._concurrent_keys.enabled
+            else None
+        )
         for key_, validator, key_required in self._fast_keys_async:
             if key_ not in data:
                 if key_required:
                     errs[key_] = Invalid(missing_key_err, data, self)
+                    if _fail_fast.get():
+                        break
             else:
-                success, new_val = await validator(data[key_])
+                success, new_val = (
+                    await validator(data[key_])
+                    if concurrent_results is None
+                    else next(concurrent_results)
+                )
 
                 if not success:
                     errs[key_] = new_val
-                elif not errs:
+                    if _fail_fast.get():
+                        break
+                elif not (errs or passthrough):
                     success_dict[key_] = new_val
 
         if errs:
             return False, Invalid(KeyErrs(errs), data, self)
-        elif self.validate_object and (result := self.validate_object(success_dict)):
+
+        if passthrough:
+            success_dict = data
+
+        if self.validate_object and (result := self.validate_object(success_dict)):
             return False, Invalid(result, success_dict, self)
         elif self.validate_object_async and (
             result := await self.validate_object_async(success_dict)
@@ -1123,6 +1359,7 @@ class DictValidatorAny(_ToTupleValidator[dict[Any, Any]]):
             and self.validate_object == other.validate_object
             and self.validate_object_async == other.validate_object_async
             and self.fail_on_unknown_keys == other.fail_on_unknown_keys
+            and self.max_concurrency == other.max_concurrency
         )
 
     def __repr__(self) -> str:
@@ -1138,6 +1375,7 @@ class DictValidatorAny(_ToTupleValidator[dict[Any, Any]]):
                     # by default we don't fail on extra keys, so we don't
                     # show this in the repr if the default is defined
                     ("fail_on_unknown_keys", self.fail_on_unknown_keys),
+                    ("max_concurrency", self.max_concurrency),
                 ]
                 if v
             ],
@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, Hashable, Optional, Type, Union
 
@@ -7,8 +8,12 @@ from koda_validate.base import Predicate, PredicateAsync
 if TYPE_CHECKING:
     from koda_validate.valid import Invalid
 
+# Results and errors can be very numerous, so they don't have a ``__dict__`` where
+# ``dataclass`` supports it (Python 3.10+)
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class CoercionErr:
     """
     Similar to a TypeErr, but when one or more types can be
@@ -19,7 +24,7 @@ class CoercionErr:
     dest_type: Type[Any]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ContainerErr:
     """
     This is for simple containers like `Maybe` or `Result`
@@ -28,7 +33,7 @@ class ContainerErr:
     child: "Invalid"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ExtraKeysErr:
     """
     extra keys were present in a dictionary
@@ -37,7 +42,7 @@ class ExtraKeysErr:
     expected_keys: set[Hashable]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class KeyErrs:
     """
     validation failures for key/value pairs on a record-like
@@ -47,7 +52,7 @@ class KeyErrs:
     keys: dict[Any, "Invalid"]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class KeyValErrs:
     """
     Key and/or value errors from a single key/value pair. This
@@ -58,13 +63,15 @@ class KeyValErrs:
     val: Optional["Invalid"]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MapErr:
     """
-    errors from key/value pairs of a map-like dictionary
+    errors from key/value pairs of a map-like dictionary. ``truncated`` is ``True``
+    if validation stopped at ``max_errors`` errors, before all pairs were validated
     """
 
     keys: dict[Any, KeyValErrs]
+    truncated: bool = False
 
 
 class MissingKeyErr:
@@ -72,6 +79,8 @@ class MissingKeyErr:
     A key is missing from a dictionary
     """
 
+    __slots__ = ()
+
     _instance: ClassVar[Optional["MissingKeyErr"]] = None
 
     def __new__(cls) -> "MissingKeyErr":
@@ -87,25 +96,29 @@ class MissingKeyErr:
 missing_key_err = MissingKeyErr()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class IndexErrs:
     """
-    dictionary of validation errors by index
+    dictionary of validation errors by index. ``truncated`` is ``True`` if
+    validation stopped at ``max_errors`` errors, before all items were validated
     """
 
     indexes: dict[int, "Invalid"]
+    truncated: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SetErrs:
     """
-    Errors from items in a set.
+    Errors from items in a set. ``truncated`` is ``True`` if validation stopped at
+    ``max_errors`` errors, before all items were validated.
     """
 
     item_errs: list["Invalid"]
+    truncated: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UnionErrs:
     """
     Errors from each variant of a union.
@@ -114,7 +127,7 @@ class UnionErrs:
     variants: list["Invalid"]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PredicateErrs(Generic[A]):
     """
     A grouping of failed Predicates
@@ -129,10 +142,10 @@ class ValidationErrBase:
     for custom error types
     """
 
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class TypeErr:
     """
     A specific type was required but not found
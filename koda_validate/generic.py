@@ -1,21 +1,39 @@
 from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, ClassVar, Hashable, Optional, Type, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Hashable,
+    Optional,
+    Type,
+    TypeVar,
+)
 from uuid import UUID
 
 from koda import Thunk
 
 from koda_validate._generics import A, Ret
-from koda_validate._internal import _ResultTuple, _ToTupleValidator
-from koda_validate.base import Predicate, Processor, Validator
+from koda_validate._internal import (
+    _LazyInvalid,
+    _ResultTuple,
+    _ToTupleValidator,
+    _wrap_async_validator,
+    _wrap_sync_validator,
+)
+from koda_validate.base import Predicate, Processor, Validator, _fail_fast
 from koda_validate.errors import PredicateErrs, TypeErr
-from koda_validate.valid import Invalid, ValidationResult
+from koda_validate.valid import Invalid
 
 
-class Lazy(Validator[Ret]):
+class Lazy(_ToTupleValidator[Ret]):
     """
     Allows for specification of mutually recursive type definitions.
+
+    ``validator`` is only called the first time a value is validated; the validator it
+    returns is used from then on.
     """
 
     __match_args__ = (
@@ -23,6 +41,10 @@ class Lazy(Validator[Ret]):
         "recurrent",
     )
 
+    # set when the validator is resolved
+    _validator_sync: Callable[[Any], _ResultTuple[Ret]]
+    _validator_async: Callable[[Any], Awaitable[_ResultTuple[Ret]]]
+
     def __init__(
         self,
         validator: Thunk[Validator[Ret]],
@@ -36,12 +58,28 @@ class Lazy(Validator[Ret]):
         """
         self.validator = validator
         self.recurrent = recurrent
+        self._resolved: Optional[Validator[Ret]] = None
+
+    def _resolve(self) -> Validator[Ret]:
+        if self._resolved is None:
+            resolved = self.validator()
+            self._validator_sync = _wrap_sync_validator(resolved)
+            self._validator_async = _wrap_async_validator(resolved)
+            self._resolved = resolved
+        return self._resolved
+
+    async def _validate_to_tuple_async(self, data: Any) -> _ResultTuple[Ret]:
+        if self._resolved is None:
+            self._resolve()
+        return await self._validator_async(data)
 
-    async def validate_async(self, data: Any) -> ValidationResult[Ret]:
-        return await self.validator().validate_async(data)
+    def _validate_to_tuple(self, data: Any) -> _ResultTuple[Ret]:
+        if self._resolved is None:
+            self._resolve()
+        return self._validator_sync(data)
 
-    def __call__(self, data: Any) -> ValidationResult[Ret]:
-        return self.validator()(data)
+    def is_valid(self, data: Any) -> bool:
+        return self._resolve().is_valid(data)
 
     def __eq__(self, other: Any) -> bool:
         return (
@@ -54,6 +92,127 @@ class Lazy(Validator[Ret]):
         return f"Lazy({repr(self.validator)}, recurrent={repr(self.recurrent)})"
 
 
+class FailFastValidator(_ToTupleValidator[A]):
+    """
+    Stops validation at the first error, anywhere within ``validator``. Container and
+    record-like validators nested inside it -- at any depth -- return as soon as one
+    key or item is invalid, instead of validating the rest. The resulting
+    :class:`Invalid` only describes the path to that first error.
+
+    This is useful when only validity matters, and invalid values may be large. For
+    instance, a list of 10,000 invalid items fails after validating the first one.
+
+    .. testsetup:: failfast
+
+        from koda_validate import *
+
+    .. doctest:: failfast
+
+        >>> validator = ListValidator(IntValidator())
+        >>> list(validator([1, "2", "3"]).err_type.indexes)
+        [1, 2]
+        >>> list(FailFastValidator(validator)([1, "2", "3"]).err_type.indexes)
+        [1]
+
+    :param validator: the validator to stop early
+    """
+
+    __match_args__ = ("validator",)
+
+    def __init__(self, validator: Validator[A]) -> None:
+        self.validator = validator
+        self._validator_sync = _wrap_sync_validator(validator)
+        self._validator_async = _wrap_async_validator(validator)
+
+    def is_valid(self, val: Any) -> bool:
+        # no errors are built, so there's nothing to stop early
+        return self.validator.is_valid(val)
+
+    def _validate_to_tuple(self, val: Any) -> _ResultTuple[A]:
+        token = _fail_fast.set(True)
+        try:
+            return self._validator_sync(val)
+        finally:
+            _fail_fast.reset(token)
+
+    async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[A]:
+        # tasks created within (for concurrent validation) inherit the context
+        token = _fail_fast.set(True)
+        try:
+            return await self._validator_async(val)
+        finally:
+            _fail_fast.reset(token)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) == type(other) and self.validator == other.validator
+
+    def __repr__(self) -> str:
+        return f"FailFastValidator({repr(self.validator)})"
+
+
+class LazyErrorsValidator(_ToTupleValidator[A]):
+    """
+    Only works out the details of errors if they're accessed. When validating
+    synchronously, ``validator`` stops at the first error (like
+    :class:`FailFastValidator`), and the :class:`Invalid` returned validates the value
+    again -- to build the full ``err_type`` -- the first time its attributes are
+    accessed. ``validator`` should give the same result each time it's called with
+    the same value, and the value shouldn't be changed before the errors are
+    accessed; otherwise the (fail-fast) errors found the first time are used.
+
+    This is useful when invalid results are usually only checked with ``.is_valid``
+    and then discarded, e.g. for a variant of a :class:`UnionValidator` which is
+    usually followed by a valid one. ``validate_async`` is not affected.
+
+    .. testsetup:: lazyerrors
+
+        from koda_validate import *
+
+    .. doctest:: lazyerrors
+
+        >>> validator = LazyErrorsValidator(ListValidator(IntValidator()))
+        >>> result = validator([1, "2", "3"])
+        >>> result.is_valid
+        False
+        >>> list(result.err_type.indexes)
+        [1, 2]
+
+    :param validator: the validator to build errors lazily for
+    """
+
+    __match_args__ = ("validator",)
+
+    def __init__(self, validator: Validator[A]) -> None:
+        self.validator = validator
+        self._validator_sync = _wrap_sync_validator(validator)
+        self._validator_async = _wrap_async_validator(validator)
+
+    def is_valid(self, val: Any) -> bool:
+        return self.validator.is_valid(val)
+
+    def _validate_to_tuple(self, val: Any) -> _ResultTuple[A]:
+        fail_fast = _fail_fast.get()
+        token = _fail_fast.set(True)
+        try:
+            result = self._validator_sync(val)
+        finally:
+            _fail_fast.reset(token)
+        if result[0] or fail_fast:
+            # in fail-fast mode, these are the errors we would build anyway
+            return result
+        else:
+            return False, _LazyInvalid(self.validator, val, result[1])
+
+    async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[A]:
+        return await self._validator_async(val)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) == type(other) and self.validator == other.validator
+
+    def __repr__(self) -> str:
+        return f"LazyErrorsValidator({repr(self.validator)})"
+
+
 ChoiceT = TypeVar("ChoiceT", bound=Hashable)
 
 
@@ -150,12 +309,21 @@ class EqualsValidator(_ToTupleValidator[ExactMatchT]):
         self.match = match
         self.preprocessors = preprocessors
         self.predicate: EqualTo[ExactMatchT] = EqualTo(match)
+        self._type_err = TypeErr(type(match))
 
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[ExactMatchT]:
         return self._validate_to_tuple(val)
 
+    def is_valid(self, val: Any) -> bool:
+        if type(self.match) != type(val):
+            return False
+        if self.preprocessors:
+            for preprocess in self.preprocessors:
+                val = preprocess(val)
+        return self.predicate(val)
+
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[ExactMatchT]:
-        if (match_type := type(self.match)) == type(val):
+        if type(self.match) == type(val):
             if self.preprocessors:
                 for preprocess in self.preprocessors:
                     val = preprocess(val)
@@ -165,7 +333,7 @@ class EqualsValidator(_ToTupleValidator[ExactMatchT]):
             else:
                 return False, Invalid(PredicateErrs([self.predicate]), val, self)
         else:
-            return False, Invalid(TypeErr(match_type), val, self)
+            return False, Invalid(self._type_err, val, self)
 
 
 class AlwaysValid(_ToTupleValidator[A]):
@@ -183,6 +351,9 @@ class AlwaysValid(_ToTupleValidator[A]):
             cls._instance = super(AlwaysValid, cls).__new__(cls)
         return cls._instance
 
+    def is_valid(self, val: Any) -> bool:
+        return True
+
     def _validate_to_tuple(self, val: A) -> _ResultTuple[A]:
         return True, val
 
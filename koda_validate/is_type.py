@@ -1,8 +1,8 @@
 from typing import Optional, Type
 
-from koda_validate import Predicate, PredicateAsync, Processor
 from koda_validate._generics import SuccessT
 from koda_validate._internal import _ToTupleStandardValidator
+from koda_validate.base import Predicate, PredicateAsync, Processor
 from koda_validate.coerce import Coercer
 
 
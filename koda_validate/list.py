@@ -3,13 +3,22 @@ from typing import Any, Optional, Union
 from koda_validate._generics import A
 from koda_validate._internal import (
     _async_predicates_warning,
+    _check_max_errors,
+    _Concurrency,
     _repr_helper,
     _ResultTuple,
     _ToTupleValidator,
     _wrap_async_validator,
     _wrap_sync_validator,
 )
-from koda_validate.base import Predicate, PredicateAsync, Validator
+from koda_validate._vectorized import VECTORIZE_MIN_LEN, _vectorized_items
+from koda_validate.base import (
+    Predicate,
+    PredicateAsync,
+    Validator,
+    _fail_fast,
+    _no_passthrough,
+)
 from koda_validate.coerce import Coercer
 from koda_validate.errors import CoercionErr, IndexErrs, PredicateErrs, TypeErr
 from koda_validate.valid import Invalid
@@ -25,15 +34,62 @@ class ListValidator(_ToTupleValidator[list[A]]):
         predicates: Optional[list[Predicate[list[A]]]] = None,
         predicates_async: Optional[list[PredicateAsync[list[A]]]] = None,
         coerce: Optional[Coercer[list[Any]]] = None,
+        max_concurrency: Optional[int] = None,
+        max_errors: Optional[int] = None,
     ) -> None:
         self.item_validator = item_validator
         self.predicates = predicates
         self.predicates_async = predicates_async
         self._disallow_synchronous = bool(predicates_async)
         self.coerce = coerce
+        self.max_concurrency = max_concurrency
+        _check_max_errors(max_errors)
+        self.max_errors = max_errors
 
         self._wrapped_item_validator_sync = _wrap_sync_validator(item_validator)
+        self._item_is_valid = item_validator.is_valid
         self._wrapped_item_validator_async = _wrap_async_validator(item_validator)
+        self._vectorized_items = _vectorized_items(item_validator)
+        self._concurrency = _Concurrency(max_concurrency, [item_validator])
+        # these don't depend on the value being validated, so they can be shared
+        self._type_err = TypeErr(list)
+        if coerce:
+            self._coercion_err = CoercionErr(coerce.compatible_types, list)
+
+        # imported here to avoid circular imports
+        from koda_validate._tree import _is_non_transforming
+
+        # if the items are returned unchanged, so can the list be
+        self._passthrough = not coerce and _is_non_transforming(item_validator)
+
+    def is_valid(self, val: Any) -> bool:
+        if self._disallow_synchronous:
+            _async_predicates_warning(self.__class__)
+
+        if self.coerce:
+            if not (coerced := self.coerce(val)).is_just:
+                return False
+            val = coerced.val
+        elif type(val) is not list:
+            return False
+
+        if self.predicates:
+            for pred in self.predicates:
+                if not pred(val):
+                    return False
+
+        if (
+            self._vectorized_items is not None
+            and len(val) >= VECTORIZE_MIN_LEN
+            and (all_valid := self._vectorized_items.is_valid(val)) is not None
+        ):
+            return all_valid
+
+        item_is_valid = self._item_is_valid
+        for item in val:
+            if not item_is_valid(item):
+                return False
+        return True
 
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[list[A]]:
         if self._disallow_synchronous:
@@ -41,16 +97,14 @@ class ListValidator(_ToTupleValidator[list[A]]):
 
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, list), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: list[Any] = coerced.val
 
         elif type(val) is list:
             coerced_val = val
         else:
-            return False, Invalid(TypeErr(list), val, self)
+            return False, Invalid(self._type_err, val, self)
 
         if self.predicates:
             list_errors: list[Union[Predicate[list[A]], PredicateAsync[list[A]]]] = [
@@ -60,34 +114,57 @@ class ListValidator(_ToTupleValidator[list[A]]):
             if list_errors:
                 return False, Invalid(PredicateErrs(list_errors), coerced_val, self)
 
+        passthrough = self._passthrough and not _no_passthrough.get()
+
+        if (
+            self._vectorized_items is not None
+            and len(coerced_val) >= VECTORIZE_MIN_LEN
+            and (
+                vectorized_errs := self._vectorized_items.validate(
+                    coerced_val, self.max_errors
+                )
+            )
+            is not None
+        ):
+            if vectorized_errs.indexes:
+                return False, Invalid(vectorized_errs, coerced_val, self)
+            else:
+                return True, coerced_val if passthrough else coerced_val.copy()
+
         return_list: list[A] = []
         index_errs: dict[int, Invalid] = {}
+        truncated = False
         for i, item in enumerate(coerced_val):
             is_valid, item_result = self._wrapped_item_validator_sync(item)
 
             if not is_valid:
                 index_errs[i] = item_result  # type: ignore
-            elif not index_errs:
+                if _fail_fast.get():
+                    break
+                elif len(index_errs) == self.max_errors:
+                    truncated = i + 1 < len(coerced_val)
+                    break
+            elif not (index_errs or passthrough):
                 return_list.append(item_result)  # type: ignore
 
         if index_errs:
-            return False, Invalid(IndexErrs(index_errs), coerced_val, self)
+            return False, Invalid(
+                IndexErrs(index_errs, truncated=truncated), coerced_val, self
+            )
         else:
-            return True, return_list
+            return True, coerced_val if passthrough else return_list
 
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[list[A]]:
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, list), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: list[Any] = coerced.val
 
         elif type(val) is list:
             coerced_val = val
         else:
-            return False, Invalid(TypeErr(list), val, self)
+            return False, Invalid(self._type_err, val, self)
 
         predicate_errors: list[
             Union[Predicate[list[Any]], PredicateAsync[list[Any]]]
@@ -105,23 +182,57 @@ class ListValidator(_ToTupleValidator[list[A]]):
         if predicate_errors:
             return False, Invalid(PredicateErrs(predicate_errors), coerced_val, self)
 
+        passthrough = self._passthrough and not _no_passthrough.get()
+
+        if (
+            self._vectorized_items is not None
+            and len(coerced_val) >= VECTORIZE_MIN_LEN
+            and (
+                vectorized_errs := self._vectorized_items.validate(
+                    coerced_val, self.max_errors
+                )
+            )
+            is not None
+        ):
+            if vectorized_errs.indexes:
+                return False, Invalid(vectorized_errs, coerced_val, self)
+            else:
+                return True, coerced_val if passthrough else coerced_val.copy()
+
+        concurrent_results = (
+            await self._concurrency.results(
+                [(self._wrapped_item_validator_async, item) for item in coerced_val]
+            )
+            if self._concurrency.enabled
+            else None
+        )
+
         return_list: list[A] = []
         index_errs = {}
+        truncated = False
         for i, item in enumerate(coerced_val):
-            (
-                is_valid,
-                item_result,
-            ) = await self._wrapped_item_validator_async(item)
+            (is_valid, item_result) = (
+                await self._wrapped_item_validator_async(item)
+                if concurrent_results is None
+                else next(concurrent_results)
+            )
 
             if not is_valid:
                 index_errs[i] = item_result
-            elif not index_errs:
+                if _fail_fast.get():
+                    break
+                elif len(index_errs) == self.max_errors:
+                    truncated = i + 1 < len(coerced_val)
+                    break
+            elif not (index_errs or passthrough):
                 return_list.append(item_result)  # type: ignore
 
         if index_errs:
-            return False, Invalid(IndexErrs(index_errs), coerced_val, self)  # type: ignore  # noqa: E501
+            return False, Invalid(
+                IndexErrs(index_errs, truncated=truncated), coerced_val, self  # type: ignore  # noqa: E501
+            )
         else:
-            return True, return_list
+            return True, coerced_val if passthrough else return_list
 
     def __eq__(self, other: Any) -> bool:
         return (
@@ -130,6 +241,8 @@ class ListValidator(_ToTupleValidator[list[A]]):
             and self.predicates == other.predicates
             and self.predicates_async == other.predicates_async
             and self.coerce == other.coerce
+            and self.max_concurrency == other.max_concurrency
+            and self.max_errors == other.max_errors
         )
 
     def __repr__(self) -> str:
@@ -142,6 +255,8 @@ class ListValidator(_ToTupleValidator[list[A]]):
                     ("predicates", self.predicates),
                     ("predicates_async", self.predicates_async),
                     ("coerce", self.coerce),
+                    ("max_concurrency", self.max_concurrency),
+                    ("max_errors", self.max_errors),
                 ]
                 if v
             ],
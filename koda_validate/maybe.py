@@ -13,6 +13,8 @@ from koda_validate.base import Validator
 from koda_validate.errors import ContainerErr, TypeErr
 from koda_validate.valid import Invalid
 
+_maybe_type_err = TypeErr(Maybe[Any])  # type: ignore[misc]
+
 
 class MaybeValidator(_ToTupleValidator[Maybe[A]]):
     __match_args__ = ("validator",)
@@ -32,7 +34,10 @@ class MaybeValidator(_ToTupleValidator[Maybe[A]]):
             else:
                 return False, Invalid(ContainerErr(result[1]), val, self)
         else:
-            return False, Invalid(TypeErr(Maybe[Any]), val, self)  # type: ignore[misc]
+            return False, Invalid(_maybe_type_err, val, self)
+
+    def is_valid(self, val: Any) -> bool:
+        return val is nothing or (type(val) is Just and self.validator.is_valid(val.val))
 
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[Maybe[A]]:
         if val is nothing:
@@ -44,7 +49,7 @@ class MaybeValidator(_ToTupleValidator[Maybe[A]]):
             else:
                 return False, Invalid(ContainerErr(result[1]), val, self)
         else:
-            return False, Invalid(TypeErr(Maybe[Any]), val, self)  # type: ignore[misc]
+            return False, Invalid(_maybe_type_err, val, self)
 
     def __eq__(self, other: Any) -> bool:
         return type(self) == type(other) and self.validator == other.validator
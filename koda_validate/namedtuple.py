@@ -4,6 +4,7 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    Hashable,
     NamedTuple,
     Optional,
     Type,
@@ -14,6 +15,8 @@ from typing import (
 from koda import Just, Maybe, nothing
 
 from koda_validate._internal import (
+    _ConcurrentKeys,
+    _keys_are_valid,
     _raise_cannot_define_validate_object_and_validate_object_async,
     _raise_validate_object_async_in_sync_mode,
     _repr_helper,
@@ -22,7 +25,7 @@ from koda_validate._internal import (
     _wrap_async_validator,
     _wrap_sync_validator,
 )
-from koda_validate.base import Validator
+from koda_validate.base import Validator, _fail_fast
 from koda_validate.coerce import Coercer
 from koda_validate.errors import (
     CoercionErr,
@@ -86,6 +89,9 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
         types
     :param fail_on_unknown_keys: if True, this will fail if any keys not defined by
         ``self.data_cls`` are found. This will fail before any values are validated.
+    :param max_concurrency: if set, ``validate_async`` validates the values of keys
+        concurrently, with up to this many running at once. Keys are still validated
+        one at a time if none of their validators do any asynchronous work.
     :param coerce: a function that can control coercion
     :raises TypeError: should raise if non-``NamedTuple`` type is passed for
         ``named_tuple_cls``
@@ -103,12 +109,14 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
             Callable[[_NTT], Awaitable[Optional[ErrType]]]
         ] = None,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
         typehint_resolver: Callable[[Any], Validator[Any]] = get_typehint_validator,
         coerce: Optional[Coercer[dict[Any, Any]]] = None,
     ) -> None:
         self.named_tuple_cls = named_tuple_cls
         self.overrides = overrides
         self.fail_on_unknown_keys = fail_on_unknown_keys
+        self.max_concurrency = max_concurrency
         self.coerce = coerce
 
         if validate_object and validate_object_async:
@@ -143,6 +151,7 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
         self._keys_set = set()
         self._fast_keys_sync = []
         self._fast_keys_async = []
+        self._fast_keys_is_valid: list[tuple[Hashable, Callable[[Any], bool], bool]] = []
         for key, val in self.schema.items():
             self._keys_set.add(key)
             is_required = key not in keys_with_defaults
@@ -150,8 +159,39 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
                 self.required_fields.append(key)
             self._fast_keys_sync.append((key, _wrap_sync_validator(val), is_required))
             self._fast_keys_async.append((key, _wrap_async_validator(val), is_required))
+            self._fast_keys_is_valid.append((key, val.is_valid, is_required))
 
+        self._concurrent_keys = _ConcurrentKeys(
+            max_concurrency, self._fast_keys_async, list(self.schema.values())
+        )
         self._unknown_keys_err: ExtraKeysErr = ExtraKeysErr(set(self.schema.keys()))
+        self._cls_coercion_err = CoercionErr(
+            {dict, self.named_tuple_cls}, self.named_tuple_cls
+        )
+        if coerce:
+            self._coercion_err = CoercionErr(coerce.compatible_types, dict)
+
+    def is_valid(self, val: Any) -> bool:
+        if self._disallow_synchronous:
+            _raise_validate_object_async_in_sync_mode(self.__class__)
+        elif self.validate_object is not None:
+            # `validate_object` needs the valid object
+            return self._validate_to_tuple(val)[0]
+
+        if self.coerce:
+            if not (coerced := self.coerce(val)).is_just:
+                return False
+            data: dict[Any, Any] = coerced.val
+        elif type(val) is dict:
+            data = val
+        elif type(val) is self.named_tuple_cls:
+            data = val._asdict()
+        else:
+            return False
+
+        return not (
+            self.fail_on_unknown_keys and not self._keys_set.issuperset(data)
+        ) and _keys_are_valid(self._fast_keys_is_valid, data)
 
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[_NTT]:
         if self._disallow_synchronous:
@@ -159,9 +199,7 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
 
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, dict), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: dict[Any, Any] = coerced.val
 
@@ -170,14 +208,7 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
         elif type(val) is self.named_tuple_cls:
             coerced_val = val._asdict()
         else:
-            return False, Invalid(
-                CoercionErr(
-                    {dict, self.named_tuple_cls},
-                    self.named_tuple_cls,
-                ),
-                val,
-                self,
-            )
+            return False, Invalid(self._cls_coercion_err, val, self)
 
         if self.fail_on_unknown_keys:
             for key_ in coerced_val:
@@ -190,11 +221,15 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
             if key_ not in coerced_val:
                 if key_required:
                     errs[key_] = Invalid(missing_key_err, coerced_val, self)
+                    if _fail_fast.get():
+                        break
             else:
                 success, new_val = validator(coerced_val[key_])
 
                 if not success:
                     errs[key_] = new_val
+                    if _fail_fast.get():
+                        break
                 elif not errs:
                     success_dict[key_] = new_val
 
@@ -210,9 +245,7 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[_NTT]:
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, dict), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: dict[Any, Any] = coerced.val
 
@@ -221,14 +254,7 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
         elif type(val) is self.named_tuple_cls:
             coerced_val = val._asdict()
         else:
-            return False, Invalid(
-                CoercionErr(
-                    {dict, self.named_tuple_cls},
-                    self.named_tuple_cls,
-                ),
-                val,
-                self,
-            )
+            return False, Invalid(self._cls_coercion_err, val, self)
 
         if self.fail_on_unknown_keys:
             for key_ in coerced_val:
@@ -237,15 +263,28 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
 
         success_dict: dict[Any, Any] = {}
         errs: dict[Any, Invalid] = {}
+        concurrent_results = (
+            await self._concurrent_keys.key_results(coerced_val)
+            if self._concurrent_keys.enabled
+            else None
+        )
         for key_, validator, key_required in self._fast_keys_async:
             if key_ not in coerced_val:
                 if key_required:
                     errs[key_] = Invalid(missing_key_err, coerced_val, self)
+                    if _fail_fast.get():
+                        break
             else:
-                success, new_val = await validator(coerced_val[key_])
+                success, new_val = (
+                    await validator(coerced_val[key_])
+                    if concurrent_results is None
+                    else next(concurrent_results)
+                )
 
                 if not success:
                     errs[key_] = new_val
+                    if _fail_fast.get():
+                        break
                 elif not errs:
                     success_dict[key_] = new_val
 
@@ -269,6 +308,7 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
             and other.validate_object_async is self.validate_object_async
             and other.schema == self.schema
             and other.fail_on_unknown_keys == self.fail_on_unknown_keys
+            and other.max_concurrency == self.max_concurrency
             and other.coerce == self.coerce
         )
 
@@ -287,6 +327,7 @@ class NamedTupleValidator(_ToTupleValidator[_NTT]):
                     # by default we don't fail on extra keys, so we don't
                     # show this in the repr if the default is defined
                     ("fail_on_unknown_keys", self.fail_on_unknown_keys),
+                    ("max_concurrency", self.max_concurrency),
                 ]
                 if v
             ],
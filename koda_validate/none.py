@@ -3,6 +3,8 @@ from typing import Any, Optional
 
 from koda_validate._generics import A
 from koda_validate._internal import (
+    _dispatch_union_validator,
+    _dispatch_union_validator_async,
     _ResultTuple,
     _ToTupleValidator,
     _union_validator,
@@ -13,24 +15,33 @@ from koda_validate.coerce import Coercer
 from koda_validate.errors import CoercionErr, TypeErr
 from koda_validate.valid import Invalid
 
+_none_type_err = TypeErr(type(None))
+
 
 @dataclass
 class NoneValidator(_ToTupleValidator[None]):
     coerce: Optional[Coercer[None]] = None
 
+    def __post_init__(self) -> None:
+        if self.coerce:
+            self._coercion_err = CoercionErr(self.coerce.compatible_types, type(None))
+
+    def is_valid(self, val: Any) -> bool:
+        if self.coerce:
+            return self.coerce(val).is_just
+        return val is None
+
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[None]:
         if self.coerce:
             if self.coerce(val).is_just:
                 return True, None
             else:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, type(None)), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
 
         if val is None:
             return True, None
         else:
-            return False, Invalid(TypeErr(type(None)), val, self)
+            return False, Invalid(_none_type_err, val, self)
 
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[None]:
         return self._validate_to_tuple(val)
@@ -56,11 +67,29 @@ class OptionalValidator(_ToTupleValidator[Optional[A]]):
         self.none_validator = none_validator
         self.validators = (none_validator, validator)
 
+        # imported here to avoid circular imports
+        from koda_validate._tree import _type_dispatch
+
+        self._type_dispatch = _type_dispatch(self.validators)
+
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[Optional[A]]:
-        return await _union_validator_async(self, self.validators, val)
+        if self._type_dispatch is None:
+            return await _union_validator_async(self, self.validators, val)
+        else:
+            return await _dispatch_union_validator_async(
+                self, self.validators, val, self._type_dispatch
+            )
+
+    def is_valid(self, val: Any) -> bool:
+        return self.none_validator.is_valid(val) or self.non_none_validator.is_valid(val)
 
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[Optional[A]]:
-        return _union_validator(self, self.validators, val)
+        if self._type_dispatch is None:
+            return _union_validator(self, self.validators, val)
+        else:
+            return _dispatch_union_validator(
+                self, self.validators, val, self._type_dispatch
+            )
 
     def __eq__(self, other: Any) -> bool:
         return (
@@ -0,0 +1,335 @@
+"""
+Timing of each validator within a validator tree.
+"""
+
+import inspect
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter_ns
+from types import CodeType, FrameType
+from typing import Any, Callable, Iterator, Optional
+
+from koda_validate._tree import _labelled_children, _root_name
+from koda_validate.base import Validator
+from koda_validate.generic import Lazy
+from koda_validate.valid import Invalid, Valid
+
+# the methods through which validators are called
+_METHOD_NAMES = (
+    "__call__",
+    "validate_async",
+    "is_valid",
+    "_validate_to_tuple",
+    "_validate_to_tuple_async",
+    "_validate_type_to_tuple",
+)
+
+
+@dataclass
+class ProfileRow:
+    """
+    Aggregated timings for the validator at ``path``. Times are in nanoseconds.
+    ``self_ns`` excludes time spent in nested validators; for ``validate_async``,
+    neither includes time spent waiting.
+    """
+
+    path: str
+    validator: str
+    calls: int = 0
+    invalid: int = 0
+    total_ns: int = 0
+    self_ns: int = 0
+
+    @property
+    def invalid_rate(self) -> float:
+        """
+        The fraction of calls which were invalid
+        """
+        return self.invalid / self.calls if self.calls else 0.0
+
+
+class ValidationProfile:
+    """
+    The timings collected by :func:`profile`, with a row for each validator, at each
+    path, that was called. Rows are in the order validators were first called.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[tuple[str, str], ProfileRow] = {}
+
+    @property
+    def rows(self) -> list[ProfileRow]:
+        return list(self._rows.values())
+
+    def _row(self, path: str, validator: Validator[Any]) -> ProfileRow:
+        key = (path, type(validator).__name__)
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = ProfileRow(*key)
+        return row
+
+    def __str__(self) -> str:
+        header = ("path", "validator", "calls", "total ms", "self ms", "invalid %")
+        lines = [header] + [
+            (
+                row.path,
+                row.validator,
+                str(row.calls),
+                f"{row.total_ns / 1e6:.3f}",
+                f"{row.self_ns / 1e6:.3f}",
+                f"{row.invalid_rate * 100:.1f}",
+            )
+            for row in self._rows.values()
+        ]
+        widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i < 2 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(line, widths))
+            ).rstrip()
+            for line in lines
+        )
+
+
+def _is_result(val: Any) -> bool:
+    """
+    Whether ``val`` was returned by a validator method, rather than yielded by an
+    ``await`` within it (which is usually a ``Future``, or ``None``)
+    """
+    return isinstance(val, (Valid, Invalid)) or (
+        type(val) is tuple and len(val) == 2 and type(val[0]) is bool
+    )
+
+
+def _is_invalid(result: Any) -> bool:
+    # `is_valid` returns a `bool`
+    return (
+        result is False
+        or isinstance(result, Invalid)
+        or (type(result) is tuple and not result[0])
+    )
+
+
+class _Call:
+    __slots__ = (
+        "validator",
+        "row",
+        "parent",
+        "frame",
+        "depth",
+        "start_ns",
+        "total_ns",
+        "child_ns",
+    )
+
+    def __init__(
+        self,
+        validator: Validator[Any],
+        row: ProfileRow,
+        parent: Optional["_Call"],
+        frame: FrameType,
+    ) -> None:
+        self.validator = validator
+        self.row = row
+        self.parent = parent
+        # the outermost frame of the call
+        self.frame = frame
+        # the number of the call's frames that are running
+        self.depth = 0
+        self.start_ns = 0
+        self.total_ns = 0
+        self.child_ns = 0
+
+
+class _Profiler:
+    def __init__(
+        self,
+        validator: Validator[Any],
+        name: str,
+        previous: Optional[Callable[..., Any]],
+    ) -> None:
+        self.report = ValidationProfile()
+        # the profile function that was set already, which is passed every event
+        self.previous = previous
+        # the path segment of each validator, by the validator it's nested in
+        self.segments: dict[int, dict[int, str]] = {}
+        # the first path found for each validator, used when the validator it's
+        # nested in isn't known (e.g. for items validated concurrently)
+        self.paths: dict[int, str] = {id(validator): name}
+        # methods defined on classes, which tell us the validator from `self`
+        self.method_codes: set[CodeType] = set()
+        # functions set on instances (e.g. by `compile_validator`)
+        self.instance_codes: dict[CodeType, Validator[Any]] = {}
+        self.running: list[tuple[FrameType, _Call]] = []
+        self.suspended: dict[FrameType, _Call] = {}
+        # the `Lazy` validators which have been walked into
+        self.expanded: set[int] = set()
+
+        self._add_tree(validator)
+
+    def _add_tree(self, validator: Validator[Any]) -> None:
+        """
+        Find the paths of the validators nested within ``validator``, whose path must
+        already be known. ``Lazy`` validators are only walked into once they're called,
+        since their thunks may build new validators each time they're resolved.
+        """
+        stack = [validator]
+        while stack:
+            parent = stack.pop()
+            self._add_methods(parent)
+            segments = self.segments.setdefault(id(parent), {})
+            if isinstance(parent, Lazy) and id(parent) not in self.expanded:
+                continue
+            for segment, child in _labelled_children(parent):
+                segments.setdefault(id(child), segment)
+                # wrappers, like `KeyNotRequired`, may be bypassed
+                if not isinstance(child, Lazy):
+                    for grandchild_segment, grandchild in _labelled_children(child):
+                        if grandchild_segment == "":
+                            segments.setdefault(id(grandchild), segment)
+                if id(child) not in self.paths:
+                    self.paths[id(child)] = self.paths[id(parent)] + segment
+                    stack.append(child)
+
+    def _add_methods(self, validator: Validator[Any]) -> None:
+        for name in _METHOD_NAMES:
+            method = getattr(validator, name, None)
+            if inspect.ismethod(method):
+                self.method_codes.add(method.__func__.__code__)
+            elif inspect.isfunction(method):
+                self.instance_codes[method.__code__] = validator
+
+    def _validator(self, frame: FrameType) -> Optional[Validator[Any]]:
+        code = frame.f_code
+        if code in self.method_codes:
+            validator = frame.f_locals.get("self")
+            return validator if id(validator) in self.paths else None
+        else:
+            return self.instance_codes.get(code)
+
+    def _row(self, validator: Validator[Any], parent: Optional[_Call]) -> ProfileRow:
+        segment = (
+            None
+            if parent is None
+            else self.segments[id(parent.validator)].get(id(validator))
+        )
+        if parent is None or segment is None:
+            path = self.paths[id(validator)]
+        else:
+            path = parent.row.path + segment
+        return self.report._row(path, validator)
+
+    def _start(self, frame: FrameType) -> None:
+        call = self.suspended.pop(frame, None)
+        if call is None:
+            validator = self._validator(frame)
+            if validator is None:
+                return
+            parent = self.running[-1][1] if self.running else None
+            if parent is not None and parent.validator is validator:
+                # another method of the same validator
+                call = parent
+            else:
+                call = _Call(validator, self._row(validator, parent), parent, frame)
+                if isinstance(validator, Lazy) and id(validator) not in self.expanded:
+                    self.expanded.add(id(validator))
+                    self._add_tree(validator)
+        if call.depth == 0:
+            call.start_ns = perf_counter_ns()
+        call.depth += 1
+        self.running.append((frame, call))
+
+    def _stop(self, frame: FrameType, result: Any) -> None:
+        _, call = self.running.pop()
+        call.depth -= 1
+        if call.depth == 0:
+            elapsed = perf_counter_ns() - call.start_ns
+            call.total_ns += elapsed
+            if self.running and self.running[-1][1] is call.parent:
+                call.parent.child_ns += elapsed
+
+        if frame.f_code.co_flags & inspect.CO_COROUTINE and not _is_result(result):
+            # suspended by an `await`
+            self.suspended[frame] = call
+        elif frame is call.frame:
+            call.row.calls += 1
+            call.row.invalid += _is_invalid(result)
+            call.row.total_ns += call.total_ns
+            call.row.self_ns += call.total_ns - call.child_ns
+
+    def __call__(self, frame: FrameType, event: str, arg: Any) -> None:
+        if self.previous is not None:
+            self.previous(frame, event, arg)
+        if event == "call":
+            self._start(frame)
+        elif event == "return" and self.running and self.running[-1][0] is frame:
+            self._stop(frame, arg)
+
+
+@contextmanager
+def profile(
+    validator: Validator[Any], name: Optional[str] = None
+) -> Iterator[ValidationProfile]:
+    """
+    Times each validator within ``validator`` -- at each path in the tree -- while the
+    context is active, and aggregates call counts, total and self time, and invalid
+    rates. Paths are like ``Person.hobbies[].name``: ``.key`` for keys, ``[]`` for the
+    items of collections, ``[0]`` for tuple fields, ``{key}`` and ``{value}`` for maps,
+    and ``|0`` (or ``|tag``) for union variants. Only validation in the current thread
+    is timed.
+
+    Timing uses a profiling hook (``sys.setprofile``), which is only installed while
+    the context is active, so validation isn't slowed down at any other time. The hook
+    runs on every Python call and return in the thread, so timings are inflated --
+    self times most, for validators which make many calls -- and are best compared to
+    each other, rather than to timings taken without the hook. A profile function
+    which was set already (e.g. by another ``profile`` context) is passed every event
+    while the context is active, and is restored afterwards. Profilers which install
+    themselves in C, like :mod:`cProfile`, can't be passed events, so ``profile``
+    can't be used while one is enabled.
+
+    .. testsetup:: profile
+
+        from dataclasses import dataclass
+        from koda_validate import *
+        from koda_validate.profiling import profile
+
+    .. doctest:: profile
+
+        >>> @dataclass
+        ... class Person:
+        ...     name: str
+        ...     hobbies: list[str]
+        >>> validator = DataclassValidator(Person)
+        >>> with profile(validator) as report:
+        ...     _ = validator({"name": "Bob", "hobbies": ["chess", 1]})
+        >>> for row in report.rows:
+        ...     print(row.path, row.calls, row.invalid)
+        Person 1 1
+        Person.name 1 0
+        Person.hobbies 1 1
+        Person.hobbies[] 2 1
+
+    ``print(report)`` shows the timings as a table.
+
+    :param validator: the root of the validator tree to time
+    :param name: the name of the root of each path. By default, it's the name of the
+        class the validator builds (if any) or of the validator's class
+    :return: a :class:`ValidationProfile`, which is filled in as validators are called
+    :raises RuntimeError: if a profiler which isn't a Python function, like
+        :mod:`cProfile`, is enabled
+    """
+    previous = sys.getprofile()
+    if previous is not None and not callable(previous):
+        raise RuntimeError(
+            f"can't profile validators while {type(previous).__name__} is profiling"
+        )
+    profiler = _Profiler(
+        validator, _root_name(validator) if name is None else name, previous
+    )
+    sys.setprofile(profiler)
+    try:
+        yield profiler.report
+    finally:
+        sys.setprofile(previous)
@@ -2,7 +2,6 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any, Callable, Optional, Type, Union
 
-from koda_validate import NotBlank
 from koda_validate.base import Predicate, PredicateAsync
 from koda_validate.dataclasses import DataclassValidator
 from koda_validate.decimal import DecimalValidator
@@ -34,6 +33,7 @@ from koda_validate.generic import (
     MinItems,
     MinLength,
     MultipleOf,
+    NotBlank,
     StartsWith,
     UniqueItems,
 )
@@ -116,6 +116,11 @@ TYPE_DESCRIPTION_LOOKUP: dict[Type[Any], str] = {
 }
 
 
+# added to the errors of collections for which validation stopped at `max_errors`
+_TRUNCATED_KEY = "__truncated__"
+_TRUNCATED_MESSAGE = "too many errors; the remaining items were not validated"
+
+
 def to_serializable_errs(
     invalid: Invalid, next_level: Optional[Callable[[Invalid], Serializable]] = None
 ) -> Serializable:
@@ -130,6 +135,9 @@ def to_serializable_errs(
     :param next_level: If supplied, this callable will handle any calls for container
         ``ErrType``s such as ``ContainerErr``, ``KeyErr``, and so on
 
+    If a collection's validation stopped at ``max_errors``, its errors include a
+    ``"__truncated__"`` entry.
+
     :return: an error message appropriate for serializing in JSON or YAML. Because this
         function can handle any kind of Invalid, any type narrowing desired beyond
         ``Serializable`` needs to be done outside of this function.
@@ -184,7 +192,12 @@ def to_serializable_errs(
     elif isinstance(err, PredicateErrs):
         return [pred_to_err_message(p) for p in err.predicates]
     elif isinstance(err, IndexErrs):
-        return [[i, next_level(err)] for i, err in err.indexes.items()]
+        index_errs: list[Serializable] = [
+            [i, next_level(err)] for i, err in err.indexes.items()
+        ]
+        if err.truncated:
+            index_errs.append([_TRUNCATED_KEY, [_TRUNCATED_MESSAGE]])
+        return index_errs
     elif isinstance(err, MissingKeyErr):
         return ["key missing"]
     elif isinstance(err, MapErr):
@@ -196,9 +209,16 @@ def to_serializable_errs(
                 if v is not None
             }
             errs_dict[str(key)] = kv_dict
+        if err.truncated:
+            errs_dict[_TRUNCATED_KEY] = [_TRUNCATED_MESSAGE]
         return errs_dict
     elif isinstance(err, SetErrs):
-        return {"member_errors": [next_level(x) for x in err.item_errs]}
+        set_errs: dict[str, Serializable] = {
+            "member_errors": [next_level(x) for x in err.item_errs]
+        }
+        if err.truncated:
+            set_errs[_TRUNCATED_KEY] = [_TRUNCATED_MESSAGE]
+        return set_errs
     elif isinstance(err, KeyErrs):
         return {str(k): next_level(v) for k, v in err.keys.items()}
     elif isinstance(err, UnionErrs):
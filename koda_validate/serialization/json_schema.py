@@ -5,7 +5,6 @@ from functools import partial
 from typing import Any, Callable, NoReturn, Type, Union
 from uuid import UUID
 
-from koda_validate import NotBlank, UUIDValidator
 from koda_validate.base import CacheValidatorBase, Predicate, PredicateAsync, Validator
 from koda_validate.boolean import BoolValidator
 from koda_validate.bytes import BytesValidator
@@ -27,13 +26,16 @@ from koda_validate.generic import (
     EqualsValidator,
     EqualTo,
     ExactLength,
+    FailFastValidator,
     Lazy,
+    LazyErrorsValidator,
     Max,
     MaxItems,
     MaxLength,
     Min,
     MinItems,
     MinLength,
+    NotBlank,
     StartsWith,
     UniqueItems,
 )
@@ -46,7 +48,8 @@ from koda_validate.string import EmailPredicate, RegexPredicate, StringValidator
 from koda_validate.time import DatetimeValidator, DateValidator
 from koda_validate.tuple import NTupleValidator, UniformTupleValidator
 from koda_validate.typeddict import TypedDictValidator
-from koda_validate.union import UnionValidator
+from koda_validate.union import DiscriminatedUnionValidator, UnionValidator
+from koda_validate.uuid import UUIDValidator
 
 AnyValidatorOrPredicate = Union[Validator[Any], Predicate[Any], PredicateAsync[Any]]
 ValidatorToSchema = Callable[[AnyValidatorOrPredicate], dict[str, Serializable]]
@@ -297,6 +300,17 @@ def map_of_schema(
     return ret
 
 
+def discriminated_union_schema(
+    to_schema_fn: ValidatorToSchema, validator: DiscriminatedUnionValidator
+) -> dict[str, Serializable]:
+    # the same validator may be used for more than one tag
+    variants = {id(v): v for v in validator.variants.values()}.values()
+    return {
+        "oneOf": [to_schema_fn(v) for v in variants],
+        "discriminator": {"propertyName": str(validator.key)},
+    }
+
+
 def generate_schema_predicate(
     pred: Union[Predicate[Any], PredicateAsync[Any]]
 ) -> dict[str, Serializable]:
@@ -459,6 +473,8 @@ def generate_schema_validator(
         return {"type": "object"}
     elif isinstance(obj, UnionValidator):
         return {"oneOf": [to_schema_fn(s) for s in obj.validators]}
+    elif isinstance(obj, DiscriminatedUnionValidator):
+        return discriminated_union_schema(to_schema_fn, obj)
     elif isinstance(obj, NTupleValidator):
         return {
             "description": f'a {len(obj.fields)}-tuple of the fields in "prefixItems"',
@@ -476,7 +492,7 @@ def generate_schema_validator(
         return decimal_schema(to_schema_fn, obj)
     elif isinstance(obj, BytesValidator):
         return bytes_schema(to_schema_fn, obj)
-    elif isinstance(obj, CacheValidatorBase):
+    elif isinstance(obj, (CacheValidatorBase, FailFastValidator, LazyErrorsValidator)):
         return to_schema_fn(obj.validator)
     elif isinstance(obj, Lazy):
         raise TypeError(
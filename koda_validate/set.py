@@ -1,13 +1,16 @@
-from typing import Any, Hashable, Optional, TypeVar, Union
+from typing import Any, Hashable, Iterator, Optional, TypeVar, Union
 
-from koda_validate import Coercer
 from koda_validate._internal import (
     _async_predicates_warning,
+    _check_max_errors,
+    _Concurrency,
     _repr_helper,
     _ResultTuple,
     _ToTupleValidator,
+    _wrap_async_validator,
 )
-from koda_validate.base import Predicate, PredicateAsync, Validator
+from koda_validate.base import Predicate, PredicateAsync, Validator, _fail_fast
+from koda_validate.coerce import Coercer
 from koda_validate.errors import CoercionErr, PredicateErrs, SetErrs, TypeErr
 from koda_validate.valid import Invalid
 
@@ -24,13 +27,46 @@ class SetValidator(_ToTupleValidator[set[_ItemT]]):
         predicates: Optional[list[Predicate[set[_ItemT]]]] = None,
         predicates_async: Optional[list[PredicateAsync[set[_ItemT]]]] = None,
         coerce: Optional[Coercer[set[Any]]] = None,
+        max_concurrency: Optional[int] = None,
+        max_errors: Optional[int] = None,
     ) -> None:
         self.item_validator = item_validator
         self.predicates = predicates
         self.predicates_async = predicates_async
         self.coerce = coerce
+        self.max_concurrency = max_concurrency
+        _check_max_errors(max_errors)
+        self.max_errors = max_errors
 
         self._item_validator_is_tuple = isinstance(item_validator, _ToTupleValidator)
+        self._item_is_valid = item_validator.is_valid
+        self._concurrency = _Concurrency(max_concurrency, [item_validator])
+        self._wrapped_item_validator_async = _wrap_async_validator(item_validator)
+        self._type_err = TypeErr(set)
+        if coerce:
+            self._coercion_err = CoercionErr(coerce.compatible_types, set)
+
+    def is_valid(self, val: Any) -> bool:
+        if self.predicates_async:
+            _async_predicates_warning(self.__class__)
+
+        if self.coerce:
+            if not (coerced := self.coerce(val)).is_just:
+                return False
+            val = coerced.val
+        elif type(val) is not set:
+            return False
+
+        if self.predicates:
+            for pred in self.predicates:
+                if not pred(val):
+                    return False
+
+        item_is_valid = self._item_is_valid
+        for item in val:
+            if not item_is_valid(item):
+                return False
+        return True
 
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[set[_ItemT]]:
         if self.predicates_async:
@@ -38,16 +74,14 @@ class SetValidator(_ToTupleValidator[set[_ItemT]]):
 
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, set), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: set[Any] = coerced.val
 
         elif type(val) is set:
             coerced_val = val
         else:
-            return False, Invalid(TypeErr(set), val, self)
+            return False, Invalid(self._type_err, val, self)
 
         if self.predicates:
             list_errors: list[
@@ -59,6 +93,7 @@ class SetValidator(_ToTupleValidator[set[_ItemT]]):
 
         return_set: set[_ItemT] = set()
         item_errs: list[Invalid] = []
+        truncated = False
         for i, item in enumerate(coerced_val):
             if self._item_validator_is_tuple:
                 is_valid, item_result = self.item_validator._validate_to_tuple(item)  # type: ignore # noqa: E501
@@ -70,27 +105,32 @@ class SetValidator(_ToTupleValidator[set[_ItemT]]):
 
             if not is_valid:
                 item_errs.append(item_result)
+                if _fail_fast.get():
+                    break
+                elif len(item_errs) == self.max_errors:
+                    truncated = i + 1 < len(coerced_val)
+                    break
             elif not item_errs:
                 return_set.add(item_result)
 
         if item_errs:
-            return False, Invalid(SetErrs(item_errs), coerced_val, self)
+            return False, Invalid(
+                SetErrs(item_errs, truncated=truncated), coerced_val, self
+            )
         else:
             return True, return_set
 
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[set[_ItemT]]:
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, set), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: set[Any] = coerced.val
 
         elif type(val) is set:
             coerced_val = val
         else:
-            return False, Invalid(TypeErr(set), val, self)
+            return False, Invalid(self._type_err, val, self)
 
         predicate_errors: list[
             Union[Predicate[set[_ItemT]], PredicateAsync[set[_ItemT]]]
@@ -108,10 +148,21 @@ class SetValidator(_ToTupleValidator[set[_ItemT]]):
         if predicate_errors:
             return False, Invalid(PredicateErrs(predicate_errors), coerced_val, self)
 
+        concurrent_results: Optional[Iterator[Any]] = (
+            await self._concurrency.results(
+                [(self._wrapped_item_validator_async, item) for item in coerced_val]
+            )
+            if self._concurrency.enabled
+            else None
+        )
+
         return_set: set[_ItemT] = set()
         item_errs: list[Invalid] = []
+        truncated = False
         for i, item in enumerate(coerced_val):
-            if self._item_validator_is_tuple:
+            if concurrent_results is not None:
+                is_valid, item_result = next(concurrent_results)
+            elif self._item_validator_is_tuple:
                 (
                     is_valid,
                     item_result,
@@ -126,11 +177,18 @@ class SetValidator(_ToTupleValidator[set[_ItemT]]):
 
             if not is_valid:
                 item_errs.append(item_result)
+                if _fail_fast.get():
+                    break
+                elif len(item_errs) == self.max_errors:
+                    truncated = i + 1 < len(coerced_val)
+                    break
             elif not item_errs:
                 return_set.add(item_result)
 
         if item_errs:
-            return False, Invalid(SetErrs(item_errs), coerced_val, self)
+            return False, Invalid(
+                SetErrs(item_errs, truncated=truncated), coerced_val, self
+            )
         else:
             return True, return_set
 
@@ -141,6 +199,8 @@ class SetValidator(_ToTupleValidator[set[_ItemT]]):
             and self.predicates == other.predicates
             and self.predicates_async == other.predicates_async
             and self.coerce == other.coerce
+            and self.max_concurrency == other.max_concurrency
+            and self.max_errors == other.max_errors
         )
 
     def __repr__(self) -> str:
@@ -153,6 +213,8 @@ class SetValidator(_ToTupleValidator[set[_ItemT]]):
                     ("predicates", self.predicates),
                     ("predicates_async", self.predicates_async),
                     ("coerce", self.coerce),
+                    ("max_concurrency", self.max_concurrency),
+                    ("max_errors", self.max_errors),
                 ]
                 if v
             ],
@@ -19,10 +19,9 @@ from uuid import UUID
 
 from _decimal import Decimal
 
-from koda_validate import DataclassValidator, NamedTupleValidator
 from koda_validate._internal import _is_typed_dict_cls
 from koda_validate.base import Validator
-from koda_validate.dataclasses import dataclass_no_coerce
+from koda_validate.dataclasses import DataclassValidator, dataclass_no_coerce
 from koda_validate.errors import (
     CoercionErr,
     ContainerErr,
@@ -37,7 +36,7 @@ from koda_validate.errors import (
     UnionErrs,
 )
 from koda_validate.generic import always_valid
-from koda_validate.namedtuple import namedtuple_no_coerce
+from koda_validate.namedtuple import NamedTupleValidator, namedtuple_no_coerce
 from koda_validate.time import DatetimeValidator, DateValidator
 from koda_validate.tuple import NTupleValidator, UniformTupleValidator
 from koda_validate.typeddict import TypedDictValidator
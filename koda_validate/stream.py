@@ -0,0 +1,208 @@
+"""
+Validation of JSON arrays (or NDJSON) read incrementally from a stream, so that only
+one element needs to be held in memory at a time.
+"""
+
+import codecs
+import json
+import re
+from typing import IO, Any, AsyncIterator, Iterator, Union
+
+from koda_validate._generics import A
+from koda_validate.base import Validator
+from koda_validate.list import ListValidator
+from koda_validate.tuple import UniformTupleValidator
+from koda_validate.valid import ValidationResult
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# characters which may continue a number. `raw_decode` parses the longest number it
+# can, so a number cut off after its "." or "e" still parses, as a shorter number
+_NUMBER_CHARS = re.compile(r"[0-9.eE+-]*")
+
+# how close to the end of the buffer a decoding error must be for the element to
+# possibly be incomplete, rather than invalid -- e.g. in "-Infinit" or "\u12"
+_TRUNCATION_MARGIN = len("-Infinity")
+
+_decoder = json.JSONDecoder()
+
+
+class _ChunkReader:
+    r"""
+    Reads ``str``\s from a binary or text stream, decoding bytes as UTF-8.
+    """
+
+    def __init__(self, stream: IO[Any]) -> None:
+        self.stream = stream
+        self.eof = False
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    def read(self, size: int) -> str:
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.eof = True
+            return self._decoder.decode(b"", final=True)
+        elif isinstance(chunk, str):
+            return chunk
+        else:
+            return self._decoder.decode(chunk)
+
+
+def _iter_json_array(stream: IO[Any], chunk_size: int) -> Iterator[Any]:
+    """
+    Yield the elements of the top-level JSON array in ``stream``, one at a time.
+
+    :raises json.JSONDecodeError: if the stream does not contain a valid JSON array
+    """
+    reader = _ChunkReader(stream)
+    buf = ""
+    pos = 0
+
+    def skip_whitespace() -> str:
+        """
+        :return: the next non-whitespace character (without consuming it), or ``""``
+            at the end of the stream
+        """
+        nonlocal buf, pos
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()  # type: ignore[union-attr]
+            if pos < len(buf) or reader.eof:
+                return buf[pos] if pos < len(buf) else ""
+            buf = buf[pos:] + reader.read(chunk_size)
+            pos = 0
+
+    if skip_whitespace() != "[":
+        raise json.JSONDecodeError("Expecting '['", buf, pos)
+    pos += 1
+
+    if skip_whitespace() == "]":
+        pos += 1
+    else:
+        while True:
+            skip_whitespace()
+            while True:
+                try:
+                    val, end = _decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    # otherwise reading more can't fix the error, and we would read
+                    # the rest of the stream before raising it
+                    if reader.eof or not (
+                        e.pos >= len(buf) - _TRUNCATION_MARGIN
+                        or e.msg.startswith("Unterminated string")
+                    ):
+                        raise
+                else:
+                    # a number or literal at the end of the buffer may be incomplete
+                    if (
+                        _NUMBER_CHARS.match(buf, end).end()  # type: ignore[union-attr]
+                        < len(buf)
+                        or reader.eof
+                    ):
+                        pos = end
+                        break
+                # the element is incomplete. Read at least as much as we have, so
+                # that large elements aren't re-parsed too many times
+                buf = buf[pos:] + reader.read(max(chunk_size, len(buf) - pos))
+                pos = 0
+
+            yield val
+
+            next_char = skip_whitespace()
+            pos += 1
+            if next_char == "]":
+                break
+            elif next_char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos - 1)
+
+    if skip_whitespace() != "":
+        raise json.JSONDecodeError("Extra data", buf, pos)
+
+
+def _iter_ndjson(stream: IO[Any]) -> Iterator[Any]:
+    """
+    Yield the JSON value on each non-blank line of ``stream``.
+
+    :raises json.JSONDecodeError: if a line does not contain a valid JSON value
+    """
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _item_validator(validator: Validator[Any]) -> Validator[Any]:
+    if not isinstance(validator, (ListValidator, UniformTupleValidator)):
+        raise TypeError("`validator` must be a ListValidator or UniformTupleValidator")
+    elif validator.predicates or validator.predicates_async:
+        raise ValueError(
+            "`predicates` and `predicates_async` need the whole collection, so they "
+            "cannot be used when streaming"
+        )
+    else:
+        return validator.item_validator
+
+
+def _iter_values(stream: IO[Any], ndjson: bool, chunk_size: int) -> Iterator[Any]:
+    if ndjson:
+        return _iter_ndjson(stream)
+    else:
+        return _iter_json_array(stream, chunk_size)
+
+
+def validate_json_stream(
+    validator: Union[ListValidator[A], UniformTupleValidator[A]],
+    stream: IO[Any],
+    *,
+    ndjson: bool = False,
+    chunk_size: int = 65536,
+) -> Iterator[tuple[int, ValidationResult[A]]]:
+    """
+    Validate the elements of a top-level JSON array -- or the lines of an NDJSON
+    document -- as they are read from ``stream``, with the ``item_validator`` of
+    ``validator``. Only one element is held in memory at a time.
+
+    .. testsetup:: stream
+
+        from io import BytesIO
+        from koda_validate import *
+
+    .. doctest:: stream
+
+        >>> validator = ListValidator(IntValidator())
+        >>> stream = BytesIO(b'[1, 2, "three"]')
+        >>> for i, result in validate_json_stream(validator, stream):
+        ...     print(i, result.is_valid)
+        0 True
+        1 True
+        2 False
+
+    :param validator: the collection validator; its ``coerce`` is not used
+    :param stream: a binary (UTF-8) or text stream
+    :param ndjson: whether ``stream`` contains one JSON value per line (blank lines are
+        skipped), instead of a JSON array
+    :param chunk_size: how much to read from ``stream`` at a time
+    :return: an iterator of ``(index, result)`` pairs
+    :raises TypeError: if ``validator`` is not a :class:`ListValidator` or
+        :class:`UniformTupleValidator`
+    :raises ValueError: if ``validator`` has ``predicates`` or ``predicates_async``
+    :raises json.JSONDecodeError: when invalid JSON is encountered
+    """
+    item_validator = _item_validator(validator)
+    return (
+        (i, item_validator(val))
+        for i, val in enumerate(_iter_values(stream, ndjson, chunk_size))
+    )
+
+
+async def validate_json_stream_async(
+    validator: Union[ListValidator[A], UniformTupleValidator[A]],
+    stream: IO[Any],
+    *,
+    ndjson: bool = False,
+    chunk_size: int = 65536,
+) -> AsyncIterator[tuple[int, ValidationResult[A]]]:
+    """
+    The same as :func:`validate_json_stream`, but elements are validated with
+    ``validate_async``. Note that ``stream`` is still read synchronously.
+    """
+    item_validator = _item_validator(validator)
+    for i, val in enumerate(_iter_values(stream, ndjson, chunk_size)):
+        yield i, await item_validator.validate_async(val)
@@ -3,8 +3,8 @@ from typing import Any, Optional
 
 from koda import Just, Maybe, nothing
 
-from koda_validate import Predicate, PredicateAsync, Processor
 from koda_validate._internal import _ToTupleStandardValidator
+from koda_validate.base import Predicate, PredicateAsync, Processor
 from koda_validate.coerce import Coercer, coercer
 
 
@@ -5,13 +5,21 @@ from koda import Just, Maybe, nothing
 from koda_validate._generics import T1, T2, T3, T4, T5, T6, T7, T8, A
 from koda_validate._internal import (
     _async_predicates_warning,
+    _check_max_errors,
     _repr_helper,
     _ResultTuple,
     _ToTupleValidator,
     _wrap_async_validator,
     _wrap_sync_validator,
 )
-from koda_validate.base import Predicate, PredicateAsync, Validator
+from koda_validate._vectorized import VECTORIZE_MIN_LEN, _vectorized_items
+from koda_validate.base import (
+    Predicate,
+    PredicateAsync,
+    Validator,
+    _fail_fast,
+    _no_passthrough,
+)
 from koda_validate.coerce import Coercer, coercer
 from koda_validate.errors import CoercionErr, ErrType, IndexErrs, PredicateErrs, TypeErr
 from koda_validate.generic import ExactItemCount
@@ -55,6 +63,10 @@ class NTupleValidator(_ToTupleValidator[A]):
         self._len_predicate: Predicate[tuple[Any, ...]] = ExactItemCount(len(fields))
         self._wrapped_fields_sync = [_wrap_sync_validator(v) for v in fields]
         self._wrapped_fields_async = [_wrap_async_validator(v) for v in fields]
+        self._fields_is_valid = [v.is_valid for v in fields]
+        self._type_err = TypeErr(tuple)
+        if coerce:
+            self._coercion_err = CoercionErr(coerce.compatible_types, list)
 
     @overload
     @staticmethod
@@ -284,18 +296,35 @@ class NTupleValidator(_ToTupleValidator[A]):
             fields=fields, validate_object=validate_object, coerce=coerce
         )
 
+    def is_valid(self, val: Any) -> bool:
+        if self.validate_object is not None:
+            # `validate_object` needs the valid tuple
+            return self._validate_to_tuple(val)[0]
+
+        if self.coerce:
+            if not (coerced := self.coerce(val)).is_just:
+                return False
+            val = coerced.val
+        elif type(val) is not tuple:
+            return False
+
+        if not self._len_predicate(val):
+            return False
+        for is_valid, item in zip(self._fields_is_valid, val):
+            if not is_valid(item):
+                return False
+        return True
+
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[A]:
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, list), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: Tuple[Any, ...] = coerced.val
         elif type(val) is tuple:
             coerced_val = val
         else:
-            return False, Invalid(TypeErr(tuple), val, self)
+            return False, Invalid(self._type_err, val, self)
 
         # we allow list as well because it's common that tuples or tuple-like lists
         # are deserialized to lists
@@ -311,6 +340,8 @@ class NTupleValidator(_ToTupleValidator[A]):
                 vals.append(new_val)
             else:
                 errs[i] = new_val
+                if _fail_fast.get():
+                    break
 
         if errs:
             return False, Invalid(IndexErrs(errs), coerced_val, self)
@@ -328,15 +359,13 @@ class NTupleValidator(_ToTupleValidator[A]):
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[A]:
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, list), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: Tuple[Any, ...] = coerced.val
         elif type(val) is tuple:
             coerced_val = val
         else:
-            return False, Invalid(TypeErr(tuple), val, self)
+            return False, Invalid(self._type_err, val, self)
 
         if not self._len_predicate(val):
             return False, Invalid(PredicateErrs([self._len_predicate]), val, self)
@@ -351,6 +380,8 @@ class NTupleValidator(_ToTupleValidator[A]):
                 vals.append(new_val)
             else:
                 errs[i] = new_val
+                if _fail_fast.get():
+                    break
 
         if errs:
             return False, Invalid(IndexErrs(errs), coerced_val, self)
@@ -394,13 +425,59 @@ class UniformTupleValidator(_ToTupleValidator[Tuple[A, ...]]):
         predicates: Optional[list[Predicate[Tuple[A, ...]]]] = None,
         predicates_async: Optional[list[PredicateAsync[Tuple[A, ...]]]] = None,
         coerce: Optional[Coercer[Tuple[Any, ...]]] = tuple_or_list_to_tuple,
+        max_errors: Optional[int] = None,
     ) -> None:
         self.item_validator = item_validator
         self.predicates = predicates
         self.predicates_async = predicates_async
         self.coerce = coerce
+        _check_max_errors(max_errors)
+        self.max_errors = max_errors
 
         self._item_validator_is_tuple = isinstance(item_validator, _ToTupleValidator)
+        self._item_is_valid = item_validator.is_valid
+        self._vectorized_items = _vectorized_items(item_validator)
+        self._type_err = TypeErr(tuple)
+        if coerce:
+            self._coercion_err = CoercionErr(coerce.compatible_types, list)
+
+        # imported here to avoid circular imports
+        from koda_validate._tree import _is_non_transforming
+
+        # if the items are returned unchanged, so can the tuple be
+        self._passthrough = coerce in (
+            None,
+            tuple_or_list_to_tuple,
+        ) and _is_non_transforming(item_validator)
+
+    def is_valid(self, val: Any) -> bool:
+        if self.predicates_async:
+            _async_predicates_warning(self.__class__)
+
+        if self.coerce:
+            if not (coerced := self.coerce(val)).is_just:
+                return False
+            val = coerced.val
+        elif type(val) is not tuple:
+            return False
+
+        if self.predicates:
+            for pred in self.predicates:
+                if not pred(val):
+                    return False
+
+        if (
+            self._vectorized_items is not None
+            and len(val) >= VECTORIZE_MIN_LEN
+            and (all_valid := self._vectorized_items.is_valid(val)) is not None
+        ):
+            return all_valid
+
+        item_is_valid = self._item_is_valid
+        for item in val:
+            if not item_is_valid(item):
+                return False
+        return True
 
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[Tuple[A, ...]]:
         if self.predicates_async:
@@ -408,16 +485,14 @@ class UniformTupleValidator(_ToTupleValidator[Tuple[A, ...]]):
 
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, list), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: Tuple[Any, ...] = coerced.val
 
         elif type(val) is tuple:
             coerced_val = val
         else:
-            return False, Invalid(TypeErr(tuple), val, self)
+            return False, Invalid(self._type_err, val, self)
 
         if self.predicates:
             tuple_errors: list[
@@ -428,8 +503,26 @@ class UniformTupleValidator(_ToTupleValidator[Tuple[A, ...]]):
             if tuple_errors:
                 return False, Invalid(PredicateErrs(tuple_errors), coerced_val, self)
 
+        passthrough = self._passthrough and not _no_passthrough.get()
+
+        if (
+            self._vectorized_items is not None
+            and len(coerced_val) >= VECTORIZE_MIN_LEN
+            and (
+                vectorized_errs := self._vectorized_items.validate(
+                    coerced_val, self.max_errors
+                )
+            )
+            is not None
+        ):
+            if vectorized_errs.indexes:
+                return False, Invalid(vectorized_errs, coerced_val, self)
+            else:
+                return True, coerced_val if passthrough else tuple(coerced_val)
+
         return_list: list[A] = []
         index_errors: dict[int, Invalid] = {}
+        truncated = False
         for i, item in enumerate(coerced_val):
             if self._item_validator_is_tuple:
                 is_valid, item_result = self.item_validator._validate_to_tuple(item)  # type: ignore # noqa: E501
@@ -441,27 +534,32 @@ class UniformTupleValidator(_ToTupleValidator[Tuple[A, ...]]):
 
             if not is_valid:
                 index_errors[i] = item_result
-            elif not index_errors:
+                if _fail_fast.get():
+                    break
+                elif len(index_errors) == self.max_errors:
+                    truncated = i + 1 < len(coerced_val)
+                    break
+            elif not (index_errors or passthrough):
                 return_list.append(item_result)
 
         if index_errors:
-            return False, Invalid(IndexErrs(index_errors), coerced_val, self)
+            return False, Invalid(
+                IndexErrs(index_errors, truncated=truncated), coerced_val, self
+            )
         else:
-            return True, tuple(return_list)
+            return True, coerced_val if passthrough else tuple(return_list)
 
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[Tuple[A, ...]]:
         if self.coerce:
             if not (coerced := self.coerce(val)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, list), val, self
-                )
+                return False, Invalid(self._coercion_err, val, self)
             else:
                 coerced_val: Tuple[Any, ...] = coerced.val
 
         elif type(val) is tuple:
             coerced_val = val
         else:
-            return False, Invalid(TypeErr(tuple), val, self)
+            return False, Invalid(self._type_err, val, self)
 
         tuple_errors: list[
             Union[Predicate[Tuple[A, ...]], PredicateAsync[Tuple[A, ...]]]
@@ -479,8 +577,26 @@ class UniformTupleValidator(_ToTupleValidator[Tuple[A, ...]]):
         if tuple_errors:
             return False, Invalid(PredicateErrs(tuple_errors), coerced_val, self)
 
+        passthrough = self._passthrough and not _no_passthrough.get()
+
+        if (
+            self._vectorized_items is not None
+            and len(coerced_val) >= VECTORIZE_MIN_LEN
+            and (
+                vectorized_errs := self._vectorized_items.validate(
+                    coerced_val, self.max_errors
+                )
+            )
+            is not None
+        ):
+            if vectorized_errs.indexes:
+                return False, Invalid(vectorized_errs, coerced_val, self)
+            else:
+                return True, coerced_val if passthrough else tuple(coerced_val)
+
         return_list: list[A] = []
         index_errors: dict[int, Invalid] = {}
+        truncated = False
         for i, item in enumerate(coerced_val):
             if self._item_validator_is_tuple:
                 (
@@ -497,13 +613,20 @@ class UniformTupleValidator(_ToTupleValidator[Tuple[A, ...]]):
 
             if not is_valid:
                 index_errors[i] = item_result
-            elif not index_errors:
+                if _fail_fast.get():
+                    break
+                elif len(index_errors) == self.max_errors:
+                    truncated = i + 1 < len(coerced_val)
+                    break
+            elif not (index_errors or passthrough):
                 return_list.append(item_result)
 
         if index_errors:
-            return False, Invalid(IndexErrs(index_errors), coerced_val, self)
+            return False, Invalid(
+                IndexErrs(index_errors, truncated=truncated), coerced_val, self
+            )
         else:
-            return True, tuple(return_list)
+            return True, coerced_val if passthrough else tuple(return_list)
 
     def __eq__(self, other: Any) -> bool:
         return (
@@ -512,6 +635,7 @@ class UniformTupleValidator(_ToTupleValidator[Tuple[A, ...]]):
             and self.predicates == other.predicates
             and self.predicates_async == other.predicates_async
             and self.coerce == other.coerce
+            and self.max_errors == other.max_errors
         )
 
     def __repr__(self) -> str:
@@ -524,6 +648,7 @@ class UniformTupleValidator(_ToTupleValidator[Tuple[A, ...]]):
                     ("predicates", self.predicates),
                     ("predicates_async", self.predicates_async),
                     ("coerce", self.coerce),
+                    ("max_errors", self.max_errors),
                 ]
                 if v
             ],
@@ -3,6 +3,7 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    Hashable,
     Mapping,
     Optional,
     Type,
@@ -12,7 +13,9 @@ from typing import (
 )
 
 from koda_validate._internal import (
+    _ConcurrentKeys,
     _is_typed_dict_cls,
+    _keys_are_valid,
     _raise_cannot_define_validate_object_and_validate_object_async,
     _raise_validate_object_async_in_sync_mode,
     _repr_helper,
@@ -21,7 +24,7 @@ from koda_validate._internal import (
     _wrap_async_validator,
     _wrap_sync_validator,
 )
-from koda_validate.base import Validator
+from koda_validate.base import Validator, _fail_fast
 from koda_validate.coerce import Coercer
 from koda_validate.errors import (
     CoercionErr,
@@ -83,6 +86,9 @@ class TypedDictValidator(_ToTupleValidator[_TDT]):
     :param coerce: this can be set to create any kind of custom coercion
     :param fail_on_unknown_keys: if True, this will fail if any keys not defined by the
         ``TypedDict`` are found. This will fail before any values are validated.
+    :param max_concurrency: if set, ``validate_async`` validates the values of keys
+        concurrently, with up to this many running at once. Keys are still validated
+        one at a time if none of their validators do any asynchronous work.
     :raises TypeError: should raise if non-``TypedDict`` type is passed for ``td_cls``
     """
 
@@ -103,6 +109,7 @@ class TypedDictValidator(_ToTupleValidator[_TDT]):
         coerce: Optional[Coercer[dict[Any, Any]]] = None,
         typehint_resolver: Callable[[Any], Validator[Any]] = get_typehint_validator,
         fail_on_unknown_keys: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         if not _is_typed_dict_cls(td_cls):
             raise TypeError("must be a TypedDict subclass")
@@ -110,6 +117,7 @@ class TypedDictValidator(_ToTupleValidator[_TDT]):
         self.td_cls = td_cls
         self.overrides = overrides  # for repr
         self.fail_on_unknown_keys = fail_on_unknown_keys
+        self.max_concurrency = max_concurrency
         self.coerce = coerce
 
         if validate_object is not None and validate_object_async is not None:
@@ -146,13 +154,39 @@ class TypedDictValidator(_ToTupleValidator[_TDT]):
         self._keys_set = set()
         self._fast_keys_sync = []
         self._fast_keys_async = []
+        self._fast_keys_is_valid: list[tuple[Hashable, Callable[[Any], bool], bool]] = []
         for key, val in self.schema.items():
             self._keys_set.add(key)
             is_required = key in self.required_keys
             self._fast_keys_sync.append((key, _wrap_sync_validator(val), is_required))
             self._fast_keys_async.append((key, _wrap_async_validator(val), is_required))
+            self._fast_keys_is_valid.append((key, val.is_valid, is_required))
 
+        self._concurrent_keys = _ConcurrentKeys(
+            max_concurrency, self._fast_keys_async, list(self.schema.values())
+        )
         self._unknown_keys_err: ExtraKeysErr = ExtraKeysErr(set(self.schema.keys()))
+        self._type_err = TypeErr(dict)
+        if coerce:
+            self._coercion_err = CoercionErr(coerce.compatible_types, dict)
+
+    def is_valid(self, data: Any) -> bool:
+        if self._disallow_synchronous:
+            _raise_validate_object_async_in_sync_mode(self.__class__)
+        elif self.validate_object is not None:
+            # `validate_object` needs the valid object
+            return self._validate_to_tuple(data)[0]
+
+        if self.coerce:
+            if not (coerced := self.coerce(data)).is_just:
+                return False
+            data = coerced.val
+        elif type(data) is not dict:
+            return False
+
+        return not (
+            self.fail_on_unknown_keys and not self._keys_set.issuperset(data)
+        ) and _keys_are_valid(self._fast_keys_is_valid, data)
 
     def _validate_to_tuple(self, data: Any) -> _ResultTuple[_TDT]:
         if self._disallow_synchronous:
@@ -160,16 +194,14 @@ class TypedDictValidator(_ToTupleValidator[_TDT]):
 
         if self.coerce:
             if not (coerced := self.coerce(data)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, dict), data, self
-                )
+                return False, Invalid(self._coercion_err, data, self)
             else:
                 coerced_val: dict[Any, Any] = coerced.val
 
         elif type(data) is dict:
             coerced_val = data
         else:
-            return False, Invalid(TypeErr(dict), data, self)
+            return False, Invalid(self._type_err, data, self)
 
         if self.fail_on_unknown_keys:
             for key_ in coerced_val:
@@ -182,11 +214,15 @@ class TypedDictValidator(_ToTupleValidator[_TDT]):
             if key_ not in coerced_val:
                 if key_required:
                     errs[key_] = Invalid(missing_key_err, coerced_val, self)
+                    if _fail_fast.get():
+                        break
             else:
                 success, new_val = validator(coerced_val[key_])
 
                 if not success:
                     errs[key_] = new_val
+                    if _fail_fast.get():
+                        break
                 elif not errs:
                     success_dict[key_] = new_val
 
@@ -202,16 +238,14 @@ class TypedDictValidator(_ToTupleValidator[_TDT]):
     async def _validate_to_tuple_async(self, data: Any) -> _ResultTuple[_TDT]:
         if self.coerce:
             if not (coerced := self.coerce(data)).is_just:
-                return False, Invalid(
-                    CoercionErr(self.coerce.compatible_types, dict), data, self
-                )
+                return False, Invalid(self._coercion_err, data, self)
             else:
                 coerced_val: dict[Any, Any] = coerced.val
 
         elif type(data) is dict:
             coerced_val = data
         else:
-            return False, Invalid(TypeErr(dict), data, self)
+            return False, Invalid(self._type_err, data, self)
 
         if self.fail_on_unknown_keys:
             for key_ in coerced_val:
@@ -220,15 +254,28 @@ class TypedDictValidator(_ToTupleValidator[_TDT]):
 
         success_dict: dict[str, object] = {}
         errs: dict[Any, Invalid] = {}
+        concurrent_results = (
+            await self._concurrent_keys.key_results(coerced_val)
+            if self._concurrent_keys.enabled
+            else None
+        )
         for key_, validator, key_required in self._fast_keys_async:
             if key_ not in coerced_val:
                 if key_required:
                     errs[key_] = Invalid(missing_key_err, coerced_val, self)
+                    if _fail_fast.get():
+                        break
             else:
-                success, new_val = await validator(coerced_val[key_])
+                success, new_val = (
+                    await validator(coerced_val[key_])
+                    if concurrent_results is None
+                    else next(concurrent_results)
+                )
 
                 if not success:
                     errs[key_] = new_val
+                    if _fail_fast.get():
+                        break
                 elif not errs:
                     success_dict[key_] = new_val
 
@@ -252,6 +299,7 @@ class TypedDictValidator(_ToTupleValidator[_TDT]):
             and self.validate_object == other.validate_object
             and self.validate_object_async == other.validate_object_async
             and self.fail_on_unknown_keys == other.fail_on_unknown_keys
+            and self.max_concurrency == other.max_concurrency
             and self.coerce == other.coerce
         )
 
@@ -270,6 +318,7 @@ class TypedDictValidator(_ToTupleValidator[_TDT]):
                     # by default we don't fail on extra keys, so we don't
                     # show this in the repr if the default is defined
                     ("fail_on_unknown_keys", self.fail_on_unknown_keys),
+                    ("max_concurrency", self.max_concurrency),
                 ]
                 if v
             ],
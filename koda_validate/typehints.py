@@ -1,6 +1,6 @@
 import inspect
 import sys
-from dataclasses import is_dataclass
+from dataclasses import MISSING, fields, is_dataclass
 from datetime import date, datetime
 from decimal import Decimal
 
@@ -22,7 +22,19 @@ if sys.version_info >= (3, 11):
 if sys.version_info >= (3, 13):
     from typing import ReadOnly  # noqa: F811
 
-from typing import Any, Callable, Dict, Literal, Tuple, Union, get_args, get_origin
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 from uuid import UUID
 
 from ._internal import _is_typed_dict_cls
@@ -40,7 +52,7 @@ from .set import SetValidator
 from .string import StringValidator
 from .time import DatetimeValidator, DateValidator
 from .tuple import NTupleValidator, UniformTupleValidator
-from .union import UnionValidator
+from .union import DiscriminatedUnionValidator, UnionValidator
 from .uuid import UUIDValidator
 
 
@@ -60,6 +72,66 @@ def annotation_is_namedtuple(annotation: Any) -> bool:
     )
 
 
+def _literal_fields(annotation: Any) -> Optional[dict[str, tuple[Any, ...]]]:
+    """
+    :param annotation: any annotation
+    :return: the values of each required ``Literal`` field, if ``annotation`` is a
+        dataclass or ``TypedDict``; otherwise ``None``
+    """
+    if is_dataclass(annotation):
+        required = [
+            f.name
+            for f in fields(annotation)
+            if f.init and f.default is MISSING and f.default_factory is MISSING
+        ]
+    elif _is_typed_dict_cls(annotation):
+        required = list(getattr(annotation, "__required_keys__", ()))
+    else:
+        return None
+
+    type_hints = get_type_hints(annotation)
+    return {
+        name: get_args(type_hints[name])
+        for name in required
+        if name in type_hints and get_origin(type_hints[name]) is Literal
+    }
+
+
+def _discriminated_union(
+    get_hint_next_depth: Callable[[Any], Validator[Any]], args: Tuple[Any, ...]
+) -> Optional[DiscriminatedUnionValidator]:
+    """
+    :param get_hint_next_depth: the ``Callable`` used to get the variants' validators
+    :param args: the variants of a ``Union``
+    :return: a :class:`DiscriminatedUnionValidator` if every variant is a dataclass or
+        ``TypedDict`` with a required ``Literal`` field of the same name, whose values
+        identify a single variant; otherwise ``None``
+    """
+    variant_fields = []
+    for arg in args:
+        literal_fields = _literal_fields(arg)
+        if not literal_fields:
+            return None
+        variant_fields.append(literal_fields)
+
+    for key in variant_fields[0]:
+        if not all(key in literal_fields for literal_fields in variant_fields[1:]):
+            continue
+
+        tags: dict[Hashable, int] = {}
+        for i, literal_fields in enumerate(variant_fields):
+            tags.update((tag, i) for tag in literal_fields[key])
+
+        # each tag must identify a single variant
+        if len(tags) == sum(len(fields_[key]) for fields_ in variant_fields):
+            validators = [get_hint_next_depth(arg) for arg in args]
+            return DiscriminatedUnionValidator(
+                key, {tag: validators[i] for tag, i in tags.items()}
+            )
+
+    return None
+
+
 # todo: evolve into general-purpose type-hint driven validator
 # will probably need significant changes
 def get_typehint_validator_base(
@@ -138,6 +210,10 @@ def get_typehint_validator_base(
         elif origin is Union or (sys.version_info >= (3, 10) and origin is UnionType):
             if len(args) == 2 and args[1] is Nothing and get_origin(args[0]) is Just:
                 return MaybeValidator(get_hint_next_depth(get_args(args[0])[0]))
+            elif (
+                discriminated := _discriminated_union(get_hint_next_depth, args)
+            ) is not None:
+                return discriminated
             else:
                 return UnionValidator(*[get_hint_next_depth(arg) for arg in args])
         elif origin is tuple or origin is Tuple:
@@ -1,14 +1,21 @@
-from typing import Any, Optional, Union, overload
+from typing import Any, Hashable, Mapping, Optional, TypeVar, Union, overload
 
 from koda_validate._generics import T1, T2, T3, T4, T5, T6, T7, T8, A
 from koda_validate._internal import (
+    _dispatch_union_validator,
+    _dispatch_union_validator_async,
     _repr_helper,
     _ResultTuple,
     _ToTupleValidator,
     _union_validator,
     _union_validator_async,
+    _wrap_async_validator,
+    _wrap_sync_validator,
 )
 from koda_validate.base import Validator
+from koda_validate.errors import KeyErrs, PredicateErrs, TypeErr, missing_key_err
+from koda_validate.generic import Choices
+from koda_validate.valid import Invalid
 
 
 class UnionValidator(_ToTupleValidator[A]):
@@ -31,6 +38,11 @@ class UnionValidator(_ToTupleValidator[A]):
         """
         self.validators: tuple[Validator[Any], ...] = (validator_1,) + validators
 
+        # imported here to avoid circular imports
+        from koda_validate._tree import _type_dispatch
+
+        self._type_dispatch = _type_dispatch(self.validators)
+
     @overload
     @staticmethod
     def typed(validator_1: Validator[T1], /) -> "UnionValidator[T1]":
@@ -185,14 +197,163 @@ class UnionValidator(_ToTupleValidator[A]):
         """
         return UnionValidator(validator_1, *validators)
 
+    def is_valid(self, val: Any) -> bool:
+        if self._type_dispatch is None:
+            for validator in self.validators:
+                if validator.is_valid(val):
+                    return True
+        else:
+            for i in self._type_dispatch.indexes(val):
+                if self.validators[i].is_valid(val):
+                    return True
+        return False
+
     def _validate_to_tuple(self, val: Any) -> _ResultTuple[A]:
-        return _union_validator(self, self.validators, val)
+        if self._type_dispatch is None:
+            return _union_validator(self, self.validators, val)
+        else:
+            return _dispatch_union_validator(
+                self, self.validators, val, self._type_dispatch
+            )
 
     async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[A]:
-        return await _union_validator_async(self, self.validators, val)
+        if self._type_dispatch is None:
+            return await _union_validator_async(self, self.validators, val)
+        else:
+            return await _dispatch_union_validator_async(
+                self, self.validators, val, self._type_dispatch
+            )
 
     def __eq__(self, other: Any) -> bool:
         return type(self) == type(other) and self.validators == other.validators
 
     def __repr__(self) -> str:
         return _repr_helper(self.__class__, [repr(v) for v in self.validators])
+
+
+_missing = object()
+
+_VariantT = TypeVar("_VariantT")
+
+
+class DiscriminatedUnionValidator(_ToTupleValidator[Any]):
+    r"""
+    A union of record-like validators, where the variant to use is determined by the
+    value of a single "tag" key. The tag is read once, and the matching variant is
+    found with a single ``dict`` lookup, so only that variant validates the value.
+
+    Values can be ``dict``\s, or instances of the classes of any
+    :class:`DataclassValidator` or :class:`NamedTupleValidator` variants (in which case
+    the tag is read from the attribute named ``key``).
+
+    .. testsetup:: discriminated
+
+        from koda_validate import *
+
+    .. doctest:: discriminated
+
+        >>> validator = DiscriminatedUnionValidator(
+        ...     "type",
+        ...     {
+        ...         "circle": DictValidatorAny(
+        ...             {"type": StringValidator(), "radius": FloatValidator()}
+        ...         ),
+        ...         "square": DictValidatorAny(
+        ...             {"type": StringValidator(), "side": FloatValidator()}
+        ...         ),
+        ...     },
+        ... )
+        >>> validator({"type": "square", "side": 2.0})
+        Valid(val={'type': 'square', 'side': 2.0})
+        >>> validator({"type": "triangle"}).is_valid
+        False
+
+    :param key: the key holding the tag
+    :param variants: the validator to use for each tag. The same validator may be used
+        for more than one tag
+    """
+
+    __match_args__ = ("key", "variants")
+
+    def __init__(self, key: Hashable, variants: Mapping[Any, Validator[Any]]) -> None:
+        if not variants:
+            raise ValueError("at least one variant must be defined")
+
+        self.key = key
+        self.variants: dict[Any, Validator[Any]] = dict(variants)
+
+        self._variants_sync = {
+            tag: _wrap_sync_validator(v) for tag, v in self.variants.items()
+        }
+        self._variants_async = {
+            tag: _wrap_async_validator(v) for tag, v in self.variants.items()
+        }
+        self._type_err = TypeErr(dict)
+        self._tag_choices = Choices(set(self.variants))
+
+        # imported here to avoid circular imports
+        from koda_validate.dataclasses import DataclassValidator
+        from koda_validate.namedtuple import NamedTupleValidator
+
+        # the other types (apart from `dict`) the tag can be read from
+        self._object_types: set[type] = set()
+        for validator in self.variants.values():
+            if isinstance(validator, DataclassValidator):
+                self._object_types.add(validator.data_cls)
+            elif isinstance(validator, NamedTupleValidator):
+                self._object_types.add(validator.named_tuple_cls)
+
+    def _get_variant(
+        self, val: Any, variants: Mapping[Any, _VariantT]
+    ) -> Union[_VariantT, Invalid]:
+        if type(val) is dict:
+            tag = val.get(self.key, _missing)
+        elif type(val) in self._object_types and isinstance(self.key, str):
+            tag = getattr(val, self.key, _missing)
+        else:
+            return Invalid(self._type_err, val, self)
+
+        if tag is _missing:
+            return Invalid(
+                KeyErrs({self.key: Invalid(missing_key_err, val, self)}), val, self
+            )
+
+        try:
+            return variants[tag]
+        except (KeyError, TypeError):
+            # `TypeError`s are from unhashable tags
+            return Invalid(
+                KeyErrs(
+                    {self.key: Invalid(PredicateErrs([self._tag_choices]), tag, self)}
+                ),
+                val,
+                self,
+            )
+
+    def is_valid(self, val: Any) -> bool:
+        variant = self._get_variant(val, self.variants)
+        return not isinstance(variant, Invalid) and variant.is_valid(val)
+
+    def _validate_to_tuple(self, val: Any) -> _ResultTuple[Any]:
+        variant = self._get_variant(val, self._variants_sync)
+        if isinstance(variant, Invalid):
+            return False, variant
+        else:
+            return variant(val)
+
+    async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[Any]:
+        variant = self._get_variant(val, self._variants_async)
+        if isinstance(variant, Invalid):
+            return False, variant
+        else:
+            return await variant(val)
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            type(self) == type(other)
+            and self.key == other.key
+            and self.variants == other.variants
+        )
+
+    def __repr__(self) -> str:
+        return _repr_helper(self.__class__, [repr(self.key), repr(self.variants)])
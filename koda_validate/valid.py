@@ -1,14 +1,23 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, Literal, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    Literal,
+    Optional,
+    Union,
+)
 
 from koda_validate._generics import A, B
-from koda_validate.errors import ErrType
+from koda_validate.errors import _SLOTS, ErrType
 
 if TYPE_CHECKING:
     from koda_validate.base import Validator
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Valid(Generic[A]):
     """
     A wrapper for valid data, e.g. ``Valid("abc")``
@@ -29,7 +38,7 @@ class Valid(Generic[A]):
         return Valid(func(self.val))
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Invalid:
     """
     Represents validation failure. Contains relevant failure data so use case-specific
@@ -63,3 +72,46 @@ class Invalid:
 
 
 ValidationResult = Union[Valid[A], Invalid]
+
+
+@dataclass
+class BatchResult(Generic[A]):
+    """
+    The result of validating many values at once with
+    :meth:`Validator.validate_many<koda_validate.Validator.validate_many>`. No
+    :class:`Valid` instances are created; instead, results are stored by index.
+    """
+
+    valid: list[bool]
+    """
+    Whether the value at each index is valid
+    """
+
+    values: list[Optional[A]]
+    """
+    The valid value at each index, or ``None`` where the value was invalid
+    """
+
+    errors: dict[int, Invalid]
+    """
+    :class:`Invalid` results, keyed by index. Only invalid indexes are present.
+    """
+
+    @property
+    def all_valid(self) -> bool:
+        return not self.errors
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def __getitem__(self, index: int) -> ValidationResult[A]:
+        """
+        Get a :class:`ValidationResult` for a single index.
+
+        :param index: the index of the value
+        :return: :class:`Valid` or :class:`Invalid`
+        """
+        if self.valid[index]:
+            return Valid(self.values[index])  # type: ignore[arg-type]
+        else:
+            return self.errors[index]
@@ -1,5 +1,6 @@
+import pickle
 import re
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError, dataclass
 from decimal import Decimal
 from typing import (
     Annotated,
@@ -16,6 +17,7 @@ from typing import (
     cast,
 )
 
+import pytest
 from koda import Maybe
 
 from koda_validate import (
@@ -62,7 +64,17 @@ from koda_validate.dictionary import (
     RecordValidator,
     is_dict_validator,
 )
-from koda_validate.errors import ErrType, KeyValErrs, PredicateErrs, missing_key_err
+from koda_validate.errors import (
+    CoercionErr,
+    ContainerErr,
+    ErrType,
+    ExtraKeysErr,
+    IndexErrs,
+    KeyValErrs,
+    PredicateErrs,
+    SetErrs,
+    missing_key_err,
+)
 from koda_validate.generic import AlwaysValid
 from koda_validate.maybe import MaybeValidator
 from koda_validate.namedtuple import NamedTupleValidator
@@ -832,3 +844,33 @@ def test_typeddict_can_handle_annotated() -> None:
         {"email": "x" * 21},
         validator,
     )
+
+
+def test_results_and_errors_are_slotted() -> None:
+    invalid = Invalid(TypeErr(int), "a", IntValidator())
+    for obj in [
+        Valid(1),
+        invalid,
+        CoercionErr({str}, int),
+        ContainerErr(invalid),
+        ExtraKeysErr({"a"}),
+        KeyErrs({"a": invalid}),
+        KeyValErrs(key=None, val=invalid),
+        MapErr({"a": KeyValErrs(key=None, val=invalid)}),
+        missing_key_err,
+        IndexErrs({0: invalid}, truncated=True),
+        SetErrs([invalid]),
+        UnionErrs([invalid]),
+        PredicateErrs([Min(1)]),
+        TypeErr(int),
+    ]:
+        assert not hasattr(obj, "__dict__")
+        assert pickle.loads(pickle.dumps(obj)) == obj
+
+    # these are shared between results, so they can't be changed
+    with pytest.raises(FrozenInstanceError):
+        TypeErr(int).expected_type = str  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        CoercionErr({str}, int).dest_type = str  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        ExtraKeysErr({"a"}).expected_keys = set()  # type: ignore[misc]
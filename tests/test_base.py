@@ -0,0 +1,222 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, List
+
+import pytest
+
+from koda_validate import (
+    BatchPredicateAsync,
+    DataclassValidator,
+    IndexErrs,
+    IntValidator,
+    Invalid,
+    KeyErrs,
+    KeyNotRequired,
+    Lazy,
+    ListValidator,
+    MapValidator,
+    PredicateErrs,
+    RecordValidator,
+    StringValidator,
+    Valid,
+    Validator,
+)
+
+
+class InDB(BatchPredicateAsync[Any]):
+    def __init__(self, *valid_vals: Any) -> None:
+        self.valid_vals = valid_vals
+        self.batches: List[List[Any]] = []
+
+    async def validate_batch(self, vals: List[Any]) -> List[bool]:
+        self.batches.append(vals)
+        await asyncio.sleep(0.001)
+        return [val in self.valid_vals for val in vals]
+
+
+@pytest.mark.asyncio
+async def test_batch_predicate_async_single_value() -> None:
+    in_db = InDB("a")
+    assert await in_db.validate_async("a") is True
+    assert await in_db.validate_async("b") is False
+    assert in_db.batches == [["a"], ["b"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_predicate_async_batches_same_tick() -> None:
+    in_db = InDB("a", "c")
+    assert await asyncio.gather(*[in_db.validate_async(v) for v in "abc"]) == [
+        True,
+        False,
+        True,
+    ]
+    assert in_db.batches == [["a", "b", "c"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_predicate_async_list() -> None:
+    in_db = InDB("a", "c")
+    item_validator = StringValidator(predicates_async=[in_db])
+    validator = ListValidator(item_validator)
+
+    assert await validator.validate_async(["a", "c", "a"]) == Valid(["a", "c", "a"])
+    assert in_db.batches == [["a", "c", "a"]]
+
+    assert await validator.validate_async(["a", "b", "d"]) == Invalid(
+        IndexErrs(
+            {
+                1: Invalid(PredicateErrs([in_db]), "b", item_validator),
+                2: Invalid(PredicateErrs([in_db]), "d", item_validator),
+            }
+        ),
+        ["a", "b", "d"],
+        validator,
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_predicate_async_nested() -> None:
+    user_in_db = InDB("ann", "bob")
+    team_in_db = InDB("red")
+
+    @dataclass
+    class Member:
+        user: str
+        manager: str
+        team: str
+
+    string_in_db = StringValidator(predicates_async=[user_in_db])
+    team_validator = StringValidator(predicates_async=[team_in_db])
+    validator = ListValidator(
+        DataclassValidator(
+            Member,
+            overrides={
+                "user": string_in_db,
+                "manager": string_in_db,
+                "team": team_validator,
+            },
+        )
+    )
+
+    data = [
+        {"user": "ann", "manager": "bob", "team": "red"},
+        {"user": "bob", "manager": "cat", "team": "blue"},
+    ]
+    assert await validator.validate_async(data) == Invalid(
+        IndexErrs(
+            {
+                1: Invalid(
+                    KeyErrs(
+                        {
+                            "manager": Invalid(
+                                PredicateErrs([user_in_db]), "cat", string_in_db
+                            ),
+                            "team": Invalid(
+                                PredicateErrs([team_in_db]), "blue", team_validator
+                            ),
+                        }
+                    ),
+                    data[1],
+                    validator.item_validator,
+                )
+            }
+        ),
+        data,
+        validator,
+    )
+    # one call per predicate
+    assert user_in_db.batches == [["ann", "bob", "bob", "cat"]]
+    assert team_in_db.batches == [["red", "blue"]]
+
+
+@dataclass
+class Node:
+    val: int
+    next: Any
+
+
+@pytest.mark.asyncio
+async def test_recursive_lazy_building_new_validators() -> None:
+    # each call builds a new validator, so the tree can't be walked up front
+    def node() -> Validator[Node]:
+        return RecordValidator(
+            into=Node,
+            keys=(("val", IntValidator()), ("next", KeyNotRequired(Lazy(node)))),
+        )
+
+    result = await node().validate_async({"val": 1, "next": {"val": 2}})
+    assert result.is_valid
+    assert result.val.next.val.val == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_predicate_async_within_lazy() -> None:
+    in_db = InDB("a", "c")
+
+    def item_validator() -> Validator[str]:
+        return StringValidator(predicates_async=[in_db])
+
+    # `Lazy` validators aren't resolved to look for batch predicates...
+    assert await ListValidator(Lazy(item_validator)).validate_async(["a", "c"]) == Valid(
+        ["a", "c"]
+    )
+    assert in_db.batches == [["a"], ["c"]]
+
+    # ...but `max_concurrency` allows them to be batched
+    in_db.batches.clear()
+    assert await ListValidator(Lazy(item_validator), max_concurrency=10).validate_async(
+        ["a", "c"]
+    ) == Valid(["a", "c"])
+    assert in_db.batches == [["a", "c"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_predicate_async_map() -> None:
+    in_db = InDB("a", "b")
+    validator = MapValidator(
+        key=StringValidator(predicates_async=[in_db]), value=IntValidator()
+    )
+    assert await validator.validate_async({"a": 1, "b": 2}) == Valid({"a": 1, "b": 2})
+    assert in_db.batches == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_predicate_async_exceptions() -> None:
+    class Fails(BatchPredicateAsync[int]):
+        async def validate_batch(self, vals: List[int]) -> List[bool]:
+            raise ValueError("db is down")
+
+    fails = Fails()
+    results = await asyncio.gather(
+        fails.validate_async(1), fails.validate_async(2), return_exceptions=True
+    )
+    assert [str(r) for r in results] == ["db is down", "db is down"]
+
+    class WrongLength(BatchPredicateAsync[int]):
+        async def validate_batch(self, vals: List[int]) -> List[bool]:
+            return [True]
+
+    wrong_length = WrongLength()
+    with pytest.raises(ValueError):
+        await asyncio.gather(
+            wrong_length.validate_async(1), wrong_length.validate_async(2)
+        )
+
+
+@pytest.mark.asyncio
+async def test_batch_predicate_async_cancelled_caller() -> None:
+    in_db = InDB(1, 2)
+    cancelled = asyncio.ensure_future(in_db.validate_async(1))
+    not_cancelled = asyncio.ensure_future(in_db.validate_async(2))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    assert await not_cancelled is True
+    assert cancelled.cancelled()
+    assert in_db.batches == [[1, 2]]
+
+
+def test_batch_predicate_async_multiple_event_loops() -> None:
+    in_db = InDB(1)
+    assert asyncio.run(in_db.validate_async(1)) is True
+    assert asyncio.run(in_db.validate_async(2)) is False
+    assert in_db.batches == [[1], [2]]
@@ -0,0 +1,188 @@
+import json
+import pickle
+from dataclasses import dataclass
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, TypedDict
+
+import pytest
+
+from koda_validate import (
+    Choices,
+    DataclassValidator,
+    DictValidatorAny,
+    EqualTo,
+    FloatValidator,
+    IntValidator,
+    KeyNotRequired,
+    ListValidator,
+    Max,
+    MaxLength,
+    Min,
+    MultipleOf,
+    StringValidator,
+    TypedDictValidator,
+    UniformTupleValidator,
+    ValidationResult,
+    Validator,
+)
+from koda_validate.bulk import BulkStats, validate_ndjson_bulk
+from koda_validate.serialization import Serializable
+
+
+@dataclass
+class Event:
+    id: int
+    name: str
+    tags: Optional[List[str]] = None
+
+
+class EventDict(TypedDict):
+    id: int
+    name: str
+
+
+LINES = [
+    {"id": 1, "name": "a"},
+    {"id": "2", "name": "b"},
+    {"id": 3, "name": "c", "tags": ["x"]},
+    {"name": "d"},
+    {"id": 5, "name": "e"},
+]
+
+
+def ndjson(lines: List[Any]) -> bytes:
+    return b"".join(json.dumps(line).encode() + b"\n" for line in lines)
+
+
+def run(
+    validator: Validator[Any], source: Any, **kwargs: Any
+) -> Tuple[List[Tuple[int, Any]], List[Tuple[int, Serializable]], BulkStats]:
+    valid: List[Tuple[int, Any]] = []
+    invalid: List[Tuple[int, Serializable]] = []
+    stats = validate_ndjson_bulk(
+        validator,
+        source,
+        on_valid=lambda i, val: valid.append((i, val)),
+        on_invalid=lambda i, errs: invalid.append((i, errs)),
+        **kwargs,
+    )
+    return valid, invalid, stats
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+def test_validate_ndjson_bulk(workers: int, chunk_size: int) -> None:
+    valid, invalid, stats = run(
+        DataclassValidator(Event),
+        BytesIO(ndjson(LINES)),
+        workers=workers,
+        chunk_size=chunk_size,
+        max_pending_chunks=2,
+    )
+    assert valid == [
+        (0, Event(1, "a")),
+        (2, Event(3, "c", ["x"])),
+        (4, Event(5, "e")),
+    ]
+    assert invalid == [
+        (1, {"id": ["expected an integer"]}),
+        (3, {"id": ["key missing"]}),
+    ]
+    assert (stats.records, stats.valid, stats.invalid) == (5, 3, 2)
+    assert stats.error_rate == 0.4
+    assert stats.seconds > 0
+    assert stats.records_per_second > 0
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_validate_ndjson_bulk_typeddict_path(workers: int, tmp_path: Path) -> None:
+    path = tmp_path / "events.ndjson"
+    path.write_bytes(ndjson(LINES))
+    valid, invalid, stats = run(TypedDictValidator(EventDict), path, workers=workers)
+    assert valid == [
+        (0, {"id": 1, "name": "a"}),
+        (2, {"id": 3, "name": "c"}),
+        (4, {"id": 5, "name": "e"}),
+    ]
+    assert [i for i, _ in invalid] == [1, 3]
+    assert (stats.records, stats.valid, stats.invalid) == (5, 3, 2)
+
+
+def test_validate_ndjson_bulk_blank_lines_and_invalid_json() -> None:
+    valid, invalid, stats = run(
+        IntValidator(), StringIO('1\n\n  \n{"a": \n2\n'), workers=0, chunk_size=2
+    )
+    assert valid == [(0, 1), (4, 2)]
+    assert invalid == [(3, ["invalid JSON: Expecting value"])]
+    assert (stats.records, stats.valid, stats.invalid) == (3, 2, 1)
+
+
+def test_validate_ndjson_bulk_empty() -> None:
+    valid, invalid, stats = run(IntValidator(), BytesIO(b""), workers=0)
+    assert valid == invalid == []
+    assert stats == BulkStats(seconds=stats.seconds)
+    assert stats.error_rate == 0.0
+    assert BulkStats().records_per_second == 0.0
+
+
+class RaisesValidator(Validator[Any]):
+    def __call__(self, val: Any) -> ValidationResult[Any]:
+        raise ValueError("uh oh")
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_validate_ndjson_bulk_exceptions(workers: int) -> None:
+    with pytest.raises(ValueError, match="uh oh"):
+        run(RaisesValidator(), BytesIO(ndjson(LINES)), workers=workers, chunk_size=1)
+
+    def bad_sink(i: int, val: Any) -> None:
+        raise KeyError(i)
+
+    with pytest.raises(KeyError):
+        validate_ndjson_bulk(
+            IntValidator(),
+            BytesIO(ndjson(list(range(10)))),
+            on_valid=bad_sink,
+            on_invalid=bad_sink,
+            workers=workers,
+            chunk_size=1,
+        )
+
+
+def test_validate_ndjson_bulk_bad_params() -> None:
+    for kwargs in [{"workers": -1}, {"chunk_size": 0}, {"max_pending_chunks": 0}]:
+        with pytest.raises(ValueError):
+            run(IntValidator(), BytesIO(b""), **kwargs)
+
+
+@pytest.mark.parametrize(
+    "validator",
+    [
+        IntValidator(),
+        StringValidator(MaxLength(5)),
+        DataclassValidator(Event),
+        TypedDictValidator(EventDict),
+        DictValidatorAny({"a": KeyNotRequired(IntValidator())}),
+        ListValidator(UniformTupleValidator(IntValidator())),
+        ListValidator(IntValidator(Min(1))),
+        ListValidator(
+            FloatValidator(Min(0.0, exclusive_minimum=True), Max(10.0), MultipleOf(0.5))
+        ),
+        ListValidator(IntValidator(EqualTo(1), Choices({1, 2}))),
+    ],
+)
+def test_validators_can_be_pickled(validator: Validator[Any]) -> None:
+    unpickled = pickle.loads(pickle.dumps(validator))
+    assert unpickled == validator
+    for val in [
+        1,
+        "abc",
+        {"id": 1, "name": "a"},
+        {"a": 1},
+        [[1, 2], (3,)],
+        # long enough to be validated with numpy, if it's installed
+        [1] * 100,
+        [1.5] * 100,
+    ]:
+        assert unpickled(val).is_valid == validator(val).is_valid
@@ -1,15 +1,28 @@
+import asyncio
+import threading
 from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from enum import Enum
 from typing import Any, Dict, List, Tuple
+from uuid import UUID
 
 import pytest
 from koda import Just, Maybe, nothing
 
 from koda_validate import (
+    FloatValidator,
+    IntValidator,
     Invalid,
+    LRUCacheValidator,
+    PredicateErrs,
     StringValidator,
+    TTLCacheValidator,
     TypeErr,
     Valid,
     ValidationResult,
+    Validator,
+    always_valid,
     not_blank,
 )
 from koda_validate._generics import A
@@ -121,3 +134,311 @@ async def test_cache_validator_async() -> None:
         ("ok", Valid("ok")),
         (5, Invalid(TypeErr(str), 5, cache_str_validator.validator)),
     ]
+
+
+@dataclass
+class CountingValidator(Validator[Any]):
+    validator: Validator[Any]
+    calls: int = 0
+
+    def __call__(self, val: Any) -> ValidationResult[Any]:
+        self.calls += 1
+        return self.validator(val)
+
+    async def validate_async(self, val: Any) -> ValidationResult[Any]:
+        self.calls += 1
+        return await self.validator.validate_async(val)
+
+
+def test_lru_cache_validator() -> None:
+    counting_validator = CountingValidator(IntValidator())
+    validator = LRUCacheValidator(counting_validator, max_size=2)
+
+    assert validator(1) == Valid(1)
+    assert validator(1) == Valid(1)
+    assert validator("1") == Invalid(TypeErr(int), "1", IntValidator())
+    assert validator("1") == Invalid(TypeErr(int), "1", IntValidator())
+    assert counting_validator.calls == 2
+    assert (validator.hits, validator.misses, validator.evictions) == (2, 2, 0)
+
+    # `1` was used least recently
+    assert validator(2) == Valid(2)
+    assert (validator.hits, validator.misses, validator.evictions) == (2, 3, 1)
+    assert validator("1").is_valid is False
+    assert validator(1) == Valid(1)
+    assert counting_validator.calls == 4
+    assert (validator.hits, validator.misses, validator.evictions) == (3, 4, 2)
+
+    validator.clear()
+    assert (validator.hits, validator.misses, validator.evictions) == (0, 0, 0)
+    assert validator(1) == Valid(1)
+    assert counting_validator.calls == 5
+
+    with pytest.raises(ValueError):
+        LRUCacheValidator(IntValidator(), max_size=0)
+
+
+def test_lru_cache_validator_fingerprints() -> None:
+    class Color(Enum):
+        RED = 1
+
+    counting_validator = CountingValidator(always_valid)
+    validator = LRUCacheValidator(counting_validator)
+
+    # equal in python, but not the same for validation purposes
+    distinct_vals: List[Any] = [
+        1,
+        1.0,
+        True,
+        -0.0,
+        0.0,
+        Decimal("1.0"),
+        Decimal("1.00"),
+        [1],
+        (1,),
+        {1},
+        frozenset([1]),
+        {"a": 1},
+        {"a": 1.0},
+        {"a": [1, 2], "b": None},
+        {"b": None, "a": [1, 2]},
+        b"1",
+        "1",
+        date(2020, 1, 1),
+        UUID(int=1),
+        Color.RED,
+    ]
+    for val in distinct_vals:
+        assert validator(val) == Valid(val)
+    assert counting_validator.calls == len(distinct_vals)
+
+    for val in distinct_vals:
+        assert validator(val) == Valid(val)
+    assert counting_validator.calls == len(distinct_vals)
+    assert validator.hits == len(distinct_vals)
+
+    # structurally identical, but not the same objects
+    assert validator({"a": [1, 2], "b": None}) == Valid({"a": [1, 2], "b": None})
+    assert counting_validator.calls == len(distinct_vals)
+
+
+def test_lru_cache_validator_bypasses_unfingerprintable_values() -> None:
+    class Obj:
+        pass
+
+    recursive_list: List[Any] = []
+    recursive_list.append(recursive_list)
+
+    counting_validator = CountingValidator(always_valid)
+    validator = LRUCacheValidator(counting_validator)
+    for val in [Obj(), [Obj()], recursive_list]:
+        assert validator(val) == Valid(val)
+        assert validator(val) == Valid(val)
+    assert counting_validator.calls == 6
+    assert validator.hits == 0
+    assert validator.misses == 6
+    assert validator._cache == {}
+
+
+def test_lru_cache_validator_hooks() -> None:
+    validator = LRUCacheValidator(FloatValidator())
+    assert validator.cache_get_sync(1.5).is_just is False
+    validator.cache_set_sync(1.5, Valid(2.5))
+    assert validator.cache_get_sync(1.5) == Just(Valid(2.5))
+    assert validator(1.5) == Valid(2.5)
+
+
+def test_lru_cache_validator_threads() -> None:
+    validator = LRUCacheValidator(IntValidator(), max_size=50)
+
+    def run() -> None:
+        for i in range(1_000):
+            assert validator(i % 100) == Valid(i % 100)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert validator.hits + validator.misses == 8_000
+    assert len(validator._cache) == 50
+
+
+@pytest.mark.asyncio
+async def test_lru_cache_validator_async() -> None:
+    counting_validator = CountingValidator(StringValidator(not_blank))
+    validator = LRUCacheValidator(counting_validator, max_size=10)
+
+    assert await validator.validate_async(["not a str"]) == Invalid(
+        TypeErr(str), ["not a str"], StringValidator(not_blank)
+    )
+    assert await validator.validate_async(["not a str"]) == Invalid(
+        TypeErr(str), ["not a str"], StringValidator(not_blank)
+    )
+    assert await validator.validate_async("ok") == Valid("ok")
+    assert counting_validator.calls == 2
+    assert validator.hits == 1
+
+    assert await validator.cache_get_async("ok") == Just(Valid("ok"))
+    await validator.cache_set_async("other", Valid("ok"))
+    assert await validator.validate_async("other") == Valid("ok")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_validator() -> None:
+    clock = FakeClock()
+    counting_validator = CountingValidator(IntValidator())
+    validator = TTLCacheValidator(
+        counting_validator, ttl=10, invalid_ttl=1, max_size=2, clock=clock
+    )
+
+    assert validator(1) == Valid(1)
+    assert validator("1") == Invalid(TypeErr(int), "1", IntValidator())
+    clock.now = 0.5
+    assert validator(1) == Valid(1)
+    assert validator("1") == Invalid(TypeErr(int), "1", IntValidator())
+    assert counting_validator.calls == 2
+
+    # invalid results expire sooner
+    clock.now = 1.0
+    assert validator(1) == Valid(1)
+    assert validator("1") == Invalid(TypeErr(int), "1", IntValidator())
+    assert counting_validator.calls == 3
+
+    clock.now = 10.0
+    assert validator(1) == Valid(1)
+    assert counting_validator.calls == 4
+    assert (validator.hits, validator.misses) == (3, 4)
+
+    # LRU eviction
+    assert validator(2) == Valid(2)
+    assert validator(3) == Valid(3)
+    assert validator("1").is_valid is False
+    assert counting_validator.calls == 7
+
+    validator.clear()
+    assert (validator.hits, validator.misses) == (0, 0)
+    assert validator._cache == {}
+
+    with pytest.raises(ValueError):
+        TTLCacheValidator(IntValidator(), max_size=0)
+    with pytest.raises(ValueError):
+        TTLCacheValidator(IntValidator(), ttl=-1)
+    with pytest.raises(ValueError):
+        TTLCacheValidator(IntValidator(), invalid_ttl=-1)
+
+
+def test_ttl_cache_validator_no_negative_caching() -> None:
+    counting_validator = CountingValidator(IntValidator())
+    validator = TTLCacheValidator(counting_validator, invalid_ttl=0)
+    for _ in range(2):
+        assert validator(1) == Valid(1)
+        assert validator("1").is_valid is False
+    assert counting_validator.calls == 3
+
+    # unfingerprintable values
+    assert validator(object()).is_valid is False
+    assert validator.cache_get_sync(object()) == nothing
+    validator.cache_set_sync(5, Valid(6))
+    assert validator(5) == Valid(6)
+
+
+class SlowUsernameValidator(Validator[str]):
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def validate_async(self, val: Any) -> ValidationResult[str]:
+        self.calls += 1
+        await self.release.wait()
+        if val == "error":
+            raise ValueError("db down")
+        elif val in {"michael", "gob"}:
+            return Valid(val)
+        else:
+            return Invalid(PredicateErrs([not_blank]), val, self)
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_validator_single_flight() -> None:
+    slow_validator = SlowUsernameValidator()
+    validator = TTLCacheValidator(slow_validator)
+
+    tasks = [
+        asyncio.create_task(validator.validate_async(name))
+        for name in ["michael", "tobias", "michael", "tobias", "michael"]
+    ]
+    await asyncio.sleep(0)
+    slow_validator.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert slow_validator.calls == 2
+    assert (validator.hits, validator.misses) == (3, 2)
+    assert results[0] == results[2] == results[4] == Valid("michael")
+    assert isinstance(results[1], Invalid)
+    assert results[1] is results[3]
+    assert validator._in_flight == {}
+
+    assert await validator.validate_async("michael") == Valid("michael")
+    assert await validator.cache_get_async("tobias") == Just(results[1])
+    await validator.cache_set_async("gob", Valid("gob"))
+    assert await validator.validate_async("gob") == Valid("gob")
+    assert slow_validator.calls == 2
+
+    slow_validator.release.clear()
+    task = asyncio.create_task(validator.validate_async(object()))
+    await asyncio.sleep(0)
+    slow_validator.release.set()
+    assert (await task).is_valid is False
+    assert slow_validator.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_validator_exceptions_are_shared_not_cached() -> None:
+    slow_validator = SlowUsernameValidator()
+    validator = TTLCacheValidator(slow_validator)
+
+    tasks = [asyncio.create_task(validator.validate_async("error")) for _ in range(3)]
+    await asyncio.sleep(0)
+    slow_validator.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert slow_validator.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+    with pytest.raises(ValueError):
+        await validator.validate_async("error")
+    assert slow_validator.calls == 2
+    assert validator._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_validator_cancellation() -> None:
+    slow_validator = SlowUsernameValidator()
+    validator = TTLCacheValidator(slow_validator)
+
+    leader = asyncio.create_task(validator.validate_async("michael"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(validator.validate_async("michael"))
+    cancelled_follower = asyncio.create_task(validator.validate_async("michael"))
+    await asyncio.sleep(0)
+
+    # cancelling a waiting caller doesn't affect anyone else
+    cancelled_follower.cancel()
+    await asyncio.sleep(0)
+    assert cancelled_follower.cancelled()
+
+    # if the caller doing the work is cancelled, a waiting caller takes over
+    leader.cancel()
+    await asyncio.sleep(0)
+    slow_validator.release.set()
+    assert await follower == Valid("michael")
+    assert leader.cancelled()
+    assert slow_validator.calls == 2
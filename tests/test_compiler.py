@@ -0,0 +1,298 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, NamedTuple, Optional, TypedDict
+
+import pytest
+from koda import Just, Maybe, nothing
+
+from koda_validate import (
+    CoercionErr,
+    DataclassValidator,
+    DictValidatorAny,
+    ExtraKeysErr,
+    FloatValidator,
+    IntValidator,
+    Invalid,
+    KeyErrs,
+    KeyNotRequired,
+    Lazy,
+    ListValidator,
+    Min,
+    NamedTupleValidator,
+    NoneValidator,
+    OptionalValidator,
+    RecordValidator,
+    StringValidator,
+    TypedDictValidator,
+    TypeErr,
+    Valid,
+    Validator,
+    always_valid,
+    compile_validator,
+)
+from koda_validate.coerce import coercer
+from koda_validate.errors import ErrType, missing_key_err
+from koda_validate.serialization import SerializableErr
+
+
+@dataclass
+class Hobby:
+    name: str
+    enjoyment: float
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+    hobbies: List[Hobby]
+    nickname: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+
+
+class PersonTD(TypedDict, total=False):
+    name: str
+    age: int
+
+
+class PersonNT(NamedTuple):
+    name: str
+    age: int = 5
+
+
+def assert_same_results(
+    make_validator: Callable[[], Validator[Any]], values: List[Any]
+) -> None:
+    validator = make_validator()
+    expected = [validator(val) for val in values]
+    compile_validator(validator)
+    for val, expected_result in zip(values, expected):
+        assert validator(val) == expected_result, val
+
+
+def test_compile_returns_same_validator() -> None:
+    validator = DataclassValidator(Person)
+    assert compile_validator(validator) is validator
+    assert "_validate_to_tuple" in validator.__dict__
+
+
+def test_record_validator() -> None:
+    @dataclass
+    class Item:
+        a: str
+        b: Maybe[int]
+        c: Optional[float]
+        d: Any
+        e: int
+
+    def make() -> Validator[Any]:
+        return RecordValidator(
+            into=Item,
+            keys=(
+                ("a", StringValidator()),
+                ("b", KeyNotRequired(IntValidator())),
+                ("c", OptionalValidator(FloatValidator())),
+                (5, always_valid),
+                (("tuple", "key"), IntValidator(Min(0))),
+            ),
+        )
+
+    validator = compile_validator(make())
+    assert validator({"a": "x", "c": None, 5: [], ("tuple", "key"): 1}) == Valid(
+        Item("x", nothing, None, [], 1)
+    )
+    assert validator({"a": "x", "b": 2, "c": 1.5, 5: 1, ("tuple", "key"): 1}) == Valid(
+        Item("x", Just(2), 1.5, 1, 1)
+    )
+    data = {"a": 1, "b": "2", "c": 1, 5: 1}
+    assert validator(data) == Invalid(
+        KeyErrs(
+            {
+                "a": Invalid(TypeErr(str), 1, StringValidator()),
+                "b": Invalid(TypeErr(int), "2", IntValidator()),
+                "c": validator.keys[2][1](1),  # type: ignore
+                ("tuple", "key"): Invalid(missing_key_err, data, validator),
+            }
+        ),
+        data,
+        validator,
+    )
+
+    assert_same_results(
+        make,
+        [
+            None,
+            [],
+            {},
+            {"a": "x", "c": None, 5: [], ("tuple", "key"): -1},
+            {"a": "x", "b": None, "c": "1", 5: None, ("tuple", "key"): True},
+        ],
+    )
+
+
+def test_record_validator_validate_object_and_unknown_keys() -> None:
+    @dataclass
+    class Range:
+        low: int
+        high: int
+
+    def check_range(r: Range) -> Optional[ErrType]:
+        return None if r.low <= r.high else SerializableErr("bad range")
+
+    def make() -> Validator[Any]:
+        return RecordValidator(
+            into=Range,
+            keys=(("low", IntValidator()), ("high", IntValidator())),
+            validate_object=check_range,
+            fail_on_unknown_keys=True,
+        )
+
+    validator = compile_validator(make())
+    assert validator({"low": 1, "high": 2}) == Valid(Range(1, 2))
+    assert validator({"low": 3, "high": 2}) == Invalid(
+        SerializableErr("bad range"), Range(3, 2), validator
+    )
+    assert validator({"low": 1, "high": 2, "other": 3}) == Invalid(
+        ExtraKeysErr({"low", "high"}), {"low": 1, "high": 2, "other": 3}, validator
+    )
+
+
+def test_dataclass_validator() -> None:
+    validator = compile_validator(DataclassValidator(Person))
+    assert validator({"name": "a", "age": 1, "hobbies": []}) == Valid(Person("a", 1, []))
+    assert validator(Person("a", 1, [Hobby("x", 1.0)], "b", ["c"])) == Valid(
+        Person("a", 1, [Hobby("x", 1.0)], "b", ["c"])
+    )
+    assert validator(5) == Invalid(CoercionErr({dict, Person}, Person), 5, validator)
+
+    assert_same_results(
+        lambda: DataclassValidator(Person, fail_on_unknown_keys=True),
+        [
+            {"name": "a", "age": 1, "hobbies": [{"name": "x", "enjoyment": 1.0}]},
+            {"name": "a", "age": 1, "hobbies": [{"name": "x", "enjoyment": 1}]},
+            {"name": "a", "hobbies": [5], "nickname": 5, "tags": [None]},
+            {"name": "a", "age": 1, "hobbies": [], "unknown": 1},
+            Hobby("a", 1.0),
+        ],
+    )
+
+
+def test_dataclass_validator_coerce() -> None:
+    @coercer(dict, str)
+    def from_str(val: Any) -> Maybe[dict[str, Any]]:
+        if isinstance(val, dict):
+            return Just(val)
+        elif isinstance(val, str):
+            return Just({"name": val, "enjoyment": 1.0})
+        else:
+            return nothing
+
+    assert_same_results(
+        lambda: DataclassValidator(Hobby, coerce=from_str),
+        ["running", {"name": "a", "enjoyment": 2.0}, {"name": 1}, 5, None],
+    )
+
+
+def test_typeddict_validator() -> None:
+    validator = compile_validator(TypedDictValidator(PersonTD))
+    assert validator({"age": 1}) == Valid({"age": 1})
+    assert repr(validator({"age": 1, "name": "a"})) == repr(
+        Valid({"name": "a", "age": 1})
+    )
+
+    assert_same_results(
+        lambda: TypedDictValidator(PersonTD, fail_on_unknown_keys=True),
+        [{}, {"name": 1}, {"name": "a", "age": 2, "other": 3}, None, []],
+    )
+
+
+def test_namedtuple_validator() -> None:
+    assert_same_results(
+        lambda: NamedTupleValidator(PersonNT),
+        [{"name": "a"}, {"name": "a", "age": 1}, PersonNT("b"), {"age": "1"}, 5],
+    )
+
+
+def test_dict_validator_any() -> None:
+    assert_same_results(
+        lambda: DictValidatorAny(
+            {
+                "a": StringValidator(),
+                "b": KeyNotRequired(NoneValidator()),
+                1: ListValidator(IntValidator()),
+            }
+        ),
+        [{"a": "x", 1: []}, {"a": "x", "b": None, 1: [1]}, {"b": 1, 1: ["x"]}, []],
+    )
+
+
+def test_nested_lazy() -> None:
+    @dataclass
+    class Node:
+        val: int
+        children: List["Node"]
+
+    def make() -> Validator[Any]:
+        def node_validator() -> Validator[Node]:
+            return validator
+
+        validator: Validator[Node] = RecordValidator(
+            into=Node,
+            keys=(
+                ("val", IntValidator()),
+                ("children", ListValidator(Lazy(node_validator))),
+            ),
+        )
+        return validator
+
+    assert_same_results(
+        make,
+        [
+            {"val": 1, "children": [{"val": 2, "children": []}]},
+            {"val": 1, "children": [{"val": "2", "children": [None]}]},
+        ],
+    )
+
+
+def test_lazy_building_new_validators() -> None:
+    # each call builds a new validator
+    def node_validator() -> DictValidatorAny:
+        return DictValidatorAny(
+            {"val": IntValidator(), "next": KeyNotRequired(Lazy(node_validator))}
+        )
+
+    validator = compile_validator(node_validator())
+    data = {"val": 1, "next": {"val": 2, "next": {"val": 3}}}
+    assert validator(data) == Valid(data)
+    assert not validator({"val": 1, "next": {"val": "2"}}).is_valid
+    next_validator = validator.schema["next"]
+    assert isinstance(next_validator, KeyNotRequired)
+    assert isinstance(next_validator.validator, Lazy)
+    assert "_validate_to_tuple" in next_validator.validator._resolve().__dict__
+
+
+def test_nested_validators_are_compiled() -> None:
+    hobby_validator = RecordValidator(
+        into=Hobby, keys=(("name", StringValidator()), ("enjoyment", FloatValidator()))
+    )
+    list_validator = compile_validator(ListValidator(hobby_validator))
+    assert "_validate_to_tuple" in hobby_validator.__dict__
+    assert (
+        list_validator._wrapped_item_validator_sync
+        is hobby_validator.__dict__["_validate_to_tuple"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_is_unaffected() -> None:
+    async def validate_obj(obj: Hobby) -> Optional[ErrType]:
+        return None
+
+    validator = compile_validator(
+        DataclassValidator(Hobby, validate_object_async=validate_obj)
+    )
+    assert "_validate_to_tuple" not in validator.__dict__
+    assert await validator.validate_async({"name": "a", "enjoyment": 1.0}) == Valid(
+        Hobby("a", 1.0)
+    )
+    with pytest.raises(AssertionError):
+        validator({"name": "a", "enjoyment": 1.0})
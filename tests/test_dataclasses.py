@@ -27,6 +27,7 @@ from koda_validate.dataclasses import DataclassValidator
 from koda_validate.errors import ErrType, missing_key_err
 from koda_validate.serialization import SerializableErr
 from koda_validate.typehints import get_typehint_validator, get_typehint_validator_base
+from tests.utils import ConcurrencyTracker
 
 
 @dataclass
@@ -675,3 +676,44 @@ async def test_coerce_async() -> None:
     assert await validator.validate_async([("a", "neat")]) == Valid(X("neat"))
 
     assert isinstance(await validator.validate_async([123]), Invalid)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency() -> None:
+    @dataclass
+    class Name:
+        first: str
+        middle: str
+        last: str
+
+    tracker = ConcurrencyTracker()
+    not_taken_pred = tracker.predicate(lambda val: val != "taken")
+    not_taken = StringValidator(predicates_async=[not_taken_pred])
+    validator = DataclassValidator(
+        Name,
+        overrides={"first": not_taken, "middle": not_taken, "last": not_taken},
+        max_concurrency=3,
+    )
+    assert validator == DataclassValidator(
+        Name,
+        overrides={"first": not_taken, "middle": not_taken, "last": not_taken},
+        max_concurrency=3,
+    )
+    assert "max_concurrency=3" in repr(validator)
+
+    assert await validator.validate_async(
+        {"first": "a", "middle": "b", "last": "c"}
+    ) == Valid(Name("a", "b", "c"))
+    assert tracker.max_running == 3
+
+    data = {"first": "taken", "middle": "b", "last": "taken"}
+    assert await validator.validate_async(data) == Invalid(
+        KeyErrs(
+            {
+                "first": Invalid(PredicateErrs([not_taken_pred]), "taken", not_taken),
+                "last": Invalid(PredicateErrs([not_taken_pred]), "taken", not_taken),
+            }
+        ),
+        data,
+        validator,
+    )
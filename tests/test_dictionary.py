@@ -43,6 +43,7 @@ from koda_validate.dictionary import (
 )
 from koda_validate.errors import ErrType, KeyValErrs, missing_key_err
 from koda_validate.serialization import SerializableErr
+from tests.utils import ConcurrencyTracker
 
 
 class PersonLike(Protocol):
@@ -1391,3 +1392,237 @@ def test_dict_validator_any_repr() -> None:
         == f"DictValidatorAny({repr(schema)}, "
         f"validate_object={repr(fn_1)}, fail_on_unknown_keys=True)"
     )
+
+
+@pytest.mark.asyncio
+async def test_record_validator_max_concurrency() -> None:
+    @dataclass
+    class Person:
+        name: str
+        age: int
+        email: str
+        nickname: Maybe[str]
+
+    tracker = ConcurrencyTracker()
+    not_taken = tracker.predicate(lambda val: val != "taken")
+
+    def make_validator(max_concurrency: Optional[int]) -> RecordValidator[Person]:
+        return RecordValidator(
+            into=Person,
+            keys=(
+                ("name", StringValidator(predicates_async=[not_taken])),
+                ("age", IntValidator(Min(0))),
+                ("email", StringValidator(predicates_async=[not_taken])),
+                (
+                    "nickname",
+                    KeyNotRequired(StringValidator(predicates_async=[not_taken])),
+                ),
+            ),
+            max_concurrency=max_concurrency,
+        )
+
+    valid_data = {"name": "a", "age": 1, "email": "b", "nickname": "c"}
+    invalid_data = {"name": "taken", "age": -1, "email": "b", "nickname": "taken"}
+
+    sequential_validator = make_validator(None)
+    assert await sequential_validator.validate_async(valid_data) == Valid(
+        Person("a", 1, "b", Just("c"))
+    )
+    assert tracker.max_running == 1
+    sequential_invalid = await sequential_validator.validate_async(invalid_data)
+    assert not sequential_invalid.is_valid
+
+    tracker.max_running = 0
+    concurrent_validator = make_validator(2)
+    assert await concurrent_validator.validate_async(valid_data) == Valid(
+        Person("a", 1, "b", Just("c"))
+    )
+    assert tracker.max_running == 2
+
+    concurrent_invalid = await concurrent_validator.validate_async(invalid_data)
+    assert not concurrent_invalid.is_valid
+    assert isinstance(concurrent_invalid.err_type, KeyErrs)
+    assert isinstance(sequential_invalid.err_type, KeyErrs)
+    assert list(concurrent_invalid.err_type.keys) == ["name", "age", "nickname"]
+    assert concurrent_invalid.err_type.keys == sequential_invalid.err_type.keys
+
+    # missing keys
+    assert await concurrent_validator.validate_async({"age": 5}) == Invalid(
+        KeyErrs(
+            {
+                "name": Invalid(missing_key_err, {"age": 5}, concurrent_validator),
+                "email": Invalid(missing_key_err, {"age": 5}, concurrent_validator),
+            }
+        ),
+        {"age": 5},
+        concurrent_validator,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dict_validator_any_max_concurrency() -> None:
+    tracker = ConcurrencyTracker()
+    not_blank = tracker.predicate(lambda val: val != "")
+    schema: Dict[Any, Validator[Any]] = {
+        i: StringValidator(predicates_async=[not_blank]) for i in range(5)
+    }
+    data = {i: str(i) for i in range(5)}
+    assert await DictValidatorAny(schema, max_concurrency=10).validate_async(
+        data
+    ) == Valid(data)
+    assert tracker.max_running == 5
+
+    tracker.max_running = 0
+    validator = DictValidatorAny(schema, max_concurrency=3)
+    assert await validator.validate_async({**data, 1: "", 3: ""}) == Invalid(
+        KeyErrs(
+            {
+                1: Invalid(PredicateErrs([not_blank]), "", schema[1]),
+                3: Invalid(PredicateErrs([not_blank]), "", schema[3]),
+            }
+        ),
+        {**data, 1: "", 3: ""},
+        validator,
+    )
+    assert tracker.max_running == 3
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_without_async_work_is_sequential() -> None:
+    validator = DictValidatorAny(
+        {"a": StringValidator(), "b": KeyNotRequired(ListValidator(IntValidator()))},
+        max_concurrency=5,
+    )
+    assert not validator._concurrent_keys.enabled
+    assert await validator.validate_async({"a": "x", "b": [1]}) == Valid(
+        {"a": "x", "b": [1]}
+    )
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_exception_cancels_other_keys() -> None:
+    cancelled = []
+
+    class Slow(PredicateAsync[str]):
+        async def validate_async(self, val: str) -> bool:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(val)
+                raise
+            return True
+
+    class Fails(PredicateAsync[str]):
+        async def validate_async(self, val: str) -> bool:
+            raise ValueError("uh oh")
+
+    validator = DictValidatorAny(
+        {
+            "a": StringValidator(predicates_async=[Slow()]),
+            "b": StringValidator(predicates_async=[Fails()]),
+        },
+        max_concurrency=2,
+    )
+    with pytest.raises(ValueError):
+        await validator.validate_async({"a": "a", "b": "b"})
+    await asyncio.sleep(0)
+    assert cancelled == ["a"]
+
+
+def test_max_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        DictValidatorAny({"a": StringValidator()}, max_concurrency=0)
+
+    with pytest.raises(ValueError):
+        RecordValidator(into=str, keys=(("a", StringValidator()),), max_concurrency=-1)
+
+
+def test_max_concurrency_eq_and_repr() -> None:
+    schema: Dict[Any, Validator[Any]] = {"name": StringValidator()}
+    assert DictValidatorAny(schema, max_concurrency=2) == DictValidatorAny(
+        schema, max_concurrency=2
+    )
+    assert DictValidatorAny(schema, max_concurrency=2) != DictValidatorAny(schema)
+    assert (
+        repr(DictValidatorAny(schema, max_concurrency=2))
+        == f"DictValidatorAny({repr(schema)}, max_concurrency=2)"
+    )
+
+    keys = (("name", StringValidator()),)
+    assert RecordValidator(into=str, keys=keys, max_concurrency=2) != RecordValidator(
+        into=str, keys=keys
+    )
+    assert repr(RecordValidator(into=str, keys=keys, max_concurrency=2)) == (
+        f"RecordValidator(keys={repr(keys)}, into={repr(str)}, max_concurrency=2)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_map_validator_max_concurrency() -> None:
+    tracker = ConcurrencyTracker()
+    not_blank = tracker.predicate(lambda val: val != "")
+    key_validator = StringValidator(predicates_async=[not_blank])
+    value_validator = IntValidator()
+
+    validator = MapValidator(key=key_validator, value=value_validator, max_concurrency=4)
+    assert validator == MapValidator(
+        key=key_validator, value=value_validator, max_concurrency=4
+    )
+    assert validator != MapValidator(key=key_validator, value=value_validator)
+    assert repr(validator) == (
+        f"MapValidator(key={repr(key_validator)}, value={repr(value_validator)}, "
+        f"max_concurrency=4)"
+    )
+
+    data = {str(i): i for i in range(6)}
+    assert await validator.validate_async(data) == Valid(data)
+    assert tracker.max_running == 4
+
+    invalid_data = {"": 1, "a": "b", "c": 3}
+    assert await validator.validate_async(invalid_data) == Invalid(
+        MapErr(
+            {
+                "": KeyValErrs(
+                    key=Invalid(PredicateErrs([not_blank]), "", key_validator), val=None
+                ),
+                "a": KeyValErrs(
+                    key=None, val=Invalid(TypeErr(int), "b", value_validator)
+                ),
+            }
+        ),
+        invalid_data,
+        validator,
+    )
+
+    # no async work
+    assert await MapValidator(
+        key=StringValidator(), value=IntValidator(), max_concurrency=4
+    ).validate_async({"a": 1}) == Valid({"a": 1})
+
+
+@pytest.mark.asyncio
+async def test_map_validator_max_errors() -> None:
+    value_validator = IntValidator()
+    validator = MapValidator(key=StringValidator(), value=value_validator, max_errors=1)
+    data = {"a": 1, "b": "x", "c": "y"}
+    expected: Any = Invalid(
+        MapErr(
+            {"b": KeyValErrs(None, Invalid(TypeErr(int), "x", value_validator))},
+            truncated=True,
+        ),
+        data,
+        validator,
+    )
+    assert validator(data) == expected
+    assert await validator.validate_async(data) == expected
+    assert validator({"a": 1}) == Valid({"a": 1})
+
+    assert validator == MapValidator(
+        key=StringValidator(), value=value_validator, max_errors=1
+    )
+    assert validator != MapValidator(key=StringValidator(), value=value_validator)
+    assert repr(validator) == (
+        "MapValidator(key=StringValidator(), value=IntValidator(), max_errors=1)"
+    )
+    with pytest.raises(ValueError):
+        MapValidator(key=StringValidator(), value=value_validator, max_errors=0)
@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from typing import Any, NamedTuple, TypedDict
+
+import pytest
+
+from koda_validate import (
+    DataclassValidator,
+    DictValidatorAny,
+    FailFastValidator,
+    IndexErrs,
+    IntValidator,
+    Invalid,
+    KeyErrs,
+    ListValidator,
+    MapErr,
+    MapValidator,
+    Min,
+    NamedTupleValidator,
+    NTupleValidator,
+    RecordValidator,
+    SetErrs,
+    SetValidator,
+    StringValidator,
+    TypedDictValidator,
+    UniformTupleValidator,
+    Valid,
+    Validator,
+    compile_validator,
+)
+from koda_validate._vectorized import VECTORIZE_MIN_LEN
+from koda_validate.serialization import to_json_schema
+from tests.utils import ConcurrencyTracker
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+
+
+class PersonDict(TypedDict):
+    name: str
+    age: int
+
+
+class PersonTuple(NamedTuple):
+    name: str
+    age: int
+
+
+def num_errs(invalid: Invalid) -> int:
+    err_type = invalid.err_type
+    if isinstance(err_type, KeyErrs):
+        return len(err_type.keys)
+    elif isinstance(err_type, IndexErrs):
+        return len(err_type.indexes)
+    elif isinstance(err_type, MapErr):
+        return len(err_type.keys)
+    else:
+        assert isinstance(err_type, SetErrs)
+        return len(err_type.item_errs)
+
+
+INVALID_PERSON = {"name": 1, "age": "2"}
+
+CASES = [
+    (ListValidator(IntValidator()), [1, "2", 3, "4"]),
+    (SetValidator(IntValidator()), {"a", "b", 1}),
+    (MapValidator(key=StringValidator(), value=IntValidator()), {"a": "1", 2: 3}),
+    (
+        NTupleValidator.typed(fields=(IntValidator(), IntValidator(), IntValidator())),
+        (1, "2", "3"),
+    ),
+    (UniformTupleValidator(IntValidator()), ("1", 2, "3")),
+    (
+        RecordValidator(
+            into=Person, keys=(("name", StringValidator()), ("age", IntValidator()))
+        ),
+        INVALID_PERSON,
+    ),
+    (
+        RecordValidator(
+            into=Person, keys=(("name", StringValidator()), ("age", IntValidator()))
+        ),
+        {},
+    ),
+    (
+        DictValidatorAny({"name": StringValidator(), "age": IntValidator()}),
+        INVALID_PERSON,
+    ),
+    (DictValidatorAny({"name": StringValidator(), "age": IntValidator()}), {}),
+    (DataclassValidator(Person), INVALID_PERSON),
+    (DataclassValidator(Person), {}),
+    (TypedDictValidator(PersonDict), INVALID_PERSON),
+    (TypedDictValidator(PersonDict), {}),
+    (NamedTupleValidator(PersonTuple), INVALID_PERSON),
+    (NamedTupleValidator(PersonTuple), {}),
+]
+
+
+@pytest.mark.parametrize("validator,val", CASES)
+def test_fail_fast(validator: Validator[Any], val: Any) -> None:
+    result = validator(val)
+    assert not result.is_valid
+    assert num_errs(result) > 1
+
+    fail_fast_result = FailFastValidator(validator)(val)
+    assert not fail_fast_result.is_valid
+    assert fail_fast_result.validator is validator
+    assert num_errs(fail_fast_result) == 1
+
+    # fail-fast mode only applies within `FailFastValidator`
+    assert validator(val) == result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("validator,val", CASES)
+async def test_fail_fast_async(validator: Validator[Any], val: Any) -> None:
+    fail_fast_result = await FailFastValidator(validator).validate_async(val)
+    assert not fail_fast_result.is_valid
+    assert fail_fast_result == FailFastValidator(validator)(val)
+    assert num_errs(await validator.validate_async(val)) > 1  # type: ignore
+
+
+def test_fail_fast_nested() -> None:
+    validator = ListValidator(DataclassValidator(Person))
+    data = [{"name": "a", "age": 1}] + [INVALID_PERSON] * 1000
+    fail_fast = FailFastValidator(validator)
+    result = fail_fast(data)
+    assert isinstance(result, Invalid)
+    assert isinstance(result.err_type, IndexErrs)
+    assert list(result.err_type.indexes) == [1]
+    item_result = result.err_type.indexes[1]
+    assert isinstance(item_result.err_type, KeyErrs)
+    assert item_result.err_type.keys == {"name": StringValidator()(1)}
+
+    assert fail_fast([{"name": "a", "age": 1}]) == Valid([Person("a", 1)])
+
+
+def test_fail_fast_compiled() -> None:
+    validator = compile_validator(DataclassValidator(Person))
+    assert num_errs(validator(INVALID_PERSON)) == 2  # type: ignore
+    assert num_errs(FailFastValidator(validator)(INVALID_PERSON)) == 1  # type: ignore
+    assert num_errs(FailFastValidator(validator)({})) == 1  # type: ignore
+
+
+def test_fail_fast_vectorized() -> None:
+    pytest.importorskip("numpy")
+    validator = ListValidator(IntValidator(Min(0)))
+    data = [-1] * VECTORIZE_MIN_LEN
+    assert num_errs(validator(data)) == VECTORIZE_MIN_LEN  # type: ignore
+    result = FailFastValidator(validator)(data)
+    assert isinstance(result, Invalid)
+    assert isinstance(result.err_type, IndexErrs)
+    assert list(result.err_type.indexes) == [0]
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_concurrent() -> None:
+    tracker = ConcurrencyTracker()
+    validator = ListValidator(
+        IntValidator(predicates_async=[tracker.predicate(lambda v: v > 0)]),
+        max_concurrency=3,
+    )
+    result = await FailFastValidator(validator).validate_async([1, -1, 2, -2, -3])
+    assert isinstance(result, Invalid)
+    assert isinstance(result.err_type, IndexErrs)
+    assert list(result.err_type.indexes) == [1]
+
+
+def test_fail_fast_eq_repr_schema() -> None:
+    validator = FailFastValidator(ListValidator(IntValidator()))
+    assert validator == FailFastValidator(ListValidator(IntValidator()))
+    assert validator != FailFastValidator(ListValidator(StringValidator()))
+    assert repr(validator) == "FailFastValidator(ListValidator(IntValidator()))"
+    assert to_json_schema(validator) == to_json_schema(ListValidator(IntValidator()))
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+import koda_validate
+
+
+def test_names_are_loaded_lazily() -> None:
+    code = (
+        "import sys\n"
+        "from koda_validate import IntValidator, ListValidator\n"
+        "assert 'koda_validate.integer' in sys.modules\n"
+        "ListValidator(IntValidator())\n"
+        "for module in ['asyncio', 'importlib.metadata', 'koda_validate.typehints',\n"
+        "               'koda_validate.cache', 'koda_validate.dictionary',\n"
+        "               'koda_validate.maybe', 'koda_validate.metrics',\n"
+        "               'koda_validate.set', 'koda_validate.tuple',\n"
+        "               'koda_validate.union']:\n"
+        "    assert module not in sys.modules, module\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_submodules_are_attributes() -> None:
+    code = (
+        "import koda_validate\n"
+        "from koda_validate import dictionary, typehints, valid\n"
+        "assert koda_validate.typehints is typehints\n"
+        "assert koda_validate.dictionary is dictionary\n"
+        "assert koda_validate.valid is valid\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+    # without importing them first
+    code = (
+        "import koda_validate\n"
+        "koda_validate.typehints.get_typehint_validator\n"
+        "koda_validate.dictionary.DictValidatorAny\n"
+        "koda_validate.valid.Valid\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_all_names() -> None:
+    assert set(koda_validate._LAZY_IMPORTS) == set(koda_validate.__all__)
+    for name in koda_validate.__all__:
+        module = import_module(f"koda_validate.{koda_validate._LAZY_IMPORTS[name]}")
+        assert getattr(koda_validate, name) is getattr(module, name)
+        assert name in dir(koda_validate)
+
+    assert isinstance(koda_validate.__version__, str)
+    assert "__version__" in dir(koda_validate)
+
+    with pytest.raises(AttributeError, match="has no attribute 'Nope'"):
+        koda_validate.Nope
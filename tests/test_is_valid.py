@@ -0,0 +1,256 @@
+from dataclasses import dataclass
+from typing import Any, List, NamedTuple, Optional, TypedDict
+
+import pytest
+from koda import Just, Maybe, nothing
+
+from koda_validate import (
+    AlwaysValid,
+    BoolValidator,
+    DataclassValidator,
+    DictValidatorAny,
+    EqualsValidator,
+    ErrType,
+    FailFastValidator,
+    FloatValidator,
+    IntValidator,
+    Invalid,
+    IsDictValidator,
+    KeyNotRequired,
+    Lazy,
+    ListValidator,
+    LRUCacheValidator,
+    MapValidator,
+    MaxItems,
+    MaxKeys,
+    MaxLength,
+    Min,
+    MinLength,
+    NamedTupleValidator,
+    NoneValidator,
+    NTupleValidator,
+    OptionalValidator,
+    PredicateAsync,
+    RecordValidator,
+    SetValidator,
+    StringValidator,
+    TypedDictValidator,
+    UniformTupleValidator,
+    UnionValidator,
+    Validator,
+    coercer,
+    compile_validator,
+    strip,
+)
+from koda_validate._internal import _ResultTuple
+from koda_validate._vectorized import VECTORIZE_MIN_LEN
+from koda_validate.maybe import MaybeValidator
+from koda_validate.serialization import SerializableErr
+from tests.utils import BasicNoneValidator
+
+
+@dataclass
+class Person:
+    name: str
+    age: int = 0
+
+
+class PersonDict(TypedDict):
+    name: str
+    age: int
+
+
+class PersonTuple(NamedTuple):
+    name: str
+    age: int = 0
+
+
+class NotBobValidator(StringValidator):
+    def _validate_to_tuple(self, val: Any) -> _ResultTuple[str]:
+        if val == "bob":
+            return False, Invalid(SerializableErr("not bob"), val, self)
+        return super()._validate_to_tuple(val)
+
+
+def check_age(p: Any) -> Optional[ErrType]:
+    return None if p.age >= 0 else SerializableErr("negative age")
+
+
+def check_age_dict(d: Any) -> Optional[ErrType]:
+    return None if d["age"] >= 0 else SerializableErr("negative age")
+
+
+VALUES: List[Any] = [
+    None,
+    True,
+    0,
+    -1,
+    1.5,
+    "",
+    "  abc  ",
+    "abcdefgh",
+    "bob",
+    ["bob"],
+    [],
+    [1, 2, 3],
+    [1, "2"],
+    [1, -1],
+    [-1] * VECTORIZE_MIN_LEN,
+    [1] * VECTORIZE_MIN_LEN,
+    (1, 2),
+    (1, "2", None),
+    {1, 2},
+    {"a", 1},
+    {},
+    {"a": 1},
+    {"a": "1"},
+    {1: 1},
+    {"name": "bob"},
+    {"name": "bob", "age": 5},
+    {"name": "bob", "age": -5},
+    {"name": "bob", "age": "5"},
+    {"name": "bob", "age": 5, "extra": 1},
+    {"age": 5},
+    Person("bob", 5),
+    PersonTuple("bob", 5),
+    Just(1),
+    Just("1"),
+    nothing,
+]
+
+VALIDATORS: List[Validator[Any]] = [
+    BoolValidator(),
+    IntValidator(),
+    IntValidator(Min(0)),
+    FloatValidator(),
+    StringValidator(),
+    StringValidator(MinLength(1), MaxLength(5), preprocessors=[strip]),
+    NoneValidator(),
+    AlwaysValid(),
+    EqualsValidator("abcdefgh"),
+    IsDictValidator(),
+    ListValidator(IntValidator()),
+    ListValidator(IntValidator(Min(0)), predicates=[MaxItems(2)]),
+    ListValidator(IntValidator(Min(0))),
+    SetValidator(IntValidator()),
+    SetValidator(IntValidator(), predicates=[MaxItems(1)]),
+    UniformTupleValidator(IntValidator()),
+    UniformTupleValidator(IntValidator(Min(0)), predicates=[MaxItems(2)]),
+    NTupleValidator.untyped(fields=(IntValidator(), IntValidator())),
+    NTupleValidator.untyped(
+        fields=(IntValidator(), IntValidator()),
+        validate_object=lambda t: None
+        if t[0] < t[1]
+        else SerializableErr("not ascending"),
+    ),
+    MapValidator(key=StringValidator(), value=IntValidator()),
+    MapValidator(key=StringValidator(), value=IntValidator(), predicates=[MaxKeys(0)]),
+    RecordValidator(
+        into=Person,
+        keys=(  # type: ignore
+            ("name", StringValidator()),
+            ("age", KeyNotRequired(IntValidator())),
+        ),
+    ),
+    RecordValidator(
+        into=Person,
+        keys=(("name", StringValidator()), ("age", IntValidator())),
+        validate_object=check_age,
+        fail_on_unknown_keys=True,
+    ),
+    DictValidatorAny({"name": StringValidator(), "age": KeyNotRequired(IntValidator())}),
+    DictValidatorAny(
+        {"name": StringValidator(), "age": IntValidator(Min(0))},
+        fail_on_unknown_keys=True,
+    ),
+    DictValidatorAny(
+        {"name": StringValidator(), "age": IntValidator()},
+        validate_object=check_age_dict,
+    ),
+    DataclassValidator(Person),
+    DataclassValidator(Person, validate_object=check_age, fail_on_unknown_keys=True),
+    TypedDictValidator(PersonDict),
+    TypedDictValidator(PersonDict, fail_on_unknown_keys=True),
+    NamedTupleValidator(PersonTuple),
+    NamedTupleValidator(PersonTuple, validate_object=check_age),
+    OptionalValidator(IntValidator()),
+    OptionalValidator(IntValidator(), none_validator=BasicNoneValidator()),
+    UnionValidator.untyped(IntValidator(), StringValidator()),
+    MaybeValidator(IntValidator()),
+    Lazy(lambda: IntValidator()),
+    FailFastValidator(ListValidator(IntValidator())),
+    LRUCacheValidator(IntValidator()),
+    compile_validator(DataclassValidator(Person)),
+    BasicNoneValidator(),
+    NotBobValidator(),
+    NotBobValidator(MinLength(1)),
+    ListValidator(NotBobValidator()),
+]
+
+
+@pytest.mark.parametrize("validator", VALIDATORS)
+def test_is_valid_matches_call(validator: Validator[Any]) -> None:
+    for val in VALUES:
+        assert validator.is_valid(val) is validator(val).is_valid, (validator, val)
+
+
+def test_is_valid_subclass_overrides() -> None:
+    for validator in [NotBobValidator(), NotBobValidator(MinLength(1))]:
+        assert not validator("bob").is_valid
+        assert not validator.is_valid("bob")
+        assert validator.is_valid("alice")
+        assert not ListValidator(validator).is_valid(["bob"])
+
+
+def test_is_valid_coerce() -> None:
+    @coercer(str, int)
+    def to_int(val: Any) -> Maybe[int]:
+        return Just(int(val)) if type(val) is str else nothing
+
+    @coercer(tuple, list)
+    def to_list(val: Any) -> Maybe[List[Any]]:
+        return Just(list(val)) if type(val) is tuple else nothing
+
+    validators: List[Validator[Any]] = [
+        IntValidator(coerce=to_int),
+        ListValidator(IntValidator(), coerce=to_list),
+    ]
+    for validator in validators:
+        for val in ["1", 1, (1,), [1]]:
+            assert validator.is_valid(val) is validator(val).is_valid
+
+
+def test_is_valid_does_not_build_objects() -> None:
+    built: List[Any] = []
+
+    def into(name: str, age: int) -> Person:
+        built.append((name, age))
+        return Person(name, age)
+
+    validator = ListValidator(
+        RecordValidator(
+            into=into, keys=(("name", StringValidator()), ("age", IntValidator()))
+        )
+    )
+    assert validator.is_valid([{"name": "a", "age": 1}, {"name": "b", "age": 2}])
+    assert not validator.is_valid([{"name": "a", "age": 1}, {"name": "b"}])
+    assert built == []
+
+
+def test_is_valid_async_predicates() -> None:
+    class IsShort(PredicateAsync[str]):
+        async def validate_async(self, val: str) -> bool:
+            return len(val) < 3
+
+    validators: List[Validator[Any]] = [
+        StringValidator(predicates_async=[IsShort()]),
+        ListValidator(StringValidator(), predicates_async=[IsShort()]),  # type: ignore
+        RecordValidator(
+            into=Person,
+            keys=(("name", StringValidator()),),
+            validate_object_async=lambda p: IsShort().validate_async(p.name),  # type: ignore  # noqa: E501
+        ),
+    ]
+    for validator in validators:
+        with pytest.raises(AssertionError):
+            validator.is_valid("abc")
@@ -1,9 +1,17 @@
 from dataclasses import dataclass
+from typing import Any
 
 import pytest
 from koda import Just, Maybe, nothing
 
-from koda_validate import IntValidator, Lazy, Valid
+from koda_validate import (
+    IntValidator,
+    Invalid,
+    Lazy,
+    ListValidator,
+    UnionValidator,
+    Valid,
+)
 from koda_validate.dictionary import KeyNotRequired, RecordValidator
 
 
@@ -50,3 +58,28 @@ async def test_lazy_async() -> None:
     ) == Valid(
         TestNonEmptyList(5, Just(TestNonEmptyList(6, Just(TestNonEmptyList(7, nothing)))))
     )
+
+
+@pytest.mark.asyncio
+async def test_lazy_resolves_validator_once() -> None:
+    calls = 0
+
+    def get_validator() -> ListValidator[Any]:
+        nonlocal calls
+        calls += 1
+        return list_validator
+
+    lazy_v: Lazy[Any] = Lazy(get_validator)
+    list_validator = ListValidator(UnionValidator.untyped(IntValidator(), lazy_v))
+    # not called until it's used
+    assert calls == 0
+
+    assert lazy_v([1, [2, [3]]]) == Valid([1, [2, [3]]])
+    assert await lazy_v.validate_async([1, [2]]) == Valid([1, [2]])
+    assert lazy_v.is_valid([[1]])
+    assert not lazy_v.is_valid([["a"]])
+    assert calls == 1
+
+    result = lazy_v([["a"]])
+    assert isinstance(result, Invalid)
+    assert result.validator is list_validator
@@ -0,0 +1,230 @@
+import pickle
+from dataclasses import dataclass
+from typing import Any, List
+
+import pytest
+
+from koda_validate import (
+    DataclassValidator,
+    FailFastValidator,
+    IndexErrs,
+    IntValidator,
+    Invalid,
+    KeyErrs,
+    LazyErrorsValidator,
+    ListValidator,
+    LRUCacheValidator,
+    OptionalValidator,
+    StringValidator,
+    TTLCacheValidator,
+    UnionErrs,
+    UnionValidator,
+    Valid,
+    Validator,
+)
+from koda_validate._internal import _LazyInvalid
+from koda_validate.serialization import to_json_schema, to_serializable_errs
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+
+
+INVALID_PERSON = {"name": 1, "age": "2"}
+
+
+class CountingValidator(Validator[Any]):
+    def __init__(self, validator: Validator[Any]) -> None:
+        self.validator = validator
+        self.calls = 0
+
+    def __call__(self, val: Any) -> Any:
+        self.calls += 1
+        return self.validator(val)
+
+
+def test_union_errors_are_eager() -> None:
+    counter = CountingValidator(IntValidator())
+    for validator in [
+        UnionValidator.untyped(ListValidator(counter), StringValidator()),
+        OptionalValidator(ListValidator(counter)),
+    ]:
+        data: List[Any] = ["a", "b"]
+        result = validator(data)
+        assert isinstance(result, Invalid)
+        assert isinstance(result.err_type, UnionErrs)
+        assert not any(isinstance(v, _LazyInvalid) for v in result.err_type.variants)
+
+        # changing the value afterwards doesn't change the errors
+        counter.calls = 0
+        data[0] = 1
+        (list_errs,) = [
+            v.err_type
+            for v in result.err_type.variants
+            if isinstance(v.err_type, IndexErrs)
+        ]
+        assert list(list_errs.indexes) == [0, 1]
+        assert counter.calls == 0
+
+
+def test_lazy_errors_in_union() -> None:
+    counter = CountingValidator(IntValidator())
+    person_validator = DataclassValidator(Person)
+    validator = UnionValidator.untyped(
+        LazyErrorsValidator(ListValidator(counter)),
+        LazyErrorsValidator(person_validator),
+        StringValidator(),
+    )
+
+    # items after the first invalid one aren't validated
+    assert validator(["a", "b", "c"]).is_valid is False
+    assert counter.calls == 1
+    assert validator("abc") == Valid("abc")
+
+    result = validator([1, "b", "c"])
+    assert isinstance(result, Invalid)
+    assert isinstance(result.err_type, UnionErrs)
+    list_invalid, person_invalid, str_invalid = result.err_type.variants
+    assert isinstance(list_invalid, _LazyInvalid)
+    assert isinstance(person_invalid, _LazyInvalid)
+    assert not isinstance(str_invalid, _LazyInvalid)
+
+    # errors are the same as if they were built eagerly
+    assert list_invalid == ListValidator(counter)([1, "b", "c"])
+    assert person_invalid == person_validator([1, "b", "c"])
+    assert isinstance(list_invalid.err_type, IndexErrs)
+    assert list(list_invalid.err_type.indexes) == [1, 2]
+    assert list_invalid.value == [1, "b", "c"]
+    assert to_serializable_errs(result) == {
+        "variants": [
+            [[1, ["expected an integer"]], [2, ["expected an integer"]]],
+            {"__container__": ["expected a dict"]},
+            ["expected a string"],
+        ]
+    }
+
+    # ...and only built once
+    calls = counter.calls
+    assert list_invalid.err_type is list_invalid.err_type
+    assert counter.calls == calls
+
+
+def test_lazy_errors_respect_fail_fast() -> None:
+    validator = FailFastValidator(
+        UnionValidator.untyped(
+            LazyErrorsValidator(DataclassValidator(Person)), StringValidator()
+        )
+    )
+    result = validator(INVALID_PERSON)
+    assert isinstance(result, Invalid)
+    assert isinstance(result.err_type, UnionErrs)
+    person_invalid = result.err_type.variants[0]
+    # the fail-fast errors are already built
+    assert not isinstance(person_invalid, _LazyInvalid)
+    assert isinstance(person_invalid.err_type, KeyErrs)
+    assert list(person_invalid.err_type.keys) == ["name"]
+
+
+@pytest.mark.asyncio
+async def test_lazy_errors_in_union_async_are_eager() -> None:
+    validator = UnionValidator.untyped(
+        LazyErrorsValidator(DataclassValidator(Person)), StringValidator()
+    )
+    result = await validator.validate_async(INVALID_PERSON)
+    assert isinstance(result, Invalid)
+    assert isinstance(result.err_type, UnionErrs)
+    assert not any(isinstance(v, _LazyInvalid) for v in result.err_type.variants)
+    assert result == validator(INVALID_PERSON)
+
+
+def test_lazy_errors_value_changed() -> None:
+    list_validator = ListValidator(IntValidator())
+    data: List[Any] = ["a", "b"]
+    result = LazyErrorsValidator(list_validator)(data)
+    assert isinstance(result, _LazyInvalid)
+
+    # the value is now valid, so the fail-fast errors found the first time are used
+    data[:] = [1, 2]
+    assert isinstance(result.err_type, IndexErrs)
+    assert list(result.err_type.indexes) == [0]
+    assert result.value is data
+    assert result.validator is list_validator
+
+
+@pytest.mark.asyncio
+async def test_lazy_errors_validator() -> None:
+    counter = CountingValidator(IntValidator())
+    list_validator = ListValidator(counter)
+    validator = LazyErrorsValidator(list_validator)
+
+    assert validator([1, 2]) == Valid([1, 2])
+    assert validator.is_valid([1, 2])
+    counter.calls = 0
+
+    result = validator([1, "2", "3"])
+    assert isinstance(result, _LazyInvalid)
+    assert result.is_valid is False
+    assert counter.calls == 2
+
+    # only the errors are deferred
+    assert result.validator is list_validator
+    assert result.value == [1, "2", "3"]
+    assert counter.calls == 2
+    assert isinstance(result.err_type, IndexErrs)
+    assert counter.calls == 5
+    assert isinstance(result.err_type, IndexErrs)
+    assert list(result.err_type.indexes) == [1, 2]
+    assert result == list_validator([1, "2", "3"])
+    assert list_validator([1, "2", "3"]) == result
+    assert result != list_validator([1, "2"])
+    assert repr(result) == repr(list_validator([1, "2", "3"]))
+
+    lazy_result = LazyErrorsValidator(ListValidator(IntValidator()))([1, "2"])
+    unpickled = pickle.loads(pickle.dumps(lazy_result))
+    assert type(unpickled) is Invalid
+    assert unpickled == lazy_result
+
+    # nested in fail-fast mode, errors stay fail-fast
+    fail_fast_result = FailFastValidator(validator)([1, "2", "3"])
+    assert isinstance(fail_fast_result, Invalid)
+    assert not isinstance(fail_fast_result, _LazyInvalid)
+    assert isinstance(fail_fast_result.err_type, IndexErrs)
+    assert list(fail_fast_result.err_type.indexes) == [1]
+
+    async_result = await LazyErrorsValidator(
+        ListValidator(IntValidator())
+    ).validate_async([1, "2"])
+    assert not isinstance(async_result, _LazyInvalid)
+    assert async_result == lazy_result
+
+
+def test_lazy_errors_validator_eq_repr_schema() -> None:
+    validator = LazyErrorsValidator(ListValidator(IntValidator()))
+    assert validator == LazyErrorsValidator(ListValidator(IntValidator()))
+    assert validator != LazyErrorsValidator(ListValidator(StringValidator()))
+    assert repr(validator) == "LazyErrorsValidator(ListValidator(IntValidator()))"
+    assert to_json_schema(validator) == to_json_schema(ListValidator(IntValidator()))
+
+
+def test_caches_dont_store_fail_fast_errors() -> None:
+    validators: List[Any] = [
+        LRUCacheValidator(ListValidator(IntValidator())),
+        TTLCacheValidator(ListValidator(IntValidator())),
+    ]
+    for validator in validators:
+        fail_fast_result = FailFastValidator(validator)(["1", "2"])
+        assert isinstance(fail_fast_result, Invalid)
+        assert isinstance(fail_fast_result.err_type, IndexErrs)
+        assert list(fail_fast_result.err_type.indexes) == [0]
+
+        result = validator(["1", "2"])
+        assert isinstance(result, Invalid)
+        assert isinstance(result.err_type, IndexErrs)
+        assert list(result.err_type.indexes) == [0, 1]
+
+        # valid results, and errors found normally, are still cached
+        assert FailFastValidator(validator)([1]) == Valid([1])
+        assert FailFastValidator(validator)(["1", "2"]) == result
+        assert validator.hits == 1
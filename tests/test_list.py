@@ -22,7 +22,7 @@ from koda_validate.coerce import coercer
 from koda_validate.float import FloatValidator
 from koda_validate.generic import MaxItems, Min, MinItems
 from koda_validate.list import ListValidator
-from tests.utils import BasicNoneValidator
+from tests.utils import BasicNoneValidator, ConcurrencyTracker
 
 
 def test_list_validator() -> None:
@@ -228,3 +228,98 @@ async def test_coerce_to_list_async() -> None:
     assert isinstance(
         await validator.validate_async(["list", "no", "longer", "accepted"]), Invalid
     )
+
+
+@pytest.mark.asyncio
+async def test_list_max_concurrency() -> None:
+    tracker = ConcurrencyTracker()
+    not_blank = tracker.predicate(lambda val: val != "")
+    item_validator = StringValidator(predicates_async=[not_blank])
+
+    sequential_validator = ListValidator(item_validator)
+    concurrent_validator = ListValidator(item_validator, max_concurrency=3)
+    assert concurrent_validator == ListValidator(item_validator, max_concurrency=3)
+    assert concurrent_validator != sequential_validator
+    assert repr(concurrent_validator) == (
+        f"ListValidator({repr(item_validator)}, max_concurrency=3)"
+    )
+
+    data = [str(i) for i in range(10)]
+    assert await sequential_validator.validate_async(data) == Valid(data)
+    assert tracker.max_running == 1
+
+    tracker.max_running = 0
+    assert await concurrent_validator.validate_async(data) == Valid(data)
+    assert tracker.max_running == 3
+
+    invalid_data = ["", "a", "", "b", ""]
+    assert await concurrent_validator.validate_async(invalid_data) == Invalid(
+        IndexErrs(
+            {
+                i: Invalid(PredicateErrs([not_blank]), "", item_validator)
+                for i in [0, 2, 4]
+            }
+        ),
+        invalid_data,
+        concurrent_validator,
+    )
+    concurrent_result = await concurrent_validator.validate_async(invalid_data)
+    sequential_result = await sequential_validator.validate_async(invalid_data)
+    assert not concurrent_result.is_valid and not sequential_result.is_valid
+    assert concurrent_result.err_type == sequential_result.err_type
+
+    with pytest.raises(ValueError):
+        ListValidator(item_validator, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_list_max_concurrency_without_async_work_is_sequential() -> None:
+    validator = ListValidator(ListValidator(IntValidator()), max_concurrency=5)
+    assert not validator._concurrency.enabled
+    assert await validator.validate_async([[1], [2, 3]]) == Valid([[1], [2, 3]])
+
+    async_validator = ListValidator(
+        StringValidator(predicates_async=[ConcurrencyTracker().predicate(bool)]),
+        max_concurrency=5,
+    )
+    assert async_validator._concurrency.enabled
+
+
+@pytest.mark.asyncio
+async def test_list_max_errors() -> None:
+    item_validator = IntValidator()
+    validator = ListValidator(item_validator, max_errors=2)
+    expected: Any = Invalid(
+        IndexErrs(
+            {
+                1: Invalid(TypeErr(int), "a", item_validator),
+                2: Invalid(TypeErr(int), "b", item_validator),
+            },
+            truncated=True,
+        ),
+        [1, "a", "b", "c"],
+        validator,
+    )
+    assert validator([1, "a", "b", "c"]) == expected
+    assert await validator.validate_async([1, "a", "b", "c"]) == expected
+
+    # stopping at the last item doesn't skip anything
+    for result in [
+        validator([1, "a", "b"]),
+        await validator.validate_async([1, "a", "b"]),
+    ]:
+        assert isinstance(result, Invalid)
+        assert result.err_type == IndexErrs(
+            {
+                1: Invalid(TypeErr(int), "a", item_validator),
+                2: Invalid(TypeErr(int), "b", item_validator),
+            }
+        )
+
+    assert validator([1, 2]) == Valid([1, 2])
+    assert validator == ListValidator(item_validator, max_errors=2)
+    assert validator != ListValidator(item_validator)
+    assert repr(validator) == "ListValidator(IntValidator(), max_errors=2)"
+
+    with pytest.raises(ValueError):
+        ListValidator(item_validator, max_errors=0)
@@ -0,0 +1,186 @@
+import threading
+from dataclasses import dataclass
+
+import pytest
+
+from koda_validate import (
+    DataclassValidator,
+    DictValidatorAny,
+    IntValidator,
+    ListValidator,
+    MapValidator,
+    StringValidator,
+    Valid,
+)
+from koda_validate.dictionary import KeyNotRequired
+from koda_validate.metrics import (
+    InstrumentedValidator,
+    MetricsRegistry,
+    default_registry,
+    to_prometheus_text,
+)
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+
+
+@pytest.mark.asyncio
+async def test_instrumented_validator_counts() -> None:
+    registry = MetricsRegistry()
+    validator = InstrumentedValidator(
+        ListValidator(
+            DictValidatorAny(
+                {
+                    "id": IntValidator(),
+                    "tags": KeyNotRequired(
+                        MapValidator(key=StringValidator(), value=IntValidator())
+                    ),
+                }
+            )
+        ),
+        "items",
+        registry=registry,
+    )
+
+    assert validator([{"id": 1}]) == Valid([{"id": 1}])
+    assert not validator([{"id": "a"}, {"id": "b"}, {"id": 1, "tags": {1: "x"}}]).is_valid
+    assert not (await validator.validate_async([{}])).is_valid
+    assert not validator.is_valid(None)
+    assert validator.is_valid([])
+
+    metrics = registry.schema("items")
+    assert metrics.calls == 5
+    assert metrics.invalid == 3
+    assert metrics.invalid_rate == 0.6
+    # each path is counted once per validation
+    assert metrics.failing_paths() == [
+        ("$[].id", 2),
+        ("$[].tags{key}", 1),
+        ("$[].tags{value}", 1),
+    ]
+    assert metrics.failing_paths(1) == [("$[].id", 2)]
+    assert metrics.bucket_counts()[-1] == 5
+    assert metrics.latency_seconds > 0
+
+    metrics.clear()
+    assert metrics.calls == 0
+    assert metrics.failing_paths() == []
+
+
+def test_instrumented_validator_defaults() -> None:
+    validator = InstrumentedValidator(DataclassValidator(Person))
+    assert validator.name == "Person"
+    assert validator.registry is default_registry
+    assert validator.metrics is default_registry.schema("Person")
+    assert repr(validator) == (
+        f"InstrumentedValidator({DataclassValidator(Person)!r}, 'Person')"
+    )
+    assert validator == InstrumentedValidator(DataclassValidator(Person))
+    assert validator != InstrumentedValidator(DataclassValidator(Person), "person")
+
+    # the wrapper is transparent to the validators it's nested in
+    assert ListValidator(InstrumentedValidator(IntValidator()))([1, 2]) == Valid([1, 2])
+
+
+def test_latency_quantile() -> None:
+    registry = MetricsRegistry(buckets=(0.001, 0.002, 0.004))
+    metrics = registry.schema("s")
+    assert metrics.latency_quantile(0.5) == 0.0
+
+    for elapsed_ms in [0.5, 1.5, 1.5, 3]:
+        metrics.record(round(elapsed_ms * 1e6), True)
+    assert metrics.bucket_counts() == [1, 3, 4, 4]
+    assert metrics.latency_quantile(0.25) == pytest.approx(0.001)
+    assert metrics.latency_quantile(0.5) == pytest.approx(0.0015)
+    assert metrics.latency_quantile(1) == pytest.approx(0.004)
+
+    metrics.record(10_000_000, True)
+    assert metrics.latency_quantile(1) == 0.004
+
+    with pytest.raises(ValueError):
+        metrics.latency_quantile(1.5)
+    with pytest.raises(ValueError):
+        MetricsRegistry(buckets=(0.002, 0.001))
+
+
+def test_max_paths() -> None:
+    registry = MetricsRegistry(max_paths=1)
+    validator = InstrumentedValidator(
+        DictValidatorAny({"a": IntValidator(), "b": IntValidator()}), "d", registry
+    )
+    validator({"a": "x", "b": 1})
+    validator({"a": 1, "b": "x"})
+    assert registry.schema("d").failing_paths() == [("$.a", 1), ("<other>", 1)]
+
+
+def test_metrics_across_threads() -> None:
+    registry = MetricsRegistry()
+    validator = InstrumentedValidator(IntValidator(), "int", registry)
+
+    def validate() -> None:
+        for i in range(1000):
+            validator(i if i % 4 else "x")
+
+    threads = [threading.Thread(target=validate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    metrics = registry.schema("int")
+    assert metrics.calls == 4000
+    assert metrics.invalid == 1000
+    assert metrics.failing_paths() == [("$", 1000)]
+
+
+def test_metrics_short_lived_threads() -> None:
+    registry = MetricsRegistry()
+    validator = InstrumentedValidator(IntValidator(), "int", registry)
+    metrics = registry.schema("int")
+
+    for i in range(200):
+        thread = threading.Thread(target=validator, args=(i if i % 4 else "x",))
+        thread.start()
+        thread.join()
+
+    # finished threads' counts are kept, but not their shards
+    assert len(metrics._shards) <= 2
+    assert metrics.calls == 200
+    assert metrics.invalid == 50
+    assert metrics.failing_paths() == [("$", 50)]
+    assert metrics.bucket_counts()[-1] == 200
+    assert len(metrics._shards) == 1
+
+    metrics.clear()
+    assert metrics.calls == 0
+    assert metrics.failing_paths() == []
+
+
+def test_to_prometheus_text() -> None:
+    registry = MetricsRegistry(buckets=(0.5, 1.0))
+    metrics = registry.schema('a "b"')
+    metrics.record(100, True)
+    InstrumentedValidator(IntValidator(), 'a "b"', registry)("x")
+
+    assert to_prometheus_text(registry, prefix="kv").splitlines() == [
+        "# HELP kv_validations_total Validations performed.",
+        "# TYPE kv_validations_total counter",
+        'kv_validations_total{schema="a \\"b\\""} 2',
+        "# HELP kv_invalid_total Validations which were invalid.",
+        "# TYPE kv_invalid_total counter",
+        'kv_invalid_total{schema="a \\"b\\""} 1',
+        "# HELP kv_validation_duration_seconds Time spent validating.",
+        "# TYPE kv_validation_duration_seconds histogram",
+        'kv_validation_duration_seconds_bucket{schema="a \\"b\\"",le="0.5"} 2',
+        'kv_validation_duration_seconds_bucket{schema="a \\"b\\"",le="1.0"} 2',
+        'kv_validation_duration_seconds_bucket{schema="a \\"b\\"",le="+Inf"} 2',
+        f'kv_validation_duration_seconds_sum{{schema="a \\"b\\""}} '
+        f"{metrics.latency_seconds!r}",
+        'kv_validation_duration_seconds_count{schema="a \\"b\\""} 2',
+        "# HELP kv_failures_total Invalid validations, by the path of the error.",
+        "# TYPE kv_failures_total counter",
+        'kv_failures_total{schema="a \\"b\\"",path="$"} 1',
+    ]
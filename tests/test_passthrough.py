@@ -0,0 +1,243 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import pytest
+
+from koda_validate import (
+    AlwaysValid,
+    DictValidatorAny,
+    EqualsValidator,
+    FailFastValidator,
+    IntValidator,
+    KeyNotRequired,
+    Lazy,
+    ListValidator,
+    LRUCacheValidator,
+    MapValidator,
+    Min,
+    MinLength,
+    OptionalValidator,
+    RecordValidator,
+    StringValidator,
+    TTLCacheValidator,
+    UniformTupleValidator,
+    UnionValidator,
+    Valid,
+    Validator,
+    compile_validator,
+    strip,
+)
+from koda_validate._internal import _ResultTuple
+from koda_validate._tree import _is_non_transforming
+from koda_validate.tuple import tuple_or_list_to_tuple
+
+
+@dataclass
+class Person:
+    name: str
+
+
+class LowerStringValidator(StringValidator):
+    def _validate_to_tuple(self, val: Any) -> _ResultTuple[str]:
+        result = super()._validate_to_tuple(val)
+        if result[0]:
+            return True, result[1].lower()
+        else:
+            return result
+
+    async def _validate_to_tuple_async(self, val: Any) -> _ResultTuple[str]:
+        return self._validate_to_tuple(val)
+
+
+@pytest.mark.parametrize(
+    "validator",
+    [
+        IntValidator(Min(0)),
+        StringValidator(),
+        AlwaysValid(),
+        EqualsValidator(1),
+        OptionalValidator(IntValidator()),
+        UnionValidator.typed(IntValidator(), StringValidator()),
+        FailFastValidator(IntValidator()),
+        ListValidator(IntValidator()),
+        UniformTupleValidator(IntValidator(), coerce=None),
+        MapValidator(key=StringValidator(), value=IntValidator()),
+        DictValidatorAny({"a": IntValidator()}, fail_on_unknown_keys=True),
+    ],
+)
+def test_is_non_transforming(validator: Validator[Any]) -> None:
+    assert _is_non_transforming(validator)
+
+
+@pytest.mark.parametrize(
+    "validator",
+    [
+        StringValidator(preprocessors=[strip]),
+        EqualsValidator("abc", preprocessors=[strip]),
+        UnionValidator.typed(IntValidator(), StringValidator(preprocessors=[strip])),
+        Lazy(lambda: IntValidator()),
+        ListValidator(StringValidator(preprocessors=[strip])),
+        # lists are coerced to tuples
+        UniformTupleValidator(IntValidator()),
+        MapValidator(key=StringValidator(preprocessors=[strip]), value=IntValidator()),
+        # unknown keys are dropped
+        DictValidatorAny({"a": IntValidator()}),
+        RecordValidator(into=Person, keys=(("name", StringValidator()),)),
+        # subclasses may transform values
+        LowerStringValidator(),
+        ListValidator(LowerStringValidator(MinLength(1))),
+    ],
+)
+def test_is_transforming(validator: Validator[Any]) -> None:
+    assert not _is_non_transforming(validator)
+
+
+@pytest.mark.asyncio
+async def test_list_passthrough() -> None:
+    validator = ListValidator(OptionalValidator(IntValidator(Min(0))))
+    vals = [1, None, 3]
+    for result in [validator(vals), await validator.validate_async(vals)]:
+        assert result.is_valid
+        assert result.val is vals
+    assert not validator([1, -1]).is_valid
+
+    validator_ = ListValidator(StringValidator(preprocessors=[strip]))
+    assert validator_([" a "]) == Valid(["a"])
+    equals_validator = ListValidator(EqualsValidator("abc", preprocessors=[strip]))
+    assert equals_validator([" abc "]) == Valid(["abc"])
+
+
+@pytest.mark.asyncio
+async def test_uniform_tuple_passthrough() -> None:
+    validator = UniformTupleValidator(IntValidator())
+    vals = (1, 2, 3)
+    for result in [validator(vals), await validator.validate_async(vals)]:
+        assert result.is_valid
+        assert result.val is vals
+
+    assert validator([1, 2, 3]) == Valid(vals)
+    assert not validator((1, "2")).is_valid
+    assert tuple_or_list_to_tuple is validator.coerce
+
+
+@pytest.mark.asyncio
+async def test_map_passthrough() -> None:
+    validator = MapValidator(key=StringValidator(), value=ListValidator(IntValidator()))
+    vals = {"a": [1], "b": [2, 3]}
+    for result in [validator(vals), await validator.validate_async(vals)]:
+        assert result.is_valid
+        assert result.val is vals
+    assert not validator({"a": ["1"]}).is_valid
+
+
+@pytest.mark.asyncio
+async def test_dict_validator_any_passthrough() -> None:
+    validator = DictValidatorAny(
+        {"a": IntValidator(), "b": KeyNotRequired(ListValidator(IntValidator()))}
+    )
+    for vals in [{"a": 1}, {"a": 1, "b": [2]}]:
+        for result in [
+            validator(vals),
+            await validator.validate_async(vals),
+            compile_validator(validator)(vals),
+        ]:
+            assert result.is_valid
+            assert result.val is vals
+
+    # unknown keys are dropped, so a new dict is returned
+    vals = {"a": 1, "c": 3}
+    for result in [
+        validator(vals),
+        await validator.validate_async(vals),
+        compile_validator(validator)(vals),
+    ]:
+        assert result.is_valid
+        assert result.val == {"a": 1}
+    assert not validator({"a": "1"}).is_valid
+
+    # nested dicts may drop unknown keys, so the list is rebuilt...
+    list_validator = ListValidator(validator)
+    vals_list = [{"a": 1}, {"a": 2, "c": 3}]
+    assert list_validator(vals_list) == Valid([{"a": 1}, {"a": 2}])
+    # ...unless unknown keys aren't allowed
+    strict_list_validator = ListValidator(
+        DictValidatorAny({"a": IntValidator()}, fail_on_unknown_keys=True)
+    )
+    vals_list = [{"a": 1}, {"a": 2}]
+    for result_, val in [
+        (strict_list_validator(vals_list), vals_list),
+        (
+            compile_validator(strict_list_validator.item_validator)(vals_list[0]),
+            vals_list[0],
+        ),
+    ]:
+        assert result_.is_valid
+        assert result_.val is val
+
+
+@pytest.mark.asyncio
+async def test_subclass_transformations_are_kept() -> None:
+    validator = DictValidatorAny({"name": LowerStringValidator(MinLength(1))})
+    assert validator({"name": "BOB"}) == Valid({"name": "bob"})
+    assert compile_validator(validator)({"name": "BOB"}) == Valid({"name": "bob"})
+
+    list_validator = ListValidator(LowerStringValidator(MinLength(1)))
+    assert list_validator(["BOB"]) == Valid(["bob"])
+    assert await list_validator.validate_async(["BOB"]) == Valid(["bob"])
+
+
+def test_dict_validator_any_passthrough_validate_object() -> None:
+    def no_errors(obj: Any) -> Any:
+        return None
+
+    validator = DictValidatorAny({"a": IntValidator()}, validate_object=no_errors)
+    vals = {"a": 1}
+    result = validator(vals)
+    assert result.is_valid
+    assert result.val is vals
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_cls", [LRUCacheValidator, TTLCacheValidator])
+async def test_cached_results_are_not_passed_through(cache_cls: Any) -> None:
+    # otherwise the caller's objects are cached, and changing them changes the cache
+    cases: list[tuple[Validator[Any], Callable[[], Any], Callable[[Any], None]]] = [
+        (ListValidator(IntValidator()), lambda: [1, 2], lambda v: v.append(99)),
+        (
+            MapValidator(key=StringValidator(), value=ListValidator(IntValidator())),
+            lambda: {"a": [1]},
+            lambda v: v["a"].append(99),
+        ),
+        (
+            compile_validator(
+                DictValidatorAny(
+                    {"a": ListValidator(IntValidator())}, fail_on_unknown_keys=True
+                )
+            ),
+            lambda: {"a": [1]},
+            lambda v: v["a"].append(99),
+        ),
+        (
+            UniformTupleValidator(ListValidator(IntValidator()), coerce=None),
+            lambda: ([1],),
+            lambda v: v[0].append(99),
+        ),
+    ]
+    for validator, make_val, mutate in cases:
+        cache_validator = cache_cls(validator)
+        val = make_val()
+        assert cache_validator(val) == Valid(make_val())
+        mutate(val)
+        assert cache_validator(make_val()) == Valid(make_val())
+
+        cache_validator = cache_cls(validator)
+        val = make_val()
+        assert await cache_validator.validate_async(val) == Valid(make_val())
+        mutate(val)
+        assert await cache_validator.validate_async(make_val()) == Valid(make_val())
+
+        # passthrough still applies outside of the cache
+        val = make_val()
+        result = validator(val)
+        assert result.is_valid
+        assert result.val is val
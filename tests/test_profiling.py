@@ -0,0 +1,224 @@
+import asyncio
+import sys
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+import pytest
+
+from koda_validate import (
+    DataclassValidator,
+    DictValidatorAny,
+    IntValidator,
+    Lazy,
+    ListValidator,
+    MapValidator,
+    PredicateAsync,
+    StringValidator,
+    compile_validator,
+)
+from koda_validate.dictionary import KeyNotRequired
+from koda_validate.profiling import profile
+
+
+@dataclass
+class Hobby:
+    name: str
+    years: int
+
+
+@dataclass
+class Person:
+    name: str
+    hobbies: list[Hobby]
+    nickname: Optional[str] = None
+
+
+def _calls(report: Any) -> dict[tuple[str, str], tuple[int, int]]:
+    return {(row.path, row.validator): (row.calls, row.invalid) for row in report.rows}
+
+
+def test_profile_paths_and_counts() -> None:
+    validator = DataclassValidator(Person)
+    with profile(validator) as report:
+        validator({"name": "a", "hobbies": [{"name": "chess", "years": 2}]})
+        validator({"name": "b", "hobbies": [{"name": "go", "years": "x"}], "nickname": 1})
+
+    assert _calls(report) == {
+        ("Person", "DataclassValidator"): (2, 1),
+        ("Person.name", "StringValidator"): (2, 0),
+        ("Person.hobbies", "ListValidator"): (2, 1),
+        ("Person.hobbies[]", "DataclassValidator"): (2, 1),
+        ("Person.hobbies[].name", "StringValidator"): (2, 0),
+        ("Person.hobbies[].years", "IntValidator"): (2, 1),
+        ("Person.nickname", "UnionValidator"): (1, 1),
+    }
+    for row in report.rows:
+        assert row.total_ns >= row.self_ns >= 0
+    root = report.rows[0]
+    assert root.invalid_rate == 0.5
+    assert root.total_ns >= sum(row.total_ns for row in report.rows[1:3])
+    assert str(report).splitlines()[0].split() == [
+        "path",
+        "validator",
+        "calls",
+        "total",
+        "ms",
+        "self",
+        "ms",
+        "invalid",
+        "%",
+    ]
+
+
+def test_profile_is_removed() -> None:
+    validator = IntValidator()
+    previous = sys.getprofile()
+    with profile(validator, name="n") as report:
+        assert sys.getprofile() is not previous
+        validator(1)
+    assert sys.getprofile() is previous
+
+    validator(2)
+    assert _calls(report) == {("n", "IntValidator"): (1, 0)}
+
+    with pytest.raises(ZeroDivisionError):
+        with profile(validator):
+            1 / 0
+    assert sys.getprofile() is previous
+
+
+def test_profile_chains_to_previous_profiler() -> None:
+    validator = IntValidator()
+    events: list[tuple[str, str]] = []
+
+    def previous(frame: Any, event: str, arg: Any) -> None:
+        events.append((frame.f_code.co_name, event))
+
+    sys.setprofile(previous)
+    try:
+        with profile(validator, name="n") as report:
+            validator(1)
+        assert sys.getprofile() is previous
+    finally:
+        sys.setprofile(None)
+
+    assert ("_validate_type_to_tuple", "call") in events
+    assert _calls(report) == {("n", "IntValidator"): (1, 0)}
+
+    # outer and inner profiles both see the inner validation
+    with profile(validator, name="outer") as outer:
+        with profile(validator, name="inner") as inner:
+            validator(2)
+    assert _calls(outer) == {("outer", "IntValidator"): (1, 0)}
+    assert _calls(inner) == {("inner", "IntValidator"): (1, 0)}
+
+
+def test_profile_with_cprofile() -> None:
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        with pytest.raises(RuntimeError, match="while Profile is profiling"):
+            with profile(IntValidator()):
+                pass
+    finally:
+        profiler.disable()
+
+
+def test_profile_nested_paths() -> None:
+    def comment_validator() -> DictValidatorAny:
+        return validator
+
+    validator = DictValidatorAny(
+        {
+            "text": StringValidator(),
+            "votes": KeyNotRequired(
+                MapValidator(key=StringValidator(), value=IntValidator())
+            ),
+            "replies": ListValidator(Lazy(comment_validator)),
+        }
+    )
+    data = {"text": "a", "replies": [{"text": "b", "votes": {"up": 1}, "replies": []}]}
+
+    with profile(validator, name="Comment") as report:
+        assert validator.is_valid(data)
+
+    assert _calls(report) == {
+        ("Comment", "DictValidatorAny"): (1, 0),
+        ("Comment.text", "StringValidator"): (1, 0),
+        ("Comment.replies", "ListValidator"): (1, 0),
+        ("Comment.replies[]", "Lazy"): (1, 0),
+        ("Comment.replies[]", "DictValidatorAny"): (1, 0),
+        ("Comment.replies[].text", "StringValidator"): (1, 0),
+        ("Comment.replies[].votes", "MapValidator"): (1, 0),
+        ("Comment.replies[].votes{key}", "StringValidator"): (1, 0),
+        ("Comment.replies[].votes{value}", "IntValidator"): (1, 0),
+        ("Comment.replies[].replies", "ListValidator"): (1, 0),
+    }
+
+
+def test_profile_lazy_building_new_validators() -> None:
+    # each level of nesting has its own validators, so the tree is only walked into
+    # as far as values are validated
+    def comment_validator() -> DictValidatorAny:
+        return DictValidatorAny(
+            {
+                "text": StringValidator(),
+                "replies": ListValidator(Lazy(comment_validator)),
+            }
+        )
+
+    validator = comment_validator()
+    data = {"text": "a", "replies": [{"text": "b", "replies": [{"text": 1}]}]}
+
+    with profile(validator, name="Comment") as report:
+        assert not validator.is_valid(data)
+
+    assert _calls(report) == {
+        ("Comment", "DictValidatorAny"): (1, 1),
+        ("Comment.text", "StringValidator"): (1, 0),
+        ("Comment.replies", "ListValidator"): (1, 1),
+        ("Comment.replies[]", "Lazy"): (1, 1),
+        ("Comment.replies[]", "DictValidatorAny"): (1, 1),
+        ("Comment.replies[].text", "StringValidator"): (1, 0),
+        ("Comment.replies[].replies", "ListValidator"): (1, 1),
+        ("Comment.replies[].replies[]", "Lazy"): (1, 1),
+        ("Comment.replies[].replies[]", "DictValidatorAny"): (1, 1),
+        ("Comment.replies[].replies[].text", "StringValidator"): (1, 1),
+    }
+
+
+def test_profile_union_and_compiled() -> None:
+    @dataclass
+    class Item:
+        id: Union[int, str]
+
+    validator = compile_validator(ListValidator(DataclassValidator(Item)))
+    with profile(validator, name="items") as report:
+        validator([{"id": 1}, {"id": "a"}, {"id": None}])
+
+    calls = _calls(report)
+    assert calls[("items", "ListValidator")] == (1, 1)
+    assert calls[("items[]", "DataclassValidator")] == (3, 1)
+    assert calls[("items[].id", "UnionValidator")] == (3, 1)
+    assert calls[("items[].id|0", "IntValidator")][0] >= 1
+
+
+@pytest.mark.asyncio
+async def test_profile_async() -> None:
+    class NotX(PredicateAsync[str]):
+        async def validate_async(self, val: str) -> bool:
+            await asyncio.sleep(0)
+            return val != "x"
+
+    validator = ListValidator(
+        StringValidator(predicates_async=[NotX()]), max_concurrency=2
+    )
+    with profile(validator, name="names") as report:
+        await validator.validate_async(["a", "x", "c"])
+
+    assert _calls(report) == {
+        ("names", "ListValidator"): (1, 1),
+        ("names[]", "StringValidator"): (3, 1),
+    }
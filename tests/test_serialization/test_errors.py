@@ -27,6 +27,7 @@ from koda_validate import (
     UniformTupleValidator,
     UnionErrs,
     UUIDValidator,
+    ValidationResult,
     not_blank,
 )
 from koda_validate.base import Predicate, PredicateAsync
@@ -246,6 +247,34 @@ def test_set_errs_message() -> None:
     }
 
 
+def _errs(result: ValidationResult[Any]) -> Serializable:
+    assert isinstance(result, Invalid)
+    return to_serializable_errs(result)
+
+
+def test_truncated_errs() -> None:
+    truncated = ["too many errors; the remaining items were not validated"]
+    assert _errs(ListValidator(IntValidator(), max_errors=1)([1, "a", "b"])) == [
+        [1, ["expected an integer"]],
+        ["__truncated__", truncated],
+    ]
+    assert _errs(
+        MapValidator(key=StringValidator(), value=IntValidator(), max_errors=1)(
+            {"a": "x", "b": "y"}
+        )
+    ) == {"a": {"value": ["expected an integer"]}, "__truncated__": truncated}
+    assert _errs(SetValidator(StringValidator(), max_errors=1)({1, 2})) == {
+        "member_errors": [["expected a string"]],
+        "__truncated__": truncated,
+    }
+
+    # the errors aren't changed if validation didn't stop early
+    assert _errs(ListValidator(IntValidator(), max_errors=2)([1, "a", "b"])) == [
+        [1, ["expected an integer"]],
+        [2, ["expected an integer"]],
+    ]
+
+
 def test_pred_to_err_message() -> None:
     pred_list: List[Tuple[Union[Predicate[Any], PredicateAsync[Any]], str]] = [
         (Choices({1, 2, 3}), f"expected one of {sorted({1, 2, 3})}"),
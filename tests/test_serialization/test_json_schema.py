@@ -25,6 +25,7 @@ from koda_validate import (
     DatetimeValidator,
     DateValidator,
     DecimalValidator,
+    DiscriminatedUnionValidator,
     EqualsValidator,
     FloatValidator,
     IntValidator,
@@ -694,3 +695,22 @@ def test_cache_validator_falls_through_to_internal_validator() -> None:
     assert to_json_schema(SomeCacheValidator(str_validator)) == to_json_schema(
         str_validator
     )
+
+
+def test_discriminated_union() -> None:
+    circle_validator = DictValidatorAny(
+        {"type": StringValidator(), "radius": FloatValidator()}
+    )
+    rect_validator = DictValidatorAny(
+        {"type": StringValidator(), "side": FloatValidator()}
+    )
+    validator = DiscriminatedUnionValidator(
+        "type",
+        {"circle": circle_validator, "square": rect_validator, "rect": rect_validator},
+    )
+    schema = to_json_schema(validator)
+    validate_schema(schema)
+    assert schema == {
+        "oneOf": [to_json_schema(circle_validator), to_json_schema(rect_validator)],
+        "discriminator": {"propertyName": "type"},
+    }
@@ -21,7 +21,7 @@ from koda_validate import (
 )
 from koda_validate.base import PredicateAsync
 from koda_validate.set import SetValidator
-from tests.utils import BasicNoneValidator
+from tests.utils import BasicNoneValidator, ConcurrencyTracker
 
 
 @dataclass
@@ -179,3 +179,51 @@ async def test_coerce_to_set_async() -> None:
     assert isinstance(
         await validator.validate_async({"set", "no", "longer", "accepted"}), Invalid
     )
+
+
+@pytest.mark.asyncio
+async def test_set_max_concurrency() -> None:
+    tracker = ConcurrencyTracker()
+    not_blank = tracker.predicate(lambda val: val != "")
+    item_validator = StringValidator(predicates_async=[not_blank])
+
+    validator = SetValidator(item_validator, max_concurrency=2)
+    assert validator == SetValidator(item_validator, max_concurrency=2)
+    assert validator != SetValidator(item_validator)
+    assert repr(validator) == f"SetValidator({repr(item_validator)}, max_concurrency=2)"
+
+    data = {"a", "b", "c", "d"}
+    assert await validator.validate_async(data) == Valid(data)
+    assert tracker.max_running == 2
+
+    assert await validator.validate_async({"a", ""}) == Invalid(
+        SetErrs([Invalid(PredicateErrs([not_blank]), "", item_validator)]),
+        {"a", ""},
+        validator,
+    )
+
+    # no async work
+    assert await SetValidator(IntValidator(), max_concurrency=2).validate_async(
+        {1, 2}
+    ) == Valid({1, 2})
+
+
+@pytest.mark.asyncio
+async def test_set_max_errors() -> None:
+    validator = SetValidator(IntValidator(), max_errors=1)
+    for result in [
+        validator({1, "a", "b"}),
+        await validator.validate_async({1, "a", "b"}),
+    ]:
+        assert isinstance(result, Invalid)
+        assert isinstance(result.err_type, SetErrs)
+        assert len(result.err_type.item_errs) == 1
+        assert result.err_type.truncated
+
+    assert validator({1, 2}) == Valid({1, 2})
+    assert validator == SetValidator(IntValidator(), max_errors=1)
+    assert validator != SetValidator(IntValidator(), max_errors=2)
+    assert repr(validator) == "SetValidator(IntValidator(), max_errors=1)"
+
+    with pytest.raises(ValueError):
+        SetValidator(IntValidator(), max_errors=-1)
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from typing import Any, List, NamedTuple, Tuple, TypedDict
+
+import pytest
+from koda import nothing
+
+from koda_validate import (
+    DataclassValidator,
+    DecimalValidator,
+    DictValidatorAny,
+    DiscriminatedUnionValidator,
+    EqualsValidator,
+    IntValidator,
+    Invalid,
+    IsDictValidator,
+    KeyErrs,
+    ListValidator,
+    MapValidator,
+    NamedTupleValidator,
+    NoneValidator,
+    NTupleValidator,
+    PredicateErrs,
+    RecordValidator,
+    SetValidator,
+    StringValidator,
+    TypedDictValidator,
+    UniformTupleValidator,
+    Validator,
+    coercer,
+    compile_validator,
+)
+from koda_validate.maybe import MaybeValidator
+
+
+@dataclass
+class Person:
+    name: str
+
+
+class PersonDict(TypedDict):
+    name: str
+
+
+class PersonTuple(NamedTuple):
+    name: str
+
+
+@coercer(str)
+def never(val: Any) -> Any:
+    return nothing
+
+
+CASES: List[Tuple[Validator[Any], Any]] = [
+    (IntValidator(), "1"),
+    (DecimalValidator(), None),
+    (StringValidator(coerce=never), "a"),
+    (NoneValidator(), 1),
+    (NoneValidator(coerce=never), 1),
+    (EqualsValidator(1), "1"),
+    (MaybeValidator(IntValidator()), 1),
+    (IsDictValidator(), 1),
+    (ListValidator(IntValidator()), 1),
+    (ListValidator(IntValidator(), coerce=never), 1),
+    (SetValidator(IntValidator()), 1),
+    (SetValidator(IntValidator(), coerce=never), 1),
+    (UniformTupleValidator(IntValidator()), 1),
+    (NTupleValidator.untyped(fields=(IntValidator(),)), 1),
+    (MapValidator(key=StringValidator(), value=IntValidator()), 1),
+    (MapValidator(key=StringValidator(), value=IntValidator(), coerce=never), 1),
+    (RecordValidator(into=Person, keys=(("name", StringValidator()),)), 1),
+    (DictValidatorAny({"name": StringValidator()}), 1),
+    (DataclassValidator(Person), 1),
+    (DataclassValidator(Person, coerce=never), 1),
+    (compile_validator(DataclassValidator(Person)), 1),
+    (compile_validator(DataclassValidator(Person, coerce=never)), 1),
+    (NamedTupleValidator(PersonTuple), 1),
+    (NamedTupleValidator(PersonTuple, coerce=never), 1),
+    (TypedDictValidator(PersonDict), 1),
+    (TypedDictValidator(PersonDict, coerce=never), 1),
+    (compile_validator(TypedDictValidator(PersonDict)), 1),
+    (compile_validator(DictValidatorAny({"name": StringValidator()})), 1),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("validator,val", CASES)
+async def test_errors_not_depending_on_value_are_shared(
+    validator: Validator[Any], val: Any
+) -> None:
+    results = [validator(val), validator(val), await validator.validate_async(val)]
+    err_types = []
+    for result in results:
+        assert isinstance(result, Invalid)
+        err_types.append(result.err_type)
+    assert err_types[0] is err_types[1] is err_types[2]
+
+
+@pytest.mark.parametrize(
+    "validator,val",
+    [
+        (EqualsValidator(1), 2),
+        (NTupleValidator.untyped(fields=(IntValidator(),)), (1, 2)),
+        (DiscriminatedUnionValidator("type", {"a": IsDictValidator()}), {"type": "b"}),
+    ],
+)
+def test_predicate_errs_are_not_shared(validator: Validator[Any], val: Any) -> None:
+    # `PredicateErrs` holds a (mutable) list, so changing one result mustn't change
+    # the others
+    def predicate_errs(result: Any) -> PredicateErrs[Any]:
+        assert isinstance(result, Invalid)
+        if isinstance(result.err_type, KeyErrs):
+            return predicate_errs(result.err_type.keys["type"])
+        assert isinstance(result.err_type, PredicateErrs)
+        return result.err_type
+
+    first = predicate_errs(validator(val))
+    predicates = list(first.predicates)
+    first.predicates.clear()
+    assert predicate_errs(validator(val)).predicates == predicates
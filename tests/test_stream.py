@@ -0,0 +1,204 @@
+import asyncio
+import json
+from io import BytesIO, StringIO
+from typing import Any, List, Tuple
+
+import pytest
+
+from koda_validate import (
+    AlwaysValid,
+    IntValidator,
+    Invalid,
+    ListValidator,
+    MaxItems,
+    Min,
+    PredicateAsync,
+    PredicateErrs,
+    StringValidator,
+    TypeErr,
+    UniformTupleValidator,
+    Valid,
+    ValidationResult,
+    validate_json_stream,
+    validate_json_stream_async,
+)
+
+DATA: List[Any] = [
+    1,
+    -2.5e10,
+    'a string, with "quotes" and ] brackets',
+    "ünïcødé ✓",
+    {"a": [1, 2, {"b": None}], "c": True},
+    [],
+    {},
+    False,
+    None,
+    12345678901234567890,
+]
+
+
+def collect(
+    validator: Any, stream: Any, **kwargs: Any
+) -> List[Tuple[int, ValidationResult[Any]]]:
+    return list(validate_json_stream(validator, stream, **kwargs))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 65536])
+def test_json_array(chunk_size: int) -> None:
+    validator: ListValidator[Any] = ListValidator(AlwaysValid())
+    for encoded in [json.dumps(DATA), json.dumps(DATA, indent=2)]:
+        assert collect(validator, BytesIO(encoded.encode()), chunk_size=chunk_size) == [
+            (i, Valid(val)) for i, val in enumerate(DATA)
+        ]
+        assert collect(validator, StringIO(encoded), chunk_size=chunk_size) == [
+            (i, Valid(val)) for i, val in enumerate(DATA)
+        ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 65536])
+def test_json_array_validation(chunk_size: int) -> None:
+    item_validator = IntValidator(Min(0))
+    for validator in [
+        ListValidator(item_validator),
+        UniformTupleValidator(item_validator),
+    ]:
+        assert collect(
+            validator, BytesIO(b' [ 10 , 2000,"3", -4]  \n'), chunk_size=chunk_size
+        ) == [
+            (0, Valid(10)),
+            (1, Valid(2000)),
+            (2, Invalid(TypeErr(int), "3", item_validator)),
+            (3, Invalid(PredicateErrs([Min(0)]), -4, item_validator)),
+        ]
+
+
+def test_json_array_numbers_across_chunks() -> None:
+    # numbers are cut off after a ".", "e", "+" or "-" at some chunk size
+    numbers = [3.14159, 1e5, 2.5e-3, -0.5e2, 6e23, 10, -7]
+    encoded = b"[3.14159, 1e5, 2.5E-3, -0.5e+2, 6E+23, 10, -7]"
+    validator: ListValidator[Any] = ListValidator(AlwaysValid())
+    for chunk_size in range(1, len(encoded) + 1):
+        assert collect(validator, BytesIO(encoded), chunk_size=chunk_size) == [
+            (i, Valid(val)) for i, val in enumerate(numbers)
+        ], chunk_size
+
+    # "3." at the end of the first (default-sized) chunk
+    encoded = b"[" + b" " * (65536 - 3) + b"3.25]"
+    assert collect(validator, BytesIO(encoded)) == [(0, Valid(3.25))]
+
+
+def test_json_array_empty_and_bom() -> None:
+    validator: ListValidator[Any] = ListValidator(AlwaysValid())
+    assert collect(validator, BytesIO(b"[]")) == []
+    assert collect(validator, BytesIO(b" [ \n ] ")) == []
+    assert collect(validator, BytesIO(b"\xef\xbb\xbf[1]"), chunk_size=1) == [
+        (0, Valid(1))
+    ]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"{}",
+        b"[1, 2",
+        b"[1 2]",
+        b"[1,]",
+        b"[1] 2",
+        b"[tru]",
+        b'["abc]',
+        b"[2.]",
+        b"[1e]",
+    ],
+)
+def test_json_array_invalid_json(data: bytes) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        collect(ListValidator(AlwaysValid()), BytesIO(data), chunk_size=2)
+
+
+class Stream(BytesIO):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.max_read = 0
+
+    def read(self, size: Any = -1) -> bytes:
+        self.max_read = max(self.max_read, self.tell())
+        return super().read(size)
+
+
+def test_json_array_is_read_incrementally() -> None:
+    stream = Stream(json.dumps(list(range(10_000))).encode())
+    results = validate_json_stream(ListValidator(IntValidator()), stream, chunk_size=64)
+    assert next(results) == (0, Valid(0))
+    assert stream.max_read <= 128
+    assert len(list(results)) == 9_999
+
+
+def test_json_array_invalid_json_is_not_read_to_the_end() -> None:
+    for data in [b"[1, @, ", b'[1, {"a": [2, @]}, ', b"[1, tru, ", b'[1, "\\x", ']:
+        stream = Stream(data + b"1, " * 100_000 + b"1]")
+        with pytest.raises(json.JSONDecodeError):
+            collect(ListValidator(AlwaysValid()), stream, chunk_size=64)
+        assert stream.max_read <= 128, data
+
+
+def test_json_array_literals_and_escapes_across_chunks() -> None:
+    values = [True, False, None, float("-inf"), float("inf"), "\u00e9\U0001d11e", 'a"\\']
+    encoded = json.dumps(values, ensure_ascii=True).encode()
+    validator: ListValidator[Any] = ListValidator(AlwaysValid())
+    for chunk_size in range(1, len(encoded) + 1):
+        assert collect(validator, BytesIO(encoded), chunk_size=chunk_size) == [
+            (i, Valid(val)) for i, val in enumerate(values)
+        ], chunk_size
+
+
+def test_ndjson() -> None:
+    item_validator = IntValidator()
+    validator = ListValidator(item_validator)
+    data = b'1\n\n"2"\n  \n3\n'
+    assert collect(validator, BytesIO(data), ndjson=True) == [
+        (0, Valid(1)),
+        (1, Invalid(TypeErr(int), "2", item_validator)),
+        (2, Valid(3)),
+    ]
+    assert collect(validator, StringIO(data.decode()), ndjson=True) == [
+        (0, Valid(1)),
+        (1, Invalid(TypeErr(int), "2", item_validator)),
+        (2, Valid(3)),
+    ]
+    with pytest.raises(json.JSONDecodeError):
+        collect(validator, BytesIO(b"1\n[2\n"), ndjson=True)
+
+
+def test_unsupported_validators() -> None:
+    with pytest.raises(TypeError):
+        validate_json_stream(IntValidator(), BytesIO(b"[]"))  # type: ignore
+
+    with pytest.raises(ValueError):
+        validate_json_stream(
+            ListValidator(IntValidator(), predicates=[MaxItems(5)]), BytesIO(b"[]")
+        )
+
+
+@pytest.mark.asyncio
+async def test_validate_json_stream_async() -> None:
+    class IsShort(PredicateAsync[str]):
+        async def validate_async(self, val: str) -> bool:
+            await asyncio.sleep(0.001)
+            return len(val) < 3
+
+    is_short = IsShort()
+    item_validator = StringValidator(predicates_async=[is_short])
+    validator = ListValidator(item_validator)
+    assert [
+        result
+        async for result in validate_json_stream_async(
+            validator, BytesIO(b'["a", "abcd"]')
+        )
+    ] == [
+        (0, Valid("a")),
+        (
+            1,
+            Invalid(PredicateErrs([is_short]), "abcd", item_validator),
+        ),
+    ]
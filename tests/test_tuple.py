@@ -373,3 +373,26 @@ def test_tuple_h_tuple_homogenous_equivalence() -> None:
         predicates_async=[SomeAsyncTupleHCheck()],
     )
     assert l_pred_async_1 == l_pred_async_2
+
+
+@pytest.mark.asyncio
+async def test_uniform_tuple_max_errors() -> None:
+    item_validator = IntValidator()
+    validator = UniformTupleValidator(item_validator, max_errors=1)
+    expected = Invalid(
+        IndexErrs({0: Invalid(TypeErr(int), "a", item_validator)}, truncated=True),
+        ("a", "b"),
+        validator,
+    )
+    assert validator(["a", "b"]) == expected
+    assert await validator.validate_async(["a", "b"]) == expected
+    assert validator([1, 2]) == Valid((1, 2))
+
+    assert validator == UniformTupleValidator(item_validator, max_errors=1)
+    assert validator != UniformTupleValidator(item_validator)
+    assert repr(validator) == (
+        "UniformTupleValidator(IntValidator(), "
+        f"coerce={repr(validator.coerce)}, max_errors=1)"
+    )
+    with pytest.raises(ValueError):
+        UniformTupleValidator(item_validator, max_errors=0)
@@ -1,20 +1,24 @@
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Literal, NamedTuple, Tuple, TypeVar, Union, Dict, List
+from typing import Literal, NamedTuple, Tuple, TypedDict, TypeVar, Union, Dict, List
 
 from koda_validate import (
     AlwaysValid,
     BoolValidator,
     BytesValidator,
     Choices,
+    DataclassValidator,
     DatetimeValidator,
     DateValidator,
+    DiscriminatedUnionValidator,
     EqualsValidator,
     EqualTo,
     IntValidator,
     Invalid,
     PredicateErrs,
     StringValidator,
+    TypedDictValidator,
     TypeErr,
     UniformTupleValidator,
     UnionErrs,
@@ -152,3 +156,48 @@ def test_get_typehint_validator_type_aliases() -> None:
     assert isinstance(user_dict_validator, MapValidator)
     assert isinstance(user_dict_validator.key_validator, StringValidator)
     assert isinstance(user_dict_validator.value_validator, UnionValidator)
+
+
+def test_get_typehint_validator_discriminated_union() -> None:
+    @dataclass
+    class Circle:
+        type: Literal["circle"]
+        radius: float
+
+    @dataclass
+    class Rect:
+        type: Literal["rect", "square"]
+        width: float
+        height: float
+
+    class Line(TypedDict):
+        type: Literal["line"]
+        length: float
+
+    validator = get_typehint_validator(Union[Circle, Rect, Line])
+    assert validator == DiscriminatedUnionValidator(
+        "type",
+        {
+            "circle": DataclassValidator(Circle),
+            "rect": DataclassValidator(Rect),
+            "square": DataclassValidator(Rect),
+            "line": TypedDictValidator(Line),
+        },
+    )
+    line = {"type": "line", "length": 1.0}
+    assert validator(line) == Valid(line)
+    assert validator(Circle("circle", 1.0)) == Valid(Circle("circle", 1.0))
+
+    @dataclass
+    class OtherCircle:
+        type: Literal["circle"]
+        diameter: float
+
+    @dataclass
+    class DefaultCircle:
+        radius: float
+        type: Literal["circle"] = "circle"
+
+    # tags aren't unique, or aren't required
+    for annotation in [Union[Circle, OtherCircle], Union[DefaultCircle, Rect]]:
+        assert isinstance(get_typehint_validator(annotation), UnionValidator)
@@ -1,11 +1,22 @@
-from typing import Any
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Literal
 
 import pytest
 
 from koda_validate import (
+    Choices,
+    DataclassValidator,
+    DecimalValidator,
+    EqualsValidator,
     FloatValidator,
     IntValidator,
     Invalid,
+    KeyErrs,
+    MinLength,
+    NoneValidator,
+    OptionalValidator,
+    PredicateErrs,
     StringValidator,
     TypeErr,
     UnionErrs,
@@ -13,7 +24,8 @@ from koda_validate import (
     ValidationResult,
 )
 from koda_validate.base import Validator
-from koda_validate.union import UnionValidator
+from koda_validate.errors import missing_key_err
+from koda_validate.union import DiscriminatedUnionValidator, UnionValidator
 
 
 def test_union_validator_typed() -> None:
@@ -115,3 +127,168 @@ def test_union_eq() -> None:
     assert UnionValidator(StringValidator(), IntValidator()) == UnionValidator(
         StringValidator(), IntValidator()
     )
+
+
+@dataclass
+class Circle:
+    type: Literal["circle"]
+    radius: float
+
+
+@dataclass
+class Square:
+    type: Literal["square"]
+    side: float
+
+
+class CountingValidator(Validator[Any]):
+    def __init__(self, validator: Validator[Any]) -> None:
+        self.validator = validator
+        self.calls = 0
+
+    def __call__(self, val: Any) -> ValidationResult[Any]:
+        self.calls += 1
+        return self.validator(val)
+
+    async def validate_async(self, val: Any) -> ValidationResult[Any]:
+        self.calls += 1
+        return await self.validator.validate_async(val)
+
+
+@pytest.mark.asyncio
+async def test_discriminated_union_dispatches_on_tag() -> None:
+    circle_validator = CountingValidator(DataclassValidator(Circle))
+    square_validator = CountingValidator(DataclassValidator(Square))
+    validator = DiscriminatedUnionValidator(
+        "type", {"circle": circle_validator, "square": square_validator}
+    )
+
+    square = {"type": "square", "side": 2.0}
+    assert validator(square) == Valid(Square("square", 2.0))
+    assert await validator.validate_async(square) == Valid(Square("square", 2.0))
+    assert square_validator.calls == 2
+    assert circle_validator.calls == 0
+
+    assert validator.is_valid({"type": "circle", "radius": 1.0})
+    assert not validator.is_valid({"type": "circle", "side": 1.0})
+    assert not validator.is_valid({"type": "triangle"})
+
+    # errors come from the variant for the tag
+    assert validator({"type": "circle", "radius": "1"}) == DataclassValidator(Circle)(
+        {"type": "circle", "radius": "1"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_discriminated_union_tag_errs() -> None:
+    validator = DiscriminatedUnionValidator(
+        "type",
+        {"circle": DataclassValidator(Circle), "square": DataclassValidator(Square)},
+    )
+    tag_choices_err = PredicateErrs([Choices({"circle", "square"})])
+
+    # the tag is read from instances of the dataclasses
+    assert validator(Circle("circle", 1.0)) == Valid(Circle("circle", 1.0))
+
+    for not_dict, missing, unknown in [
+        [validator(v) for v in [None, {"radius": 1.0}, {"type": "x"}]],
+        [
+            await validator.validate_async(v)
+            for v in [None, {"radius": 1.0}, {"type": "x"}]
+        ],
+    ]:
+        assert not_dict == Invalid(TypeErr(dict), None, validator)
+        assert missing == Invalid(
+            KeyErrs({"type": Invalid(missing_key_err, {"radius": 1.0}, validator)}),
+            {"radius": 1.0},
+            validator,
+        )
+        assert unknown == Invalid(
+            KeyErrs({"type": Invalid(tag_choices_err, "x", validator)}),
+            {"type": "x"},
+            validator,
+        )
+
+    assert validator({"type": ["circle"]}) == Invalid(
+        KeyErrs({"type": Invalid(tag_choices_err, ["circle"], validator)}),
+        {"type": ["circle"]},
+        validator,
+    )
+    assert not validator.is_valid(None)
+
+
+def test_discriminated_union_repr_eq() -> None:
+    validator = DiscriminatedUnionValidator("type", {"a": IntValidator()})
+    assert repr(validator) == "DiscriminatedUnionValidator('type', {'a': IntValidator()})"
+    assert validator == DiscriminatedUnionValidator("type", {"a": IntValidator()})
+    assert validator != DiscriminatedUnionValidator("kind", {"a": IntValidator()})
+    assert validator != DiscriminatedUnionValidator("type", {"b": IntValidator()})
+
+    with pytest.raises(ValueError):
+        DiscriminatedUnionValidator("type", {})
+
+
+@pytest.mark.asyncio
+async def test_union_type_dispatch() -> None:
+    class AnyIntValidator(Validator[int]):
+        def __call__(self, val: Any) -> ValidationResult[int]:
+            if isinstance(val, int):
+                return Valid(val)
+            else:
+                return Invalid(TypeErr(int), val, self)
+
+        async def validate_async(self, val: Any) -> ValidationResult[int]:
+            return self(val)
+
+    validator = UnionValidator.untyped(
+        StringValidator(MinLength(2)),
+        IntValidator(),
+        EqualsValidator(True),
+        NoneValidator(),
+        AnyIntValidator(),
+        DecimalValidator(),
+        StringValidator(),
+    )
+    assert validator._type_dispatch is not None
+    assert validator._type_dispatch.table == {
+        str: (0, 4, 5, 6),
+        int: (1, 4, 5),
+        bool: (2, 4, 5),
+        type(None): (3, 4, 5),
+    }
+    assert validator._type_dispatch.default == (4, 5)
+
+    # results, and errors, are the same as when each variant is tried in turn
+    linear_validator = UnionValidator.untyped(*validator.validators)
+    linear_validator._type_dispatch = None
+    for val in ["a", "ab", 1, True, False, None, Decimal("1.5"), 1.5, [1]]:
+        assert validator(val) == linear_validator(val)
+        expected = await linear_validator.validate_async(val)
+        assert await validator.validate_async(val) == expected
+        assert validator.is_valid(val) == linear_validator.is_valid(val)
+
+    assert validator(1.5) == Invalid(
+        UnionErrs([v(1.5) for v in validator.validators]),  # type: ignore
+        1.5,
+        validator,
+    )
+
+    # variants accepting any type are tried for every value
+    assert UnionValidator(AnyIntValidator(), IntValidator())._type_dispatch is not None
+    assert UnionValidator(DecimalValidator(), AnyIntValidator())._type_dispatch is None
+
+
+def test_optional_type_dispatch() -> None:
+    validator = OptionalValidator(IntValidator())
+    assert validator._type_dispatch is not None
+    assert validator._type_dispatch.table == {type(None): (0,), int: (1,)}
+    assert validator("a") == Invalid(
+        UnionErrs(
+            [
+                Invalid(TypeErr(type(None)), "a", validator.none_validator),
+                Invalid(TypeErr(int), "a", validator.non_none_validator),
+            ]
+        ),
+        "a",
+        validator,
+    )
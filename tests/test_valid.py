@@ -1,6 +1,18 @@
 from copy import copy
+from typing import Any
 
-from koda_validate import Invalid, StringValidator, TypeErr, Valid
+from koda_validate import (
+    BatchResult,
+    IntValidator,
+    Invalid,
+    ListValidator,
+    Max,
+    StringValidator,
+    TypeErr,
+    Valid,
+    ValidationResult,
+    Validator,
+)
 
 
 def test_valid_map() -> None:
@@ -18,3 +30,38 @@ def test_valid_map() -> None:
     assert mapped.value == inv.value
     assert mapped.err_type == inv.err_type
     assert mapped.validator == inv.validator
+
+
+def test_validate_many() -> None:
+    validator = IntValidator(Max(5))
+    vals = [1, "2", 3, 10]
+    result = validator.validate_many(iter(vals))
+    assert result == BatchResult(
+        [True, False, True, False],
+        [1, None, 3, None],
+        {1: validator("2"), 3: validator(10)},  # type: ignore
+    )
+    assert not result.all_valid
+    assert len(result) == 4
+    assert [result[i] for i in range(4)] == [validator(v) for v in vals]
+
+    assert ListValidator(StringValidator()).validate_many([["a"], []]) == BatchResult(
+        [True, True], [["a"], []], {}
+    )
+    assert validator.validate_many([]).all_valid
+
+
+def test_validate_many_custom_validator() -> None:
+    class IsFive(Validator[int]):
+        def __call__(self, val: Any) -> ValidationResult[int]:
+            if val == 5:
+                return Valid(5)
+            else:
+                return Invalid(TypeErr(int), val, self)
+
+    validator = IsFive()
+    result = validator.validate_many((5, 4))
+    invalid = validator(4)
+    assert isinstance(invalid, Invalid)
+    assert result == BatchResult([True, False], [5, None], {1: invalid})
+    assert result[0] == Valid(5)
@@ -0,0 +1,161 @@
+import math
+from typing import Any, List, Union
+
+import pytest
+
+from koda_validate import (
+    Choices,
+    EqualTo,
+    FloatValidator,
+    IndexErrs,
+    IntValidator,
+    Invalid,
+    ListValidator,
+    Max,
+    Min,
+    MultipleOf,
+    PredicateErrs,
+    UniformTupleValidator,
+    Valid,
+    Validator,
+)
+from koda_validate._vectorized import VECTORIZE_MIN_LEN, _vectorized_items
+
+np = pytest.importorskip("numpy")
+
+
+def expected_list_result(
+    list_validator: ListValidator[Any], item_validator: Validator[Any], vals: List[Any]
+) -> Any:
+    index_errs = {}
+    for i, val in enumerate(vals):
+        if not (result := item_validator(val)).is_valid:
+            index_errs[i] = result
+    if index_errs:
+        return Invalid(IndexErrs(index_errs), vals, list_validator)
+    else:
+        return Valid(vals)
+
+
+@pytest.mark.parametrize(
+    "item_validator,vals",
+    [
+        (
+            IntValidator(Min(0), Max(10, exclusive_maximum=True)),
+            [i % 12 - 1 for i in range(200)],
+        ),
+        (
+            IntValidator(MultipleOf(-3), Min(-5, exclusive_minimum=True)),
+            list(range(-100, 100)),
+        ),
+        (IntValidator(EqualTo(4)), [4] * 100 + [5]),
+        (IntValidator(Choices({1, 2, 3})), [i % 5 for i in range(100)]),
+        (IntValidator(), list(range(100))),
+        (
+            FloatValidator(Min(0), Max(1.0)),
+            [i / 50 - 0.5 for i in range(100)] + [math.nan, math.inf, -math.inf, -0.0],
+        ),
+        (FloatValidator(MultipleOf(0.5)), [i / 4 for i in range(-100, 100)] + [math.inf]),
+        (FloatValidator(EqualTo(1.5), Choices({1.5, 2})), [1.5, 2.0] * 50),
+    ],
+)
+def test_vectorized_list_matches_item_validation(
+    item_validator: Validator[Any], vals: List[Any]
+) -> None:
+    assert len(vals) >= VECTORIZE_MIN_LEN
+    list_validator = ListValidator(item_validator)
+    assert list_validator._vectorized_items is not None
+
+    result = list_validator(vals)
+    assert result == expected_list_result(list_validator, item_validator, vals)
+    if result.is_valid:
+        # the item validators don't transform values, so the list is returned as-is
+        assert result.val is vals
+
+    tuple_validator = UniformTupleValidator(item_validator)
+    tuple_result = tuple_validator(tuple(vals))
+    if result.is_valid:
+        assert tuple_result == Valid(tuple(vals))
+    else:
+        assert isinstance(tuple_result, Invalid)
+        assert tuple_result.err_type == result.err_type
+
+
+@pytest.mark.asyncio
+async def test_vectorized_async() -> None:
+    item_validator = IntValidator(Min(0))
+    list_validator = ListValidator(item_validator)
+    vals = list(range(-1, 100))
+    assert await list_validator.validate_async(vals) == expected_list_result(
+        list_validator, item_validator, vals
+    )
+    assert await UniformTupleValidator(item_validator).validate_async(vals[1:]) == Valid(
+        tuple(vals[1:])
+    )
+
+
+@pytest.mark.parametrize(
+    "vals",
+    [
+        # mixed types
+        [1] * 100 + [1.0, True, "1"],
+        # bools are not ints
+        [True] * 100,
+        # too large for int64
+        [1] * 100 + [2**64],
+    ],
+)
+def test_falls_back_for_non_homogeneous_or_overflowing_items(vals: List[Any]) -> None:
+    item_validator = IntValidator(Min(0))
+    list_validator = ListValidator(item_validator)
+    assert list_validator._vectorized_items is not None
+    assert list_validator._vectorized_items.validate(vals) is None
+    assert list_validator(vals) == expected_list_result(
+        list_validator, item_validator, vals
+    )
+
+
+def test_not_vectorized() -> None:
+    class SubclassedIntValidator(IntValidator):
+        pass
+
+    item_validators: List[Validator[Any]] = [
+        SubclassedIntValidator(),
+        IntValidator(Min(0), preprocessors=[lambda x: x]),  # type: ignore[list-item]
+        IntValidator(Min(0.5)),  # type: ignore[arg-type]
+        IntValidator(Min(2**64)),
+        FloatValidator(Max(2**60)),
+        FloatValidator(Max(math.nan)),
+        FloatValidator(Choices({1.0, math.nan})),
+        IntValidator(MultipleOf(0)),
+    ]
+    for item_validator in item_validators:
+        assert _vectorized_items(item_validator) is None, item_validator
+
+    with pytest.raises(ZeroDivisionError):
+        ListValidator(IntValidator(MultipleOf(0)))([1] * 100)
+
+
+@pytest.mark.parametrize("max_errors", [1, 3, 10])
+@pytest.mark.parametrize("num_invalid", [3, 10])
+def test_max_errors(max_errors: int, num_invalid: int) -> None:
+    item_validator = IntValidator(Min(0))
+    num_valid = VECTORIZE_MIN_LEN - num_invalid
+    vals = [1] * num_valid + [-1] * num_invalid
+    # the same as validating item by item
+    expected = IndexErrs(
+        {
+            i: Invalid(PredicateErrs([Min(0)]), -1, item_validator)
+            for i in range(num_valid, num_valid + min(max_errors, num_invalid))
+        },
+        truncated=num_invalid > max_errors,
+    )
+    validators: List[Union[ListValidator[int], UniformTupleValidator[int]]] = [
+        ListValidator(item_validator, max_errors=max_errors),
+        UniformTupleValidator(item_validator, max_errors=max_errors),
+    ]
+    for validator in validators:
+        assert validator._vectorized_items is not None
+        result = validator(vals)
+        assert isinstance(result, Invalid)
+        assert result.err_type == expected
@@ -1,6 +1,14 @@
-from typing import Any
+import asyncio
+from typing import Any, Callable
 
-from koda_validate import Invalid, TypeErr, Valid, ValidationResult, Validator
+from koda_validate import (
+    Invalid,
+    PredicateAsync,
+    TypeErr,
+    Valid,
+    ValidationResult,
+    Validator,
+)
 
 
 class BasicNoneValidator(Validator[None]):
@@ -17,3 +25,28 @@ class BasicNoneValidator(Validator[None]):
             return Valid(None)
         else:
             return Invalid(TypeErr(type(None)), val, self)
+
+
+class ConcurrencyTracker:
+    """
+    Tracks how many of the predicates made by ``predicate`` run at the same time
+    """
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+
+    def predicate(self, valid: Callable[[Any], bool]) -> PredicateAsync[Any]:
+        tracker = self
+
+        class TrackedPredicate(PredicateAsync[Any]):
+            async def validate_async(self, val: Any) -> bool:
+                tracker.running += 1
+                tracker.max_running = max(tracker.running, tracker.max_running)
+                try:
+                    await asyncio.sleep(0.01)
+                    return valid(val)
+                finally:
+                    tracker.running -= 1
+
+        return TrackedPredicate()